@@ -1,16 +1,16 @@
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
-# Definir la función
-def f(x, y):
-    return x**2 + y**2 - 0.12 * np.cos(3*np.pi*x) * np.cos(4*np.pi*y) + 0.3
+# Función objetivo compartida
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from landscape import landscape_grid
 
-# Crear una malla de puntos
-x = np.linspace(-1, 1, 300)
-y = np.linspace(-1, 1, 300)
+# Malla de puntos (desde la caché de landscape)
+x, y, Z = landscape_grid((-1.0, 1.0), 256)
 X, Y = np.meshgrid(x, y)
-Z = f(X, Y)
 
 # Graficar
 fig = plt.figure(figsize=(10, 7))
@@ -0,0 +1,322 @@
+import os
+import json
+import time
+import argparse
+import numpy as np
+from typing import Dict, List, Tuple
+
+from multistart import METHODS
+from stationary_points import default_catalog, KINDS
+
+# Mapa de cuencas de atracción a alta resolución: a qué mínimo llega cada punto
+# inicial de una malla res × res sobre bounds². La malla se resuelve por bloques
+# (tiles) con los motores vectorizados y cada bloque se escribe directamente en
+# tres archivos .npy mapeados en memoria:
+# - labels.npy: índice en el catálogo de stationary_points del punto estacionario
+#   alcanzado (-1 si no convergió), las mismas etiquetas que usa multistart
+# - iterations.npy: iteraciones de cada arranque
+# - f_final.npy: valor final de f
+# La fila i corresponde a y, la columna j a x (píxeles centrados en su celda).
+# El progreso se guarda en manifest.json (parámetros, puntos del catálogo y
+# bloques terminados), así que una ejecución interrumpida se reanuda bloque a
+# bloque. La memoria máxima depende del tamaño del bloque, no de la resolución.
+#
+# Modo adaptativo (adaptive_basin_map): en lugar de resolver todos los píxeles se
+# resuelve una malla gruesa y sólo se subdividen, recursivamente, las celdas cuyas
+# cuatro esquinas no llegan al mismo mínimo, hasta la resolución final. El
+# resultado es un quadtree de hojas (celdas uniformes o píxeles de frontera) que
+# rasterize_quadtree convierte en imagen de etiquetas. Una cuenca entera que cabe
+# dentro de una celda gruesa sin tocar sus esquinas no se detecta; la malla
+# gruesa debe ser más fina que la cuenca más pequeña que interese.
+
+IMAGES = {
+    'labels': np.int32,
+    'iterations': np.int32,
+    'f_final': np.float64
+}
+
+MANIFEST = 'manifest.json'
+
+def pixel_centers(bounds: Tuple[float, float], resolution: int) -> np.ndarray:
+    #Coordenadas de los centros de los píxeles a lo largo de un eje
+    low, high = bounds
+    cell = (high - low) / resolution
+    return low + (np.arange(resolution) + 0.5) * cell
+
+def tile_slices(resolution: int, tile: int) -> List[Tuple[slice, slice]]:
+    #Bloques (filas, columnas) que cubren la imagen, en orden de filas
+    edges = range(0, resolution, tile)
+    return [(slice(i, min(i + tile, resolution)), slice(j, min(j + tile, resolution)))
+            for i in edges for j in edges]
+
+def _read_manifest(output_dir: str) -> Dict:
+    path = os.path.join(output_dir, MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path) as source:
+        return json.load(source)
+
+def _write_manifest(output_dir: str, manifest: Dict):
+    #Escritura atómica: un corte a mitad de escritura no corrompe el manifiesto
+    path = os.path.join(output_dir, MANIFEST)
+    with open(path + '.tmp', 'w') as out:
+        json.dump(manifest, out, indent=2)
+    os.replace(path + '.tmp', path)
+
+def _open_images(output_dir: str, resolution: int, mode: str) -> Dict[str, np.memmap]:
+    shape = (resolution, resolution)
+    return {name: np.lib.format.open_memmap(os.path.join(output_dir, name + '.npy'), mode=mode,
+                                            dtype=dtype, shape=shape if mode == 'w+' else None)
+            for name, dtype in IMAGES.items()}
+
+def basin_map(output_dir: str, method: str = 'gradient_descent', bounds: Tuple[float, float] = (-3.0, 3.0),
+              resolution: int = 1024, tile: int = 256, params: Dict = None, tol: float = 1e-3,
+              verbose: bool = False) -> Dict:
+    #Calcula (o reanuda) el mapa de cuencas de `method` en output_dir
+    #Si ya hay un manifiesto con los mismos parámetros sólo se resuelven los
+    #bloques que faltan; si los parámetros difieren se lanza un error en lugar
+    #de mezclar mapas distintos; lo mismo si el catálogo de puntos
+    #estacionarios cambió desde que se empezó el mapa
+    if method not in METHODS:
+        raise ValueError(f"Método desconocido: {method!r}")
+    params = params or {}
+    config = {
+        'method': method,
+        'bounds': [float(bounds[0]), float(bounds[1])],
+        'resolution': int(resolution),
+        'tile': int(tile),
+        'params': params,
+        'tol': tol
+    }
+    catalog = default_catalog()
+
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = _read_manifest(output_dir)
+    if manifest is None:
+        manifest = dict(config, minima=catalog.points.tolist(), kinds=catalog.kinds.tolist(), done=[])
+        images = _open_images(output_dir, resolution, 'w+')
+        _write_manifest(output_dir, manifest)
+    else:
+        stored = {key: manifest[key] for key in config}
+        if stored != config:
+            raise ValueError(f"'{output_dir}' contiene un mapa con otros parámetros: {stored}")
+        if np.shape(manifest['minima']) != catalog.points.shape or \
+                not np.allclose(manifest['minima'], catalog.points):
+            raise ValueError(f"'{output_dir}' se etiquetó con otro catálogo de puntos estacionarios")
+        images = _open_images(output_dir, resolution, 'r+')
+
+    done = set(manifest['done'])
+    axis = pixel_centers(bounds, resolution)
+    tiles = tile_slices(resolution, tile)
+
+    for k, (rows, cols) in enumerate(tiles):
+        if k in done:
+            continue
+        start = time.perf_counter()
+        X0, Y0 = np.meshgrid(axis[cols], axis[rows])
+        x, y, f_final, iterations, converged = METHODS[method](X0, Y0, **params)
+
+        images['labels'][rows, cols] = catalog.label(x, y, converged, tol)
+        images['iterations'][rows, cols] = iterations
+        images['f_final'][rows, cols] = f_final
+        for image in images.values():
+            image.flush()
+
+        # El bloque sólo cuenta como terminado cuando sus datos ya están en disco
+        done.add(k)
+        manifest['done'] = sorted(done)
+        _write_manifest(output_dir, manifest)
+        if verbose:
+            print(f"Bloque {k + 1}/{len(tiles)}: {X0.size} arranques en {time.perf_counter() - start:.2f} s")
+
+    return load_basin_map(output_dir)
+
+def load_basin_map(output_dir: str) -> Dict:
+    #Abre un mapa ya calculado (sólo lectura) junto con sus parámetros
+    manifest = _read_manifest(output_dir)
+    if manifest is None:
+        raise FileNotFoundError(f"No hay un mapa de cuencas en '{output_dir}'")
+    images = {name: np.load(os.path.join(output_dir, name + '.npy'), mmap_mode='r')
+              for name in IMAGES}
+    return dict(images, minima=np.array(manifest['minima']).reshape(-1, 2),
+                kinds=np.array(manifest['kinds'], dtype=int),
+                complete=len(manifest['done']) == len(tile_slices(manifest['resolution'], manifest['tile'])),
+                **{key: manifest[key] for key in ('method', 'bounds', 'resolution', 'params')})
+
+# Hojas del quadtree: origen (fila, columna) en píxeles de la resolución final,
+# lado en píxeles, etiqueta de la cuenca y si las esquinas discrepaban (sólo
+# ocurre en hojas de un píxel, que toman la etiqueta de su primera esquina)
+LEAF_DTYPE = np.dtype([('i', 'i4'), ('j', 'i4'), ('size', 'i4'), ('label', 'i4'), ('mixed', '?')])
+
+def _corner_ids(i: np.ndarray, j: np.ndarray, size: int, stride: int) -> np.ndarray:
+    #Índices planos de los vértices de las esquinas de cada celda, forma (N, 4)
+    return np.stack([i * stride + j, i * stride + j + size,
+                     (i + size) * stride + j, (i + size) * stride + j + size], axis=1)
+
+def adaptive_basin_map(method: str = 'gradient_descent', bounds: Tuple[float, float] = (-3.0, 3.0),
+                       resolution: int = 1024, coarse: int = 64, params: Dict = None,
+                       tol: float = 1e-3, chunk: int = 65536) -> Dict:
+    #Mapa de cuencas adaptativo por quadtree
+    #Los arranques están en los vértices de la malla de la resolución final
+    #(resolution + 1 por eje, bordes de los píxeles); `resolution` debe ser
+    #coarse · 2^k. Cada vértice se resuelve una sola vez y los nuevos vértices de
+    #cada nivel se resuelven juntos, en bloques de `chunk` arranques
+    if method not in METHODS:
+        raise ValueError(f"Método desconocido: {method!r}")
+    size = resolution // coarse
+    if size < 1 or coarse * size != resolution or size & (size - 1):
+        raise ValueError("La resolución debe ser coarse · 2^k")
+    params = params or {}
+    catalog = default_catalog()
+    stride = resolution + 1
+    low, high = bounds
+    cell = (high - low) / resolution
+
+    # Vértices ya resueltos: índices planos ordenados y sus etiquetas
+    known_ids = np.empty(0, dtype=np.int64)
+    known_labels = np.empty(0, dtype=np.int32)
+
+    I, J = np.meshgrid(np.arange(0, resolution, size), np.arange(0, resolution, size), indexing='ij')
+    i, j = I.ravel(), J.ravel()
+    leaves = []
+
+    while i.size:
+        corners = _corner_ids(i, j, size, stride)
+        new_ids = np.setdiff1d(corners, known_ids)
+        if new_ids.size:
+            labels = np.empty(new_ids.size, dtype=np.int32)
+            for start in range(0, new_ids.size, chunk):
+                ids = new_ids[start:start + chunk]
+                X0 = low + (ids % stride) * cell
+                Y0 = low + (ids // stride) * cell
+                x, y, _, _, converged = METHODS[method](X0, Y0, **params)
+                labels[start:start + chunk] = catalog.label(x, y, converged, tol)
+            known_ids = np.concatenate([known_ids, new_ids])
+            known_labels = np.concatenate([known_labels, labels])
+            order = np.argsort(known_ids)
+            known_ids, known_labels = known_ids[order], known_labels[order]
+
+        corner_labels = known_labels[np.searchsorted(known_ids, corners)]
+        uniform = (corner_labels == corner_labels[:, :1]).all(axis=1)
+        leaf = uniform | (size == 1)
+
+        level = np.zeros(leaf.sum(), dtype=LEAF_DTYPE)
+        level['i'], level['j'], level['size'] = i[leaf], j[leaf], size
+        level['label'] = corner_labels[leaf, 0]
+        level['mixed'] = ~uniform[leaf]
+        leaves.append(level)
+
+        # Subdividir en cuatro las celdas cuyas esquinas discrepan
+        i, j = i[~leaf], j[~leaf]
+        size //= 2
+        i = np.concatenate([i, i + size, i, i + size])
+        j = np.concatenate([j, j, j + size, j + size])
+
+    return {
+        'method': method,
+        'bounds': [float(low), float(high)],
+        'resolution': resolution,
+        'params': params,
+        'leaves': np.concatenate(leaves),
+        'minima': catalog.points,
+        'kinds': catalog.kinds,
+        'solves': known_ids.size
+    }
+
+def rasterize_quadtree(tree: Dict, out: np.ndarray = None) -> np.ndarray:
+    #Imagen de etiquetas resolution × resolution a partir de las hojas del quadtree
+    #`out` permite escribir en un arreglo ya creado (p. ej. un .npy mapeado en memoria)
+    resolution = tree['resolution']
+    if out is None:
+        out = np.empty((resolution, resolution), dtype=np.int32)
+    leaves = tree['leaves']
+    for size in np.unique(leaves['size']):
+        level = leaves[leaves['size'] == size]
+        if size == 1:
+            out[level['i'], level['j']] = level['label']
+            continue
+        for i, j, label in zip(level['i'].tolist(), level['j'].tolist(), level['label'].tolist()):
+            out[i:i + size, j:j + size] = label
+    return out
+
+def save_quadtree(tree: Dict, path: str):
+    #Guarda el quadtree en un .npz (los parámetros van como JSON)
+    meta = {key: tree[key] for key in ('method', 'bounds', 'resolution', 'params', 'solves')}
+    np.savez(path, leaves=tree['leaves'], minima=tree['minima'], kinds=tree['kinds'],
+             meta=json.dumps(meta))
+
+def load_quadtree(path: str) -> Dict:
+    with np.load(path) as stored:
+        return dict(json.loads(str(stored['meta'])), leaves=stored['leaves'], minima=stored['minima'],
+                    kinds=stored['kinds'])
+
+def display_quadtree(tree: Dict):
+    #Resumen del mapa adaptativo: resoluciones frente a una malla uniforme
+    leaves = tree['leaves']
+    uniform_solves = (tree['resolution'] + 1) ** 2
+    print("\n" + "="*90)
+    print(f"MAPA DE CUENCAS ADAPTATIVO - {tree['method']} {tree['params']}")
+    print("="*90)
+    print(f"Dominio: [{tree['bounds'][0]}, {tree['bounds'][1]}]², "
+          f"resolución {tree['resolution']}x{tree['resolution']}")
+    print(f"Cuencas distintas: {np.unique(leaves['label'][leaves['label'] >= 0]).size}")
+    print(f"Arranques resueltos: {tree['solves']} de {uniform_solves} "
+          f"({tree['solves'] / uniform_solves * 100:.2f}% de la malla uniforme)")
+    print(f"Hojas: {leaves.size} ({leaves['mixed'].sum()} píxeles de frontera)")
+
+    print("\n| {:<12} | {:<12} |".format("Lado (px)", "Hojas"))
+    print("|" + "-"*14 + "|" + "-"*14 + "|")
+    sizes, counts = np.unique(leaves['size'], return_counts=True)
+    for size, count in zip(sizes[::-1], counts[::-1]):
+        print("| {:<12} | {:<12} |".format(size, count))
+
+def display_basin_map(basins: Dict, top: int = 10, chunk: int = 1024):
+    #Muestra la fracción de la malla que ocupa cada cuenca
+    #Las etiquetas se cuentan por franjas de filas para no cargar la imagen entera
+    labels = basins['labels']
+    minima = basins['minima']
+    counts = np.zeros(len(minima) + 1, dtype=np.int64)
+    for i in range(0, labels.shape[0], chunk):
+        counts += np.bincount(labels[i:i + chunk].ravel() + 1, minlength=counts.size)
+    total = labels.size
+
+    print("\n" + "="*90)
+    print(f"MAPA DE CUENCAS - {basins['method']} {basins['params']}")
+    print("="*90)
+    print(f"Dominio: [{basins['bounds'][0]}, {basins['bounds'][1]}]², "
+          f"resolución {basins['resolution']}x{basins['resolution']}"
+          + ("" if basins['complete'] else " (incompleto)"))
+    print(f"Cuencas distintas: {np.count_nonzero(counts[1:])}")
+    print(f"No convergió: {counts[0] / total * 100:.2f}%")
+
+    print("\n| {:<8} | {:<28} | {:<8} | {:<12} |".format("Cuenca", "Punto (x, y)", "Tipo", "Área (%)"))
+    print("|" + "-"*10 + "|" + "-"*30 + "|" + "-"*10 + "|" + "-"*14 + "|")
+    for k in np.argsort(-counts[1:], kind='stable')[:top]:
+        if not counts[k + 1]:
+            break
+        mx, my = minima[k]
+        print("| {:<8} | {:<28} | {:<8} | {:<12} |".format(k, f"({mx:.3f}, {my:.3f})", KINDS[basins['kinds'][k]],
+                                                            f"{counts[k + 1] / total * 100:.2f}"))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mapa de cuencas de atracción por bloques")
+    parser.add_argument('output_dir', help="directorio de los .npy y del manifiesto")
+    parser.add_argument('--adaptive', type=int, default=None, metavar='COARSE',
+                        help="modo adaptativo partiendo de una malla COARSE x COARSE")
+    parser.add_argument('--method', default='gradient_descent', choices=sorted(METHODS))
+    parser.add_argument('--bounds', nargs=2, type=float, default=(-3.0, 3.0), metavar=('MIN', 'MAX'))
+    parser.add_argument('--resolution', type=int, default=1024)
+    parser.add_argument('--tile', type=int, default=256)
+    parser.add_argument('--params', type=json.loads, default={}, help="parámetros del método en JSON")
+    args = parser.parse_args()
+
+    if args.adaptive:
+        tree = adaptive_basin_map(args.method, tuple(args.bounds), args.resolution, args.adaptive, args.params)
+        os.makedirs(args.output_dir, exist_ok=True)
+        save_quadtree(tree, os.path.join(args.output_dir, 'quadtree.npz'))
+        display_quadtree(tree)
+        raise SystemExit
+
+    basins = basin_map(args.output_dir, args.method, tuple(args.bounds), args.resolution,
+                       args.tile, args.params, verbose=True)
+    display_basin_map(basins)
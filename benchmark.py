@@ -0,0 +1,229 @@
+import os
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+import numpy as np
+from typing import Callable, Dict, List
+
+from max_descent.gradientDescent import gradient_descent, gradient_descent_nd, gradient_descent_batch, PLANAR
+from trust_region.trustRegion import trust_region, trust_region_batch
+from multistart import generate_starts
+from instrumentation import aggregate
+from utils import STEP_SIZES, REGION_SIZES, NEAR_POINTS, FAR_POINTS
+
+# Banco de pruebas de rendimiento de los resolvedores. Mide, con semillas fijas:
+# - modo de un punto: tiempo por resolución, costo por iteración y evaluaciones
+#   por resolución convergida, para cada α / Δ de las Pruebas 1
+# - costo por iteración: los 18 puntos cercanos y lejanos de las Pruebas 2,
+#   resueltos varias veces con un α / Δ fijo (incluye el camino genérico
+#   gradient_descent_nd como referencia del camino escalar de gradient_descent)
+# - modo vectorizado: tiempo por cada 10^k arranques y evaluaciones por punto
+# - memoria máxima (tracemalloc) de cada caso, medida en una pasada aparte
+# - en el modo de un punto, el reparto del tiempo entre objetivo, subproblema
+#   y el resto (Python), sumado sobre el barrido (ver instrumentation)
+# El resultado se escribe como JSON para comparar antes y después de un cambio:
+#   python benchmark.py -o antes.json
+#   python benchmark.py -o despues.json
+#   python benchmark.py --compare antes.json despues.json
+
+SINGLE_SOLVERS = {
+    'gradient_descent': (gradient_descent, 'alpha', STEP_SIZES),
+    'trust_region': (trust_region, 'delta', REGION_SIZES)
+}
+
+def planar_descent_nd(x0: float, y0: float, alpha: float) -> tuple:
+    #gradient_descent por el camino genérico n-dimensional, con la misma salida
+    z, final_f, iterations, converged = gradient_descent_nd(PLANAR, [x0, y0], alpha)
+    return z[0], z[1], final_f, iterations, converged
+
+# Casos del costo por iteración: (resolvedor, parámetro, valor)
+ITERATION_SOLVERS = {
+    'gradient_descent': (gradient_descent, 'alpha', 0.1),
+    'gradient_descent_nd': (planar_descent_nd, 'alpha', 0.1),
+    'trust_region': (trust_region, 'delta', 1.0)
+}
+
+BATCH_SOLVERS = {
+    'gradient_descent': (gradient_descent_batch, 'alpha', STEP_SIZES),
+    'trust_region': (trust_region_batch, 'delta', REGION_SIZES)
+}
+
+def peak_memory(run: Callable) -> int:
+    #Memoria máxima (bytes) asignada durante run(), según tracemalloc
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def bench_single(method: str, starts: int = 50, repeats: int = 3, seed: int = 0,
+                 bounds=(-3.0, 3.0)) -> List[Dict]:
+    #Modo de un punto: resuelve `starts` puntos iniciales uno a uno para cada
+    #parámetro; el tiempo es el mejor de `repeats` pasadas sin instrumentar y
+    #los contadores y el reparto del tiempo salen de una pasada instrumentada
+    solve, param_name, values = SINGLE_SOLVERS[method]
+    X0, Y0 = generate_starts(starts, 'uniform', bounds, seed)
+    points = list(zip(X0.tolist(), Y0.tolist()))
+    records = []
+
+    for value in values:
+        def run():
+            return [solve(x0, y0, value) for x0, y0 in points]
+
+        best = np.inf
+        for _ in range(repeats):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+
+        runs = [solve(x0, y0, value, instrument=True).stats for x0, y0 in points]
+
+        iterations = np.array([r.iterations for r in runs])
+        converged = np.array([r.converged for r in runs], dtype=bool)
+        evals = {name: np.array([getattr(r, name) for r in runs])
+                 for name in ('f_evals', 'grad_evals', 'hess_evals')}
+        sweep = aggregate(runs)
+        records.append({
+            'method': method,
+            'mode': 'single',
+            param_name: value,
+            'starts': starts,
+            'seconds_per_solve': best / starts,
+            'seconds_per_iteration': best / iterations.sum(),
+            'mean_iterations': float(iterations.mean()),
+            'converged_fraction': float(converged.mean()),
+            'evals_per_converged_solve': {
+                name: float(e[converged].mean()) if converged.any() else None
+                for name, e in evals.items()
+            },
+            'time_shares': {name: sweep.summary()[name + '_share']
+                            for name in ('objective', 'subproblem', 'overhead')},
+            'peak_memory_bytes': peak_memory(run)
+        })
+    return records
+
+def bench_iteration(method: str, runs: int = 20, repeats: int = 3) -> Dict:
+    #Costo por iteración: resuelve `runs` veces cada punto de NEAR_POINTS y
+    #FAR_POINTS con el parámetro fijo del caso (mejor de `repeats` pasadas)
+    solve, param_name, value = ITERATION_SOLVERS[method]
+    points = list(NEAR_POINTS) + list(FAR_POINTS)
+    iterations = sum(solve(x0, y0, value)[3] for x0, y0 in points)
+
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(runs):
+            for x0, y0 in points:
+                solve(x0, y0, value)
+        best = min(best, time.perf_counter() - start)
+
+    return {
+        'method': method,
+        'mode': 'iteration',
+        param_name: value,
+        'starts': len(points) * runs,
+        'seconds_per_iteration': best / (iterations * runs),
+        'mean_iterations': iterations / len(points)
+    }
+
+def bench_batch(method: str, powers=(2, 3, 4, 5), seed: int = 0,
+                bounds=(-100.0, 100.0), values=None) -> List[Dict]:
+    #Modo vectorizado: tiempo por cada 10^k arranques uniformes en bounds²
+    solve, param_name, default_values = BATCH_SOLVERS[method]
+    records = []
+
+    for value in (values if values is not None else default_values):
+        for k in powers:
+            n = 10 ** k
+            X0, Y0 = generate_starts(n, 'uniform', bounds, seed)
+
+            start = time.perf_counter()
+            _, _, _, iterations, converged = solve(X0, Y0, value)
+            seconds = time.perf_counter() - start
+
+            records.append({
+                'method': method,
+                'mode': 'batch',
+                param_name: value,
+                'starts': n,
+                'seconds': seconds,
+                'seconds_per_start': seconds / n,
+                # Cada iteración de un punto activo evalúa una vez el núcleo fusionado
+                'point_evals_per_start': float(iterations.mean()) + 1.0,
+                'converged_fraction': float(converged.mean()),
+                'peak_memory_bytes': peak_memory(lambda: solve(X0, Y0, value))
+            })
+    return records
+
+def run_benchmarks(seed: int = 0, starts: int = 50, repeats: int = 3, powers=(2, 3, 4, 5),
+                   batch_values: Dict = None) -> Dict:
+    #Ejecuta todos los casos y devuelve el informe listo para json.dump
+    batch_values = batch_values or {'gradient_descent': [0.1], 'trust_region': [1.0]}
+    results = []
+    for method in SINGLE_SOLVERS:
+        results += bench_single(method, starts, repeats, seed)
+    for method in ITERATION_SOLVERS:
+        results.append(bench_iteration(method, repeats=repeats))
+    for method in BATCH_SOLVERS:
+        results += bench_batch(method, powers, seed, values=batch_values.get(method))
+
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+            'seed': seed,
+            'starts': starts,
+            'repeats': repeats
+        },
+        'results': results
+    }
+
+def _case_key(record: Dict) -> tuple:
+    param = record.get('alpha', record.get('delta'))
+    return (record['method'], record['mode'], param, record['starts'])
+
+# Medida de tiempo que se compara en cada modo
+TIME_KEYS = {'single': 'seconds_per_solve', 'iteration': 'seconds_per_iteration', 'batch': 'seconds'}
+
+def compare_reports(before: Dict, after: Dict):
+    #Muestra la razón después/antes del tiempo y la memoria de cada caso común
+    old = {_case_key(r): r for r in before['results']}
+    print("| {:<19} | {:<9} | {:<8} | {:<9} | {:<12} | {:<12} |".format(
+        "Método", "Modo", "α/Δ", "Arranques", "Tiempo", "Memoria"))
+    print("|" + "-"*21 + "|" + "-"*11 + "|" + "-"*10 + "|" + "-"*11 + "|" + "-"*14 + "|" + "-"*14 + "|")
+    for record in after['results']:
+        key = _case_key(record)
+        if key not in old:
+            continue
+        time_key = TIME_KEYS[record['mode']]
+        time_ratio = record[time_key] / old[key][time_key]
+        memory = f"{record['peak_memory_bytes'] / max(old[key]['peak_memory_bytes'], 1):.2f}x" \
+            if 'peak_memory_bytes' in record else "-"
+        print("| {:<19} | {:<9} | {:<8} | {:<9} | {:<12} | {:<12} |".format(
+            key[0], key[1], key[2], key[3], f"{time_ratio:.2f}x", memory))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Banco de pruebas de rendimiento de los resolvedores")
+    parser.add_argument('-o', '--output', default='benchmark.json', help="archivo JSON de salida")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--starts', type=int, default=50, help="puntos iniciales del modo de un punto")
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--max-power', type=int, default=5, help="mayor k de 10^k arranques")
+    parser.add_argument('--compare', nargs=2, metavar=('ANTES', 'DESPUES'),
+                        help="compara dos informes en lugar de medir")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as before, open(args.compare[1]) as after:
+            compare_reports(json.load(before), json.load(after))
+    else:
+        report = run_benchmarks(args.seed, args.starts, args.repeats, tuple(range(2, args.max_power + 1)))
+        with open(args.output, 'w') as out:
+            json.dump(report, out, indent=2)
+        print(f"Resultados guardados en '{args.output}' ({len(report['results'])} casos)")
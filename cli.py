@@ -0,0 +1,219 @@
+import io
+import os
+import json
+import time
+import argparse
+import importlib
+import itertools
+import contextlib
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from max_descent.gradientDescent import gradient_descent
+from trust_region.trustRegion import trust_region
+from quasi_newton.quasiNewton import bfgs, lbfgs
+from multistart import run_multistart, basin_statistics, display_basin_statistics
+from basins import basin_map, display_basin_map, adaptive_basin_map, save_quadtree, display_quadtree
+from results_table import ResultsTable, CONVERGENCE_TYPES
+from utils import NEAR_POINTS, FAR_POINTS, classify_convergence, is_successful_convergence
+
+# Punto de entrada único para los experimentos. Lee un archivo de configuración
+# JSON con la lista de experimentos y los ejecuta de forma concurrente en un pool
+# de procesos; la salida de cada uno se captura y se imprime en el orden del
+# archivo, sin importar cuál termina primero. Uso (desde la raíz):
+#   python cli.py experiments.json [--workers N] [--only nombre ...]
+#
+# Tipos de experimento ("kind"):
+# - "sweep": barrido de un parámetro (p. ej. α o Δ) de un resolvedor desde uno o
+#   varios conjuntos de puntos iniciales; guarda un ResultsTable en <nombre>.npz
+# - "multistart": búsqueda multiarranque con resumen de cuencas (ver multistart)
+# - "basins": mapa de cuencas por bloques en <output_dir>/<nombre>/ (ver basins);
+#   con "coarse" se usa el modo adaptativo y se guarda el quadtree en <nombre>.npz
+# - "driver": ejecuta el main() de un paquete (max_descent, trust_region)
+# La salida impresa de cada experimento se guarda además en <nombre>.txt
+
+# Resolvedores de un punto disponibles en los barridos
+SWEEP_SOLVERS = {
+    'gradient_descent': gradient_descent,
+    'trust_region': trust_region,
+    'bfgs': bfgs,
+    'lbfgs': lbfgs
+}
+
+# Conjuntos de puntos iniciales con nombre
+START_SETS = {
+    'unit': [(1.0, 1.0)],
+    'near': NEAR_POINTS,
+    'far': FAR_POINTS
+}
+
+KINDS = ('sweep', 'multistart', 'basins', 'driver')
+
+def load_config(path: str) -> Dict:
+    #Lee y valida el archivo de configuración
+    #Los valores de "defaults" (p. ej. tol, max_iter) se aplican a las opciones de
+    #todos los barridos que no los fijan
+    with open(path) as source:
+        config = json.load(source)
+
+    defaults = config.get('defaults', {})
+    names = set()
+    for spec in config.get('experiments', []):
+        kind = spec.get('kind')
+        if kind not in KINDS:
+            raise ValueError(f"Tipo de experimento desconocido: {kind!r}")
+        if 'name' not in spec or spec['name'] in names:
+            raise ValueError(f"Cada experimento necesita un nombre único: {spec.get('name')!r}")
+        names.add(spec['name'])
+        if kind == 'sweep':
+            if spec.get('method') not in SWEEP_SOLVERS:
+                raise ValueError(f"Método desconocido: {spec.get('method')!r}")
+            spec['options'] = {**defaults, **spec.get('options', {})}
+
+    config.setdefault('output_dir', 'resultados')
+    return config
+
+def _start_points(starts) -> List[Tuple[str, List[Tuple[float, float]]]]:
+    #Normaliza "starts": un nombre, una lista de nombres o una lista de puntos
+    if isinstance(starts, str):
+        starts = [starts]
+    if starts and not isinstance(starts[0], str):
+        return [('custom', [tuple(map(float, p)) for p in starts])]
+    for name in starts:
+        if name not in START_SETS:
+            raise ValueError(f"Conjunto de puntos iniciales desconocido: {name!r}")
+    return [(name, START_SETS[name]) for name in starts]
+
+def run_sweep(spec: Dict, output_dir: str):
+    #Barrido de `param` sobre `values` desde cada conjunto de puntos iniciales
+    solver = SWEEP_SOLVERS[spec['method']]
+    param = spec.get('param')
+    values = spec.get('values', [None]) if param else [None]
+    options = spec.get('options', {})
+    start_sets = _start_points(spec.get('starts', 'unit'))
+    results = ResultsTable(groups=tuple(name for name, _ in start_sets))
+
+    print("\n" + "="*90)
+    print(f"BARRIDO: {spec['name']} - {spec['method']}" + (f" ({param})" if param else ""))
+    print("="*90)
+    print("| {:<12} | {:<18} | {:<10} | {:<12} | {:<16} | {:<25} |".format(
+        "Conjunto", "Punto Inicial", param or "-", "Iteraciones", "f(x,y) final", "Tipo Convergencia"))
+    print("|" + "-"*14 + "|" + "-"*20 + "|" + "-"*12 + "|" + "-"*14 + "|" + "-"*18 + "|" + "-"*27 + "|")
+
+    for (set_name, points), value in itertools.product(start_sets, values):
+        kwargs = dict(options, **({param: value} if param else {}))
+        for x0, y0 in points:
+            x_opt, y_opt, f_opt, iterations, converged = solver(x0, y0, **kwargs)
+            results.append(group=set_name, x0=x0, y0=y0, x_final=x_opt, y_final=y_opt,
+                           param=np.nan if value is None else value, iterations=iterations, f_final=f_opt, error=f_opt - 0.18,
+                           distance=np.sqrt(x0**2 + y0**2), converged=converged,
+                           successful=is_successful_convergence(f_opt, iterations, kwargs.get('max_iter', 1000)))
+            print("| {:<12} | {:<18} | {:<10} | {:<12} | {:<16} | {:<25} |".format(
+                set_name, f"({x0:.1f}, {y0:.1f})", "-" if value is None else value, iterations,
+                f"{f_opt:.6f}", classify_convergence(x_opt, y_opt, converged)))
+
+    print("\nRESUMEN POR CONJUNTO:")
+    counts = results.counts(by='group')
+    avg_iterations = results.mean_by('iterations')
+    for code, set_name in enumerate(results.groups):
+        by_type = results[results.is_group(set_name)].counts()
+        types = ", ".join(f"{label}: {count}" for label, count in zip(CONVERGENCE_TYPES, by_type))
+        print(f"• {set_name}: {counts[code]} ejecuciones, {avg_iterations[code]:.1f} iteraciones promedio ({types})")
+
+    results.save(os.path.join(output_dir, spec['name'] + '.npz'))
+
+def run_multistart_experiment(spec: Dict, output_dir: str):
+    #Búsqueda multiarranque en un solo proceso (el paralelismo está entre experimentos)
+    results = run_multistart(spec.get('method', 'gradient_descent'), n=spec.get('n', 10000),
+                             distribution=spec.get('distribution', 'uniform'),
+                             bounds=tuple(spec.get('bounds', (-100.0, 100.0))),
+                             seed=spec.get('seed', 0), params=spec.get('params'), workers=1)
+    display_basin_statistics(basin_statistics(results), f"{spec['name']} - {results['method']}")
+    np.savez(os.path.join(output_dir, spec['name'] + '.npz'),
+             **{key: value for key, value in results.items() if isinstance(value, np.ndarray)})
+
+def run_basins(spec: Dict, output_dir: str):
+    #Mapa de cuencas; se reanuda si el directorio ya tiene bloques terminados
+    if 'coarse' in spec:
+        tree = adaptive_basin_map(spec.get('method', 'gradient_descent'),
+                                  bounds=tuple(spec.get('bounds', (-3.0, 3.0))),
+                                  resolution=spec.get('resolution', 1024), coarse=spec['coarse'],
+                                  params=spec.get('params'))
+        save_quadtree(tree, os.path.join(output_dir, spec['name'] + '.npz'))
+        display_quadtree(tree)
+        return
+    basins = basin_map(os.path.join(output_dir, spec['name']), spec.get('method', 'gradient_descent'),
+                       bounds=tuple(spec.get('bounds', (-3.0, 3.0))),
+                       resolution=spec.get('resolution', 1024), tile=spec.get('tile', 256),
+                       params=spec.get('params'))
+    display_basin_map(basins)
+
+def run_driver(spec: Dict, output_dir: str):
+    #Ejecuta el main() de un paquete; sin gráficas salvo que se pida "plots": true
+    #Con "draft": true son de baja resolución y con "panels": true cada panel se
+    #guarda en <output_dir>/<nombre>/
+    module = importlib.import_module(spec['package'] + '.main')
+    panels_dir = os.path.join(output_dir, spec['name']) if spec.get('panels') else None
+    module.main(headless=not spec.get('plots', False), draft=spec.get('draft', False), panels_dir=panels_dir)
+
+RUNNERS = {
+    'sweep': run_sweep,
+    'multistart': run_multistart_experiment,
+    'basins': run_basins,
+    'driver': run_driver
+}
+
+def run_experiment(spec: Dict, output_dir: str) -> Tuple[str, str, float]:
+    #Trabajo de cada proceso: ejecuta un experimento capturando lo que imprime
+    #Devuelve (nombre, salida, segundos)
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        RUNNERS[spec['kind']](spec, output_dir)
+    text = output.getvalue()
+    with open(os.path.join(output_dir, spec['name'] + '.txt'), 'w') as log:
+        log.write(text)
+    return spec['name'], text, time.perf_counter() - start
+
+def run_config(config: Dict, workers: int = None, only: List[str] = None) -> List[Tuple[str, float]]:
+    #Ejecuta los experimentos de la configuración en un pool de procesos e
+    #imprime su salida en el orden del archivo a medida que está disponible
+    experiments = [spec for spec in config['experiments'] if not only or spec['name'] in only]
+    output_dir = config['output_dir']
+    os.makedirs(output_dir, exist_ok=True)
+    workers = min(workers or config.get('workers') or os.cpu_count() or 1, max(len(experiments), 1))
+
+    timings = []
+    if workers == 1:
+        outputs = (run_experiment(spec, output_dir) for spec in experiments)
+        for name, text, seconds in outputs:
+            print(text, end='')
+            timings.append((name, seconds))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_experiment, spec, output_dir) for spec in experiments]
+            for future in futures:
+                name, text, seconds = future.result()
+                print(text, end='')
+                timings.append((name, seconds))
+    return timings
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ejecuta los experimentos de un archivo de configuración")
+    parser.add_argument('config', nargs='?', default='experiments.json', help="archivo JSON de configuración")
+    parser.add_argument('--workers', type=int, default=None, help="procesos del pool (por defecto, uno por CPU)")
+    parser.add_argument('--only', nargs='+', metavar='NOMBRE', help="ejecutar sólo estos experimentos")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    timings = run_config(load_config(args.config), args.workers, args.only)
+
+    print("\n" + "="*90)
+    print("TIEMPOS")
+    print("="*90)
+    print("| {:<30} | {:<12} |".format("Experimento", "Segundos"))
+    print("|" + "-"*32 + "|" + "-"*14 + "|")
+    for name, seconds in timings:
+        print("| {:<30} | {:<12.2f} |".format(name, seconds))
+    print(f"\nTotal (pared): {time.perf_counter() - start:.2f} s")
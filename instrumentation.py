@@ -0,0 +1,125 @@
+import time
+import numpy as np
+from typing import Callable, Dict, Iterable
+
+# Instrumentación opcional de los resolvedores (opción instrument=True):
+# cuenta evaluaciones de f, ∇f y ∇²f, pasos aceptados/rechazados y mide el tiempo
+# en la evaluación del objetivo, en el subproblema y en total. Lo que no es
+# objetivo ni subproblema es el costo propio de Python (bucle, álgebra de 2x2,
+# generadores...). Las estadísticas de varias resoluciones se suman con `+` o
+# con aggregate() para resumir barridos completos.
+
+COUNTERS = ('solves', 'converged', 'iterations', 'f_evals', 'grad_evals', 'hess_evals',
+            'accepted', 'rejected')
+TIMERS = ('objective_time', 'subproblem_time', 'total_time')
+
+class SolveStats:
+    #Contadores y tiempos (segundos) de una o varias resoluciones
+    __slots__ = COUNTERS + TIMERS
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            setattr(self, name, values.get(name, 0))
+
+    @property
+    def overhead_time(self) -> float:
+        #Tiempo fuera del objetivo y del subproblema
+        return self.total_time - self.objective_time - self.subproblem_time
+
+    def __add__(self, other: 'SolveStats') -> 'SolveStats':
+        return SolveStats(**{name: getattr(self, name) + getattr(other, name)
+                             for name in self.__slots__})
+
+    def as_dict(self) -> Dict:
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values['overhead_time'] = self.overhead_time
+        return values
+
+    def summary(self) -> Dict:
+        #Promedios por resolución y reparto del tiempo total
+        solves = max(self.solves, 1)
+        total = self.total_time if self.total_time > 0 else np.nan
+        return {
+            'solves': self.solves,
+            'converged_fraction': self.converged / solves,
+            'iterations_per_solve': self.iterations / solves,
+            'f_evals_per_solve': self.f_evals / solves,
+            'grad_evals_per_solve': self.grad_evals / solves,
+            'hess_evals_per_solve': self.hess_evals / solves,
+            'accepted_fraction': self.accepted / max(self.accepted + self.rejected, 1),
+            'seconds_per_solve': self.total_time / solves,
+            'objective_share': self.objective_time / total,
+            'subproblem_share': self.subproblem_time / total,
+            'overhead_share': self.overhead_time / total
+        }
+
+def aggregate(results: Iterable) -> SolveStats:
+    #Suma las estadísticas de varios SolveResult (o SolveStats)
+    total = SolveStats()
+    for result in results:
+        total = total + (result.stats if isinstance(result, SolveResult) else result)
+    return total
+
+class SolveResult:
+    #Resultado instrumentado: se desempaqueta como la tupla de siempre
+    #(x, y, f, iteraciones, convergió[, trayectoria]) y expone `stats`
+    __slots__ = ('values', 'stats')
+
+    def __init__(self, values: tuple, stats: SolveStats):
+        self.values = tuple(values)
+        self.stats = stats
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"SolveResult({self.values!r}, stats={self.stats.as_dict()!r})"
+
+def timed(function: Callable, timings: Dict, key: str) -> Callable:
+    #Envuelve `function` para acumular en timings[key] el tiempo que tarda
+    timings.setdefault(key, 0.0)
+    clock = time.perf_counter
+
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timings[key] += clock() - start
+    return wrapper
+
+class InstrumentedObjective:
+    #Envuelve un objetivo n-dimensional: cuenta y cronometra sus evaluaciones
+    def __init__(self, objective):
+        self.objective = objective
+        self.n = objective.n
+        self.counts = {'f': 0, 'grad': 0, 'hessvec': 0}
+        self.timings = {'objective': 0.0}
+
+    def value(self, x: np.ndarray) -> float:
+        self.counts['f'] += 1
+        start = time.perf_counter()
+        value = self.objective.value(x)
+        self.timings['objective'] += time.perf_counter() - start
+        return value
+
+    def value_grad(self, x: np.ndarray):
+        self.counts['f'] += 1
+        self.counts['grad'] += 1
+        start = time.perf_counter()
+        value_grad = self.objective.value_grad(x)
+        self.timings['objective'] += time.perf_counter() - start
+        return value_grad
+
+    def hessvec(self, x: np.ndarray, v: np.ndarray) -> np.ndarray:
+        self.counts['hessvec'] += 1
+        start = time.perf_counter()
+        product = self.objective.hessvec(x, v)
+        self.timings['objective'] += time.perf_counter() - start
+        return product
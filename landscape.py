@@ -0,0 +1,110 @@
+import os
+import inspect
+import numpy as np
+from functools import lru_cache
+from typing import Tuple
+
+from objective import f
+from solve_cache import source_digest
+
+# Caché de mallas de la función objetivo para las gráficas de contorno y de
+# superficie. Para cada dominio bounds² se guarda una pirámide de niveles: el
+# nivel k es f evaluada en una malla de (2^k + 1)² vértices, en un .npy mapeado
+# en memoria dentro de <cache_dir>/<dominio>_<hash de objective.py>/ (editar la
+# función objetivo nunca sirve mallas viejas). Como las mallas están anidadas,
+# cada nivel es exactamente el siguiente más fino tomado cada 2 puntos: un nivel
+# nuevo se obtiene sin evaluar f si ya existe uno más fino, y sólo se evalúa
+# (por franjas de filas, con memoria acotada) cuando no hay ninguno.
+# Las gráficas piden una resolución y, opcionalmente, una ventana (zoom) y
+# reciben la porción del nivel más pequeño que la alcanza.
+# Los valores se guardan en float32, suficiente para dibujar.
+
+DEFAULT_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.landscape_cache')
+
+class LandscapePyramid:
+    #Niveles min_level..max_level de f sobre bounds²
+    def __init__(self, bounds: Tuple[float, float] = (-3.0, 3.0), cache_dir: str = DEFAULT_CACHE,
+                 min_level: int = 6, max_level: int = 13, band: int = 256):
+        self.bounds = (float(bounds[0]), float(bounds[1]))
+        self.min_level = min_level
+        self.max_level = max_level
+        self.band = band
+        version = source_digest([inspect.getsourcefile(f)])
+        self.directory = os.path.join(cache_dir, "{:g}_{:g}_{}".format(*self.bounds, version))
+        self._levels = {}
+
+    def size(self, level: int) -> int:
+        return 2 ** level + 1
+
+    def axis(self, level: int) -> np.ndarray:
+        #Coordenadas de los vértices del nivel (iguales en x y en y)
+        return np.linspace(self.bounds[0], self.bounds[1], self.size(level))
+
+    def path(self, level: int) -> str:
+        return os.path.join(self.directory, f"level_{self.size(level)}.npy")
+
+    def level(self, level: int) -> np.ndarray:
+        #Valores del nivel (filas = y, columnas = x), construyéndolo si no está en caché
+        if level not in self._levels:
+            if not os.path.exists(self.path(level)):
+                self._build(level)
+            self._levels[level] = np.load(self.path(level), mmap_mode='r')
+        return self._levels[level]
+
+    def _build(self, level: int):
+        #Escribe el nivel en un archivo temporal y lo renombra al terminar, así
+        #que un proceso que lea la caché nunca ve un nivel a medio escribir
+        os.makedirs(self.directory, exist_ok=True)
+        n = self.size(level)
+        tmp = f"{self.path(level)}.{os.getpid()}.tmp.npy"
+        Z = np.lib.format.open_memmap(tmp, mode='w+', dtype=np.float32, shape=(n, n))
+
+        finer = [k for k in range(level + 1, self.max_level + 1) if os.path.exists(self.path(k))]
+        if finer:
+            stride = 2 ** (finer[0] - level)
+            source = self.level(finer[0])
+            for i in range(0, n, self.band):
+                Z[i:i + self.band] = source[i * stride:(i + self.band) * stride:stride, ::stride]
+        else:
+            axis = self.axis(level)
+            for i in range(0, n, self.band):
+                X, Y = np.meshgrid(axis, axis[i:i + self.band])
+                Z[i:i + self.band] = f(X, Y)
+
+        Z.flush()
+        del Z
+        os.replace(tmp, self.path(level))
+
+    def grid(self, resolution: int, window: Tuple[float, float, float, float] = None
+             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        #Malla (x, y, Z) con al menos `resolution` puntos por eje dentro de
+        #window = (x_min, x_max, y_min, y_max) (todo el dominio por defecto),
+        #tomada del nivel más pequeño que alcanza; si ni el nivel más fino
+        #alcanza, se evalúa f directamente sobre la ventana sin guardarla
+        low, high = self.bounds
+        x_min, x_max, y_min, y_max = window if window is not None else (low, high, low, high)
+        if x_min < low or y_min < low or x_max > high or y_max > high:
+            raise ValueError(f"La ventana {window} no está dentro de [{low}, {high}]²")
+
+        for level in range(self.min_level, self.max_level + 1):
+            step = (high - low) / (self.size(level) - 1)
+            j0, j1 = int(np.ceil((x_min - low) / step - 1e-9)), int(np.floor((x_max - low) / step + 1e-9)) + 1
+            i0, i1 = int(np.ceil((y_min - low) / step - 1e-9)), int(np.floor((y_max - low) / step + 1e-9)) + 1
+            if min(j1 - j0, i1 - i0) >= resolution:
+                axis = self.axis(level)
+                return axis[j0:j1], axis[i0:i1], self.level(level)[i0:i1, j0:j1]
+
+        x = np.linspace(x_min, x_max, resolution)
+        y = np.linspace(y_min, y_max, resolution)
+        X, Y = np.meshgrid(x, y)
+        return x, y, f(X, Y)
+
+@lru_cache(maxsize=None)
+def pyramid(bounds: Tuple[float, float] = (-3.0, 3.0), cache_dir: str = DEFAULT_CACHE) -> LandscapePyramid:
+    #Una pirámide por dominio y proceso (los niveles abiertos se reutilizan)
+    return LandscapePyramid(bounds, cache_dir)
+
+def landscape_grid(bounds: Tuple[float, float], resolution: int,
+                   window: Tuple[float, float, float, float] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    #Atajo para las gráficas: malla (x, y, Z) de f sobre bounds² desde la caché
+    return pyramid(tuple(bounds)).grid(resolution, window)
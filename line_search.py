@@ -0,0 +1,91 @@
+import numpy as np
+from typing import Callable, Tuple
+
+# Búsquedas lineales compartidas por los métodos que avanzan a lo largo de una
+# dirección de descenso p. `fg(x)` devuelve (f(x), ∇f(x)) con una sola evaluación
+# fusionada, de modo que el gradiente del punto aceptado se reutiliza en la
+# siguiente iteración sin volver a evaluar la función.
+#
+# Todas devuelven (t, f(x + t p), ∇f(x + t p), número de evaluaciones)
+
+def armijo_backtracking(fg: Callable, x: np.ndarray, f0: float, g0: np.ndarray, p: np.ndarray,
+                        t0: float = 1.0, c1: float = 1e-4, shrink: float = 0.5,
+                        max_trials: int = 50) -> Tuple[float, float, np.ndarray, int]:
+    #Retroceso de Armijo: reduce t hasta que f(x + t p) <= f0 + c1·t·(g0·p)
+    #Si se agotan los max_trials intentos se devuelve el último t evaluado, con
+    #su valor y gradiente
+    slope = g0 @ p
+    t = t0
+    for k in range(max_trials):
+        if k:
+            t *= shrink
+        f_new, g_new = fg(x + t * p)
+        if f_new <= f0 + c1 * t * slope:
+            break
+    return t, f_new, g_new, k + 1
+
+def wolfe_line_search(fg: Callable, x: np.ndarray, f0: float, g0: np.ndarray, p: np.ndarray,
+                      t0: float = 1.0, c1: float = 1e-4, c2: float = 0.9,
+                      max_trials: int = 30, t_max: float = 1e6) -> Tuple[float, float, np.ndarray, int]:
+    #Búsqueda lineal con condiciones fuertes de Wolfe (Nocedal y Wright, alg. 3.5/3.6)
+    #Amplía t mientras haya descenso suficiente y pendiente negativa; luego acota
+    #el intervalo con interpolación cuadrática y bisección de respaldo
+    slope0 = g0 @ p
+    evals = 0
+
+    def phi(t):
+        f_t, g_t = fg(x + t * p)
+        return f_t, g_t, g_t @ p
+
+    t_prev, f_prev, d_prev = 0.0, f0, slope0
+    t = t0
+    best = (0.0, f0, g0)
+
+    for _ in range(max_trials):
+        f_t, g_t, d_t = phi(t)
+        evals += 1
+        if np.isfinite(f_t) and f_t < best[1]:
+            best = (t, f_t, g_t)
+
+        if not np.isfinite(f_t) or f_t > f0 + c1 * t * slope0 or (evals > 1 and f_t >= f_prev):
+            return _zoom(phi, f0, slope0, t_prev, f_prev, d_prev, t, f_t, c1, c2, evals, best, max_trials)
+        if abs(d_t) <= -c2 * slope0:
+            return t, f_t, g_t, evals
+        if d_t >= 0:
+            return _zoom(phi, f0, slope0, t, f_t, d_t, t_prev, f_prev, c1, c2, evals, best, max_trials)
+
+        t_prev, f_prev, d_prev = t, f_t, d_t
+        t = min(2.0 * t, t_max)
+
+    return best[0], best[1], best[2], evals
+
+def _zoom(phi: Callable, f0: float, slope0: float, t_lo: float, f_lo: float, d_lo: float,
+          t_hi: float, f_hi: float, c1: float, c2: float, evals: int, best: tuple,
+          max_trials: int) -> Tuple[float, float, np.ndarray, int]:
+    #Fase de acotamiento de la búsqueda de Wolfe sobre el intervalo [t_lo, t_hi]
+    while evals < 2 * max_trials:
+        # Mínimo de la cuadrática que interpola f(t_lo), φ'(t_lo) y f(t_hi)
+        width = t_hi - t_lo
+        denom = 2.0 * (f_hi - f_lo - d_lo * width)
+        t = t_lo - d_lo * width**2 / denom if denom > 0 and np.isfinite(f_hi) else t_lo + 0.5 * width
+        if not (min(t_lo, t_hi) + 0.1 * abs(width) <= t <= max(t_lo, t_hi) - 0.1 * abs(width)):
+            t = t_lo + 0.5 * width
+
+        f_t, g_t, d_t = phi(t)
+        evals += 1
+        if np.isfinite(f_t) and f_t < best[1]:
+            best = (t, f_t, g_t)
+
+        if not np.isfinite(f_t) or f_t > f0 + c1 * t * slope0 or f_t >= f_lo:
+            t_hi, f_hi = t, f_t
+        else:
+            if abs(d_t) <= -c2 * slope0:
+                return t, f_t, g_t, evals
+            if d_t * (t_hi - t_lo) >= 0:
+                t_hi, f_hi = t_lo, f_lo
+            t_lo, f_lo, d_lo = t, f_t, d_t
+
+        if abs(t_hi - t_lo) < 1e-16:
+            break
+
+    return best[0], best[1], best[2], evals
@@ -0,0 +1,6 @@
+# Método de Máximo Descenso y sus variantes (Armijo, Wolfe, Barzilai–Borwein,
+# bola pesada, Nesterov, Adam). Los módulos compartidos (objective, utils, ...)
+# viven en la raíz del repositorio, que debe estar en sys.path.
+from .gradientDescent import (gradient_descent, gradient_descent_nd, gradient_descent_cached,
+                              gradient_descent_batch, iter_gradient_descent, iter_gradient_descent_nd,
+                              heavy_ball, nesterov, adam)
@@ -0,0 +1,263 @@
+import os
+import numpy as np
+from results_table import ResultsTable
+from plotting import (pyplot, render_panels, thin_scatter, DPI, DRAFT_DPI,
+                      MAX_ANNOTATIONS, MAX_SEGMENTS)
+from landscape import landscape_grid
+
+def display_consistent_analysis(step_results: ResultsTable, point_results: ResultsTable):
+    #Muestra un análisis consistente con los datos de las tablas
+    print("\n" + "="*90)
+    print("ANÁLISIS CON TABLAS")
+    print("="*90)
+    
+    successful_step = step_results[step_results['successful']]
+    successful_points = point_results[point_results['successful']]
+    
+    # Análisis Prueba 1
+    print("\nANÁLISIS DE LA PRUEBA 1 (Tamaños de Paso):")
+    print(f"• Convergencia exitosa: {len(successful_step)}/7 casos")
+    
+    if len(successful_step):
+        best_alpha = successful_step.best()
+        worst_alpha = successful_step.worst()
+        
+        print(f"• Mejor α: {best_alpha['param']} (converge en {best_alpha['iterations']} iteraciones)")
+        print(f"• Peor α convergente: {worst_alpha['param']} ({worst_alpha['iterations']} iteraciones)")
+        
+        # Rango óptimo basado en iteraciones bajas
+        fast_alphas = successful_step['param'][successful_step['iterations'] <= 20]
+        if fast_alphas.size:
+            print(f"• Rango óptimo: α ∈ [{fast_alphas.min()}, {fast_alphas.max()}]")
+    
+    # Análisis Prueba 2
+    print("\nANÁLISIS DE LA PRUEBA 2 (Puntos Iniciales):")
+    print(f"• Robustez: {len(successful_points)}/9 puntos convergen exitosamente")
+    
+    if len(successful_points):
+        iterations_list = successful_points['iterations']
+        distances_list = successful_points['distance']
+        
+        print(f"• Iteraciones promedio: {np.mean(iterations_list):.1f}")
+        print(f"• Rango de iteraciones: {iterations_list.min()} a {iterations_list.max()}")
+        print(f"• Distancia promedio: {np.mean(distances_list):.2f}")
+        
+        # Análisis por proximidad
+        close = distances_list < 1.5
+        
+        if close.any():
+            avg_close = np.mean(iterations_list[close])
+            print(f"• Puntos cercanos (<1.5): {close.sum()} puntos, {avg_close:.1f} iteraciones promedio")
+        
+        if (~close).any():
+            avg_far = np.mean(iterations_list[~close])
+            print(f"• Puntos lejanos (≥1.5): {(~close).sum()} puntos, {avg_far:.1f} iteraciones promedio")
+
+def calculate_consistent_statistics(step_results: ResultsTable, point_results: ResultsTable):
+    #Calcula estadísticas consistentes con lo mostrado en las tablas
+    print("\n" + "="*90)
+    print("RESUMEN ESTADÍSTICO")
+    print("="*90)
+    
+    # Usar SOLO los datos que se marcaron como exitosos en las tablas
+    all_results = ResultsTable.concat(step_results, point_results)
+    all_successful = all_results[all_results['successful']]
+    
+    if len(all_successful):
+        all_iterations = all_successful['iterations']
+        all_errors = np.abs(all_successful['error'])
+        
+        total_tests = len(all_results)
+        successful_tests = len(all_successful)
+        
+        print(f"Total de pruebas ejecutadas: {total_tests}")
+        print(f"Pruebas exitosas: {successful_tests}")
+        print(f"Tasa de éxito global: {successful_tests/total_tests*100:.1f}%")
+        print(f"Iteraciones promedio: {np.mean(all_iterations):.1f}")
+        print(f"Iteraciones mínimas: {np.min(all_iterations)}")
+        print(f"Iteraciones máximas: {np.max(all_iterations)}")
+        print(f"Error promedio: {np.mean(all_errors):.2e}")
+        print(f"Desviación estándar iteraciones: {np.std(all_iterations):.1f}")
+    else:
+        print("No hubo convergencia en ninguna prueba")
+
+def _successful_steps(step_results: ResultsTable) -> ResultsTable:
+    # Ejecuciones exitosas del barrido de α; en barridos grandes, un representante
+    # por celda de densidad, ordenados por α para que la línea tenga sentido
+    successful_step = step_results[step_results['successful']]
+    shown, _ = thin_scatter(successful_step['param'], successful_step['iterations'])
+    if len(shown) < len(successful_step):
+        shown = shown[np.argsort(successful_step['param'][shown], kind='stable')]
+    return successful_step[shown]
+
+def _plot_iterations_vs_step(ax, step_results: ResultsTable):
+    # Gráfica 1: Iteraciones vs Tamaño de Paso
+    successful_step = _successful_steps(step_results)
+    
+    if len(successful_step):
+        alphas = successful_step['param']
+        iterations_step = successful_step['iterations']
+        
+        colors = np.select([iterations_step <= 20, iterations_step <= 50], ['green', 'orange'], 'red')
+        
+        ax.scatter(alphas, iterations_step, c=colors, s=100, alpha=0.7)
+        ax.plot(alphas, iterations_step, 'b--', alpha=0.5)
+        ax.set_xlabel('Tamaño de Paso (α)')
+        ax.set_ylabel('Iteraciones')
+        ax.set_title('Iteraciones vs Tamaño de Paso')
+        ax.grid(True, alpha=0.3)
+        
+        # Añadir anotaciones para los puntos
+        if len(successful_step) <= MAX_ANNOTATIONS:
+            for alpha, iter_count in zip(alphas, iterations_step):
+                ax.annotate(f'{iter_count}', (alpha, iter_count), 
+                            textcoords="offset points", xytext=(0,10), ha='center', fontsize=9)
+    else:
+        ax.text(0.5, 0.5, 'No hay datos exitosos\npara mostrar', 
+                ha='center', va='center', transform=ax.transAxes, fontsize=12)
+        ax.set_title('Iteraciones vs Tamaño de Paso (Sin datos)')
+
+def _plot_error_vs_step(ax, step_results: ResultsTable):
+    # Gráfica 2: Error vs Tamaño de Paso
+    successful_step = _successful_steps(step_results)
+    
+    if len(successful_step):
+        alphas = successful_step['param']
+        iterations_step = successful_step['iterations']
+        errors_step = np.abs(successful_step['error'])
+        colors = np.select([iterations_step <= 20, iterations_step <= 50], ['green', 'orange'], 'red')
+        
+        ax.scatter(alphas, errors_step, c=colors, s=100, alpha=0.7)
+        ax.plot(alphas, errors_step, 'r--', alpha=0.5)
+        ax.set_xlabel('Tamaño de Paso (α)')
+        ax.set_ylabel('Error Absoluto')
+        ax.set_title('Error vs Tamaño de Paso')
+        ax.set_yscale('log')
+        ax.grid(True, alpha=0.3)
+    else:
+        ax.text(0.5, 0.5, 'No hay datos exitosos\npara mostrar', 
+                ha='center', va='center', transform=ax.transAxes, fontsize=12)
+        ax.set_title('Error vs Tamaño de Paso (Sin datos)')
+
+def _plot_iterations_vs_distance(ax, point_results: ResultsTable):
+    # Gráfica 3: Iteraciones vs Distancia Inicial
+    from matplotlib.patches import Patch
+    successful_points = point_results[point_results['successful']]
+    
+    if len(successful_points):
+        # En barridos grandes se dibuja un representante por celda de densidad
+        shown, _ = thin_scatter(successful_points['distance'], successful_points['iterations'])
+        successful_points = successful_points[shown]
+        distances = successful_points['distance']
+        iterations_points = successful_points['iterations']
+        
+        # Colores basados en la evaluación (mismos umbrales que get_point_evaluation):
+        # Muy rápido/Excelente (≤18), Óptimo (≤25), Bueno/Aceptable (>25)
+        eval_colors = np.select([iterations_points <= 18, iterations_points <= 25],
+                                ['green', 'red'], 'orange')
+        
+        ax.scatter(distances, iterations_points, c=eval_colors, s=100, alpha=0.7)
+        ax.set_xlabel('Distancia al Óptimo')
+        ax.set_ylabel('Iteraciones')
+        ax.set_title('Iteraciones vs Distancia Inicial')
+        ax.grid(True, alpha=0.3)
+        
+        # Añadir anotaciones para los puntos
+        if len(successful_points) <= MAX_ANNOTATIONS:
+            points = successful_points.points()
+            for dist, iter_count, point in zip(distances, iterations_points, points):
+                ax.annotate(f'({point[0]},{point[1]})', (dist, iter_count), 
+                            textcoords="offset points", xytext=(0,10), ha='center', fontsize=8)
+        
+        # Añadir leyenda para colores
+        legend_elements = [
+            Patch(facecolor='green', label='Excelente/Muy rápido'),
+            Patch(facecolor='orange', label='Aceptable/Bueno'),
+            Patch(facecolor='red', label='Lento/Inestable')
+        ]
+        ax.legend(handles=legend_elements, loc='best')
+    else:
+        ax.text(0.5, 0.5, 'No hay datos exitosos\npara mostrar', 
+                ha='center', va='center', transform=ax.transAxes, fontsize=12)
+        ax.set_title('Iteraciones vs Distancia Inicial (Sin datos)')
+
+def _plot_convergence_map(ax, point_results: ResultsTable, draft: bool = False):
+    # Gráfica 4: Mapa de Convergencia
+    from matplotlib.collections import LineCollection
+    successful_points = point_results[point_results['successful']]
+    
+    if len(successful_points):
+        # Malla para el fondo de la función (desde la caché de landscape)
+        x, y, Z = landscape_grid((-3.0, 3.0), 64 if draft else 100)
+        
+        # Contornos de la función
+        contour = ax.contour(x, y, Z, levels=20, alpha=0.6)
+        ax.clabel(contour, inline=True, fontsize=8)
+        
+        # Puntos iniciales y finales (las tablas guardan el punto final de cada
+        # ejecución); en barridos grandes, un representante por celda de densidad
+        shown, _ = thin_scatter(successful_points['x0'], successful_points['y0'])
+        initial_x, initial_y = successful_points['x0'][shown], successful_points['y0'][shown]
+        final_x, final_y = successful_points['x_final'][shown], successful_points['y_final'][shown]
+        
+        # Dibujar puntos iniciales y finales
+        ax.scatter(initial_x, initial_y, c='blue', s=50, alpha=0.7, label='Inicio')
+        ax.scatter(final_x, final_y, c='red', s=50, alpha=0.7, label='Final')
+        ax.scatter(0, 0, c='green', s=100, marker='*', label='Óptimo Global')
+        
+        # Dibujar líneas de trayectoria (aproximadas), todas en una sola colección
+        # y, en barridos grandes, sólo una de cada `stride`
+        stride = max(1, len(initial_x) // MAX_SEGMENTS)
+        segments = np.stack([np.column_stack([initial_x[::stride], initial_y[::stride]]),
+                             np.column_stack([final_x[::stride], final_y[::stride]])], axis=1)
+        ax.add_collection(LineCollection(segments, colors='k', linestyles='--', alpha=0.3, linewidths=0.5))
+        
+        ax.set_xlabel('Coordenada X')
+        ax.set_ylabel('Coordenada Y')
+        ax.set_title('Mapa de Convergencia - Trayectorias')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+    else:
+        ax.text(0.5, 0.5, 'No hay datos exitosos\npara mostrar', 
+                ha='center', va='center', transform=ax.transAxes, fontsize=12)
+        ax.set_title('Mapa de Convergencia (Sin datos)')
+
+def plot_results(step_results: ResultsTable, point_results: ResultsTable, draft: bool = False,
+                 panels_dir: str = None, workers: int = None):
+    #Genera gráficas para visualizar los resultados de las pruebas
+    #- draft=True: baja resolución (DRAFT_DPI) y malla de contornos más gruesa
+    #- panels_dir: en lugar de la figura conjunta, guarda cada panel en su propio
+    #  archivo de ese directorio, dibujándolos en paralelo (ver plotting.render_panels)
+    #matplotlib se importa aquí, sólo cuando se generan figuras
+    dpi = DRAFT_DPI if draft else DPI
+    panels = [
+        ('iteraciones_vs_paso', _plot_iterations_vs_step, (step_results,)),
+        ('error_vs_paso', _plot_error_vs_step, (step_results,)),
+        ('iteraciones_vs_distancia', _plot_iterations_vs_distance, (point_results,)),
+        ('mapa_convergencia', _plot_convergence_map, (point_results, draft))
+    ]
+    
+    print("\n" + "="*90)
+    print("GENERANDO GRÁFICAS DE RESULTADOS")
+    print("="*90)
+    
+    if panels_dir is not None:
+        paths = render_panels(panels, panels_dir, dpi, workers)
+        print(f"Paneles guardados en '{panels_dir}' ({len(paths)} archivos)")
+        return
+    
+    plt = pyplot()
+    
+    # Crear figura con subgráficas
+    fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+    fig.suptitle('Análisis Visual del Método de Máximo Descenso', fontsize=16, fontweight='bold')
+    for ax, (_, draw, args) in zip(axes.flat, panels):
+        draw(ax, *args)
+    
+    plt.tight_layout()
+    # La figura se guarda junto a este módulo, sin depender del directorio de trabajo
+    plt.savefig(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'analisis_maximo_descenso.png'),
+                dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    
+    print("Gráficas generadas y guardadas como 'analisis_maximo_descenso.png'")
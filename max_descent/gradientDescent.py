@@ -0,0 +1,350 @@
+import math
+import time
+import numpy as np
+from typing import List, Tuple, Dict, Iterator
+
+from objective import f, grad_f, value_grad_hess, value_grad_scalar, PlanarObjective
+from line_search import armijo_backtracking, wolfe_line_search
+from solve_cache import cached_solver
+from trajectory import TrajectoryRecorder
+from instrumentation import SolveResult, SolveStats, InstrumentedObjective, timed
+
+# Reglas de tamaño de paso disponibles en gradient_descent(..., step=...)
+STEP_RULES = ('fixed', 'armijo', 'wolfe', 'bb')
+
+# Objetivo 2D con la interfaz n-dimensional (value_grad / hessvec)
+PLANAR = PlanarObjective()
+
+# Campos de la trayectoria con record=True (precedidos de x, y si n = 2)
+RECORD_FIELDS = ('f', 'grad_norm', 'step_size', 'step_norm')
+
+class DescentState:
+    #Estado ligero que se entrega en cada iteración de iter_gradient_descent_nd
+    #x, f y grad son los del nuevo iterado; grad_norm es ||∇f|| en el punto
+    #desde el que se dio el paso, step_size el tamaño de paso usado y
+    #step_norm la norma del paso
+    __slots__ = ('iteration', 'x', 'f', 'grad', 'grad_norm', 'step_size',
+                 'step_norm', 'converged', 'diverged')
+    
+    def __init__(self, iteration, x, f, grad, grad_norm, step_size, step_norm,
+                 converged, diverged):
+        self.iteration = iteration
+        self.x = x
+        self.f = f
+        self.grad = grad
+        self.grad_norm = grad_norm
+        self.step_size = step_size
+        self.step_norm = step_norm
+        self.converged = converged
+        self.diverged = diverged
+
+def iter_gradient_descent_nd(objective, x0: np.ndarray, alpha: float = 0.5,
+                             max_iter: int = 1000, tol: float = 1e-6,
+                             step: str = 'fixed') -> Iterator[DescentState]:
+    #Método de Máximo Descenso sobre un vector de estado de dimensión n, como
+    #generador: entrega un DescentState por iteración y termina al converger,
+    #al divergir o tras max_iter iteraciones. Quien lo consume puede detenerse
+    #antes sin que se guarde la trayectoria completa
+    #`objective` debe ofrecer value_grad(x); la memoria por iteración es O(n)
+    #`step` elige el tamaño de paso:
+    #- 'fixed': paso constante α
+    #- 'armijo': retroceso de Armijo empezando en α (luego en el doble del último paso)
+    #- 'wolfe': búsqueda lineal con condiciones fuertes de Wolfe empezando en α
+    #- 'bb': paso espectral de Barzilai–Borwein (α sólo en la primera iteración)
+    #Los puntos de prueba se evalúan con el núcleo fusionado, así el valor y el
+    #gradiente del punto aceptado se reutilizan en la siguiente iteración
+    if step not in STEP_RULES:
+        raise ValueError(f"Regla de tamaño de paso desconocida: {step!r}")
+    
+    value_grad = objective.value_grad
+    z = np.array(x0, dtype=float)
+    current_f, g = value_grad(z)
+    t = alpha
+    
+    for i in range(max_iter):
+        p = -g
+        if step == 'armijo':
+            t, f_new, g_new, _ = armijo_backtracking(value_grad, z, current_f, g, p,
+                                                     t0=alpha if i == 0 else 2.0 * t)
+            z_new = z + t * p
+        elif step == 'wolfe':
+            t, f_new, g_new, _ = wolfe_line_search(value_grad, z, current_f, g, p, t0=alpha)
+            z_new = z + t * p
+        else:
+            # Paso fijo o espectral: una sola evaluación fusionada en el nuevo punto
+            z_new = z + t * p
+            f_new, g_new = value_grad(z_new)
+        
+        s = z_new - z
+        change = np.linalg.norm(s)
+        
+        # Criterio de convergencia mejorado
+        converged = change < tol
+        # Detectar verdadera divergencia (valores extremos)
+        diverged = not converged and (np.max(np.abs(z_new)) > 1e10 or np.isnan(f_new)
+                                      or f_new > 1e10)
+        
+        yield DescentState(i + 1, z_new, f_new, g_new, np.linalg.norm(g), t, change,
+                           converged, diverged)
+        if converged or diverged:
+            return
+        
+        if step == 'bb':
+            sy = s @ (g_new - g)
+            t = (s @ s) / sy if sy > 0 else alpha
+        
+        z, current_f, g = z_new, f_new, g_new
+
+def iter_gradient_descent(x0: float, y0: float, alpha: float = 0.5,
+                          max_iter: int = 1000, tol: float = 1e-6,
+                          step: str = 'fixed') -> Iterator[DescentState]:
+    #Generador del Método de Máximo Descenso para f(x, y); state.x es (x, y)
+    return iter_gradient_descent_nd(PLANAR, [x0, y0], alpha, max_iter, tol, step)
+
+def gradient_descent_nd(objective, x0: np.ndarray, alpha: float = 0.5,
+                        max_iter: int = 1000, tol: float = 1e-6,
+                        step: str = 'fixed', record: bool = False,
+                        instrument: bool = False) -> tuple:
+    #Consume iter_gradient_descent_nd hasta el final y devuelve el último estado
+    #Con record=True se devuelve además la trayectoria (ver trajectory): por
+    #iteración f, ||∇f||, tamaño de paso y norma del paso (y x, y si n = 2)
+    #Con instrument=True devuelve un SolveResult (ver instrumentation) con las
+    #evaluaciones del objetivo y el tiempo dentro y fuera de él
+    planar = np.size(x0) == 2
+    if instrument:
+        objective = InstrumentedObjective(objective)
+        start = time.perf_counter()
+    if record:
+        recorder = TrajectoryRecorder((('x', 'y') if planar else ()) + RECORD_FIELDS)
+    
+    for state in iter_gradient_descent_nd(objective, x0, alpha, max_iter, tol, step):
+        if record:
+            row = (state.f, state.grad_norm, state.step_size, state.step_norm)
+            recorder.append(*((state.x[0], state.x[1]) + row if planar else row))
+    
+    result = (state.x, state.f, state.iteration, state.converged)
+    if record:
+        result += (recorder.history(),)
+    if instrument:
+        stats = SolveStats(solves=1, converged=int(state.converged), iterations=state.iteration,
+                           f_evals=objective.counts['f'], grad_evals=objective.counts['grad'],
+                           objective_time=objective.timings['objective'],
+                           total_time=time.perf_counter() - start)
+        return SolveResult(result, stats)
+    return result
+
+def _gradient_descent_fixed(x0: float, y0: float, alpha: float, max_iter: int, tol: float,
+                            recorder: TrajectoryRecorder = None,
+                            evaluate=value_grad_scalar) -> Tuple[float, float, float, int, bool]:
+    #Bucle de gradient_descent con paso fijo: mismo algoritmo que
+    #iter_gradient_descent_nd, pero con floats de Python y el núcleo escalar
+    #fusionado, sin arreglos, generador ni objetos de estado por iteración
+    #Si se pasa `recorder` se le añade una fila por iteración (x, y, f, ||∇f||,
+    #tamaño de paso y norma del paso); `evaluate` permite envolver el núcleo
+    #para contarlo y cronometrarlo (instrument=True)
+    x, y = float(x0), float(y0)
+    current_f, gx, gy = evaluate(x, y)
+    converged = False
+    
+    for i in range(max_iter):
+        x_new = x - alpha * gx
+        y_new = y - alpha * gy
+        f_new, gx_new, gy_new = evaluate(x_new, y_new)
+        
+        dx, dy = x_new - x, y_new - y
+        change = math.sqrt(dx * dx + dy * dy)
+        if recorder is not None:
+            recorder.append(x_new, y_new, f_new, math.sqrt(gx * gx + gy * gy), alpha, change)
+        x, y, current_f, gx, gy = x_new, y_new, f_new, gx_new, gy_new
+        
+        # Criterio de convergencia mejorado
+        if change < tol:
+            converged = True
+            break
+        
+        # Detectar verdadera divergencia (valores extremos)
+        if (abs(x) > 1e10 or abs(y) > 1e10 or math.isnan(current_f) or
+            current_f > 1e10):
+            break
+    
+    return x, y, current_f, i + 1, converged
+
+def gradient_descent(x0: float, y0: float, alpha: float = 0.5, 
+                   max_iter: int = 1000, tol: float = 1e-6,
+                   step: str = 'fixed', record: bool = False,
+                   instrument: bool = False) -> tuple:
+    #Implementación del Método de Máximo Descenso para f(x, y)
+    #Con paso fijo usa el bucle escalar _gradient_descent_fixed (también al
+    #registrar o instrumentar); las demás reglas de paso son gradient_descent_nd
+    #sobre el objetivo 2D (ver allí las reglas)
+    #Con record=True devuelve un sexto elemento con la trayectoria y con
+    #instrument=True un SolveResult con las estadísticas en `stats`
+    if step != 'fixed':
+        result = gradient_descent_nd(PLANAR, [x0, y0], alpha, max_iter, tol, step, record, instrument)
+        z, final_f, iterations, converged, *history = result
+        values = (z[0], z[1], final_f, iterations, converged, *history)
+        return SolveResult(values, result.stats) if instrument else values
+    
+    recorder = TrajectoryRecorder(('x', 'y') + RECORD_FIELDS) if record else None
+    evaluate = value_grad_scalar
+    if instrument:
+        timings = {}
+        evaluate = timed(evaluate, timings, 'objective')
+        start = time.perf_counter()
+    
+    values = _gradient_descent_fixed(x0, y0, alpha, max_iter, tol, recorder, evaluate)
+    if record:
+        values += (recorder.history(),)
+    if instrument:
+        # Una evaluación fusionada (f y ∇f) en el punto inicial y otra por iteración
+        evals = values[3] + 1
+        stats = SolveStats(solves=1, converged=int(values[4]), iterations=values[3],
+                           f_evals=evals, grad_evals=evals, objective_time=timings['objective'],
+                           total_time=time.perf_counter() - start)
+        return SolveResult(values, stats)
+    return values
+
+# gradient_descent con memoización de resultados (ver solve_cache)
+gradient_descent_cached = cached_solver('gradient_descent', gradient_descent)
+
+def gradient_descent_batch(X0: np.ndarray, Y0: np.ndarray, alpha: float = 0.5,
+                           max_iter: int = 1000, tol: float = 1e-6
+                           ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    #Versión vectorizada del Método de Máximo Descenso sobre muchos puntos iniciales
+    #Cada punto avanza igual que en gradient_descent y se congela en cuanto
+    #converge o diverge; sólo los puntos activos se siguen evaluando
+    #Con puntos iniciales escalares el resultado también es escalar
+    X0, Y0 = np.broadcast_arrays(np.asarray(X0, dtype=float), np.asarray(Y0, dtype=float))
+    shape = X0.shape
+    x = X0.ravel().copy()
+    y = Y0.ravel().copy()
+    
+    iterations = np.full(x.size, max_iter, dtype=int)
+    converged = np.zeros(x.size, dtype=bool)
+    active = np.arange(x.size)
+    
+    f_val, g = value_grad_hess(x, y, need=('f', 'grad'))
+    gx, gy = g[0], g[1]
+    
+    for i in range(max_iter):
+        if active.size == 0:
+            break
+        
+        xa, ya = x[active], y[active]
+        x_new = xa - alpha * gx
+        y_new = ya - alpha * gy
+        
+        change = np.hypot(x_new - xa, y_new - ya)
+        current_f, g = value_grad_hess(x_new, y_new, need=('f', 'grad'))
+        gx, gy = g[0], g[1]
+        x[active], y[active], f_val[active] = x_new, y_new, current_f
+        
+        # Máscaras por punto: convergencia y verdadera divergencia
+        done = change < tol
+        diverged = ((np.abs(x_new) > 1e10) | (np.abs(y_new) > 1e10) |
+                    np.isnan(current_f) | (current_f > 1e10))
+        stop = done | diverged
+        
+        converged[active[done]] = True
+        iterations[active[stop]] = i + 1
+        active = active[~stop]
+        gx, gy = gx[~stop], gy[~stop]
+    
+    result = (x.reshape(shape), y.reshape(shape), f_val.reshape(shape),
+              iterations.reshape(shape), converged.reshape(shape))
+    if shape == ():
+        return tuple(r[()] for r in result)
+    return result
+
+def _accelerated_descent(X0, Y0, alpha: float, max_iter: int, tol: float, method: str,
+                         beta: float = 0.5, beta2: float = 0.999, eps: float = 1e-8) -> tuple:
+    #Motor común de las variantes con momento ('heavy_ball', 'nesterov', 'adam')
+    #Trabaja sobre arreglos de puntos iniciales con las mismas máscaras de
+    #convergencia/divergencia que gradient_descent_batch; si la entrada es escalar
+    #el resultado también lo es
+    X0, Y0 = np.broadcast_arrays(np.asarray(X0, dtype=float), np.asarray(Y0, dtype=float))
+    shape = X0.shape
+    x = X0.ravel().copy()
+    y = Y0.ravel().copy()
+    
+    # Salvo Nesterov, que necesita el gradiente en el punto adelantado, el
+    # gradiente del nuevo punto sale de la misma evaluación fusionada que su
+    # valor y se reutiliza en la iteración siguiente
+    lookahead = method == 'nesterov'
+    if lookahead:
+        f_val = f(x, y)
+    else:
+        f_val, (gx, gy) = value_grad_hess(x, y, need=('f', 'grad'))
+    
+    iterations = np.full(x.size, max_iter, dtype=int)
+    converged = np.zeros(x.size, dtype=bool)
+    active = np.arange(x.size)
+    
+    # Estado propio de cada punto activo: velocidad (o primer momento) y segundo momento
+    vx, vy = np.zeros(x.size), np.zeros(x.size)
+    sx, sy = np.zeros(x.size), np.zeros(x.size)
+    
+    for i in range(max_iter):
+        if active.size == 0:
+            break
+        
+        xa, ya = x[active], y[active]
+        if method == 'heavy_ball':
+            vx, vy = beta * vx - alpha * gx, beta * vy - alpha * gy
+            step_x, step_y = vx, vy
+        elif method == 'nesterov':
+            # Gradiente en el punto adelantado x + βv
+            gx, gy = grad_f(xa + beta * vx, ya + beta * vy)
+            vx, vy = beta * vx - alpha * gx, beta * vy - alpha * gy
+            step_x, step_y = vx, vy
+        else:
+            vx, vy = beta * vx + (1 - beta) * gx, beta * vy + (1 - beta) * gy
+            sx, sy = beta2 * sx + (1 - beta2) * gx**2, beta2 * sy + (1 - beta2) * gy**2
+            bias1, bias2 = 1 - beta**(i + 1), 1 - beta2**(i + 1)
+            step_x = -alpha * (vx / bias1) / (np.sqrt(sx / bias2) + eps)
+            step_y = -alpha * (vy / bias1) / (np.sqrt(sy / bias2) + eps)
+        
+        x_new, y_new = xa + step_x, ya + step_y
+        change = np.hypot(x_new - xa, y_new - ya)
+        if lookahead:
+            current_f = f(x_new, y_new)
+        else:
+            current_f, (gx, gy) = value_grad_hess(x_new, y_new, need=('f', 'grad'))
+        x[active], y[active], f_val[active] = x_new, y_new, current_f
+        
+        done = change < tol
+        diverged = ((np.abs(x_new) > 1e10) | (np.abs(y_new) > 1e10) |
+                    np.isnan(current_f) | (current_f > 1e10))
+        stop = done | diverged
+        
+        converged[active[done]] = True
+        iterations[active[stop]] = i + 1
+        active = active[~stop]
+        vx, vy, sx, sy = vx[~stop], vy[~stop], sx[~stop], sy[~stop]
+        if not lookahead:
+            gx, gy = gx[~stop], gy[~stop]
+    
+    result = (x.reshape(shape), y.reshape(shape), f_val.reshape(shape),
+              iterations.reshape(shape), converged.reshape(shape))
+    if shape == ():
+        return tuple(r[()] for r in result)
+    return result
+
+def heavy_ball(x0, y0, alpha: float = 0.05, max_iter: int = 1000, tol: float = 1e-6,
+               beta: float = 0.5) -> tuple:
+    #Máximo descenso con momento de bola pesada (Polyak): v ← βv - α∇f(x), x ← x + v
+    return _accelerated_descent(x0, y0, alpha, max_iter, tol, 'heavy_ball', beta=beta)
+
+def nesterov(x0, y0, alpha: float = 0.05, max_iter: int = 1000, tol: float = 1e-6,
+             beta: float = 0.5) -> tuple:
+    #Gradiente acelerado de Nesterov: el gradiente se evalúa en el punto adelantado x + βv
+    return _accelerated_descent(x0, y0, alpha, max_iter, tol, 'nesterov', beta=beta)
+
+def adam(x0, y0, alpha: float = 0.5, max_iter: int = 1000, tol: float = 1e-6,
+         beta1: float = 0.9, beta2: float = 0.999, eps: float = 1e-8) -> tuple:
+    #Variante adaptativa tipo Adam: paso por coordenada escalado con los momentos
+    #primero y segundo del gradiente (con corrección de sesgo)
+    #Cada coordenada avanza a lo sumo ≈ α por iteración, de ahí el α por defecto
+    #mayor que el de las variantes con momento
+    return _accelerated_descent(x0, y0, alpha, max_iter, tol, 'adam',
+                                beta=beta1, beta2=beta2, eps=eps)
@@ -0,0 +1,37 @@
+# Uso (desde la raíz del repositorio): python -m max_descent.main [--headless] [--draft] [--panels DIR]
+import argparse
+from .test1 import run_step_size_experiment, run_step_rules_experiment
+from .test2 import run_initial_points_experiment, run_accelerated_methods_experiment
+from .analysis import display_consistent_analysis, calculate_consistent_statistics, plot_results
+
+def main(headless: bool = False, draft: bool = False, panels_dir: str = None):
+    #Función principal; con headless=True no se generan gráficas
+    #draft y panels_dir se pasan a plot_results (borrador de baja resolución,
+    #paneles en archivos separados dibujados en paralelo)
+    print("MÉTODO DE MÁXIMO DESCENSO - ANÁLISIS")
+    print("Función: f(x,y) = x² + y² - 0.12cos(3πx)cos(4πy) + 0.3")
+    print("Mínimo global teórico: f(0,0) = 0.18")
+    
+    # Ejecutar pruebas
+    step_results = run_step_size_experiment()
+    run_step_rules_experiment()
+    point_results = run_initial_points_experiment()
+    run_accelerated_methods_experiment()
+    
+    # Mostrar análisis CONSISTENTE con las tablas
+    display_consistent_analysis(step_results, point_results)
+    
+    # Calcular estadísticas CONSISTENTES con las tablas
+    calculate_consistent_statistics(step_results, point_results)
+    
+    # Generar gráficas
+    if not headless:
+        plot_results(step_results, point_results, draft=draft, panels_dir=panels_dir)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Método de Máximo Descenso - análisis")
+    parser.add_argument('--headless', action='store_true', help="no generar gráficas")
+    parser.add_argument('--draft', action='store_true', help="gráficas de borrador (baja resolución)")
+    parser.add_argument('--panels', metavar='DIR', help="guardar cada panel en DIR, en paralelo")
+    args = parser.parse_args()
+    main(args.headless, args.draft, args.panels)
\ No newline at end of file
@@ -0,0 +1,110 @@
+import numpy as np
+from .gradientDescent import gradient_descent
+from results_table import ResultsTable, GLOBAL_MIN, LOCAL_MIN, NOT_CONVERGED
+from utils import STEP_SIZES, is_successful_convergence, get_evaluation_status, format_error, classify_convergence
+
+def run_step_size_experiment() -> ResultsTable:
+    #Prueba 1: Ejecuta experimentos con diferentes tamaños de paso
+    print("\n" + "="*90)
+    print("PRUEBA 1: DIFERENTES TAMAÑOS DE PASO")
+    print("Punto inicial: (1.0, 1.0)")
+    print("="*90)
+    
+    step_sizes = STEP_SIZES
+    results = ResultsTable()
+    
+    # Encabezado de la tabla MODIFICADO
+    print("| {:<14} | {:<12} | {:<16} | {:<16} | {:<25} |".format(
+        "Tamaño Paso (α)", "Iteraciones", "f(x,y) final", "Error", "Estado (Tipo Convergencia)"))
+    print("|" + "-"*16 + "|" + "-"*14 + "|" + "-"*18 + "|" + "-"*18 + "|" + "-"*27 + "|")
+    
+    for alpha in step_sizes:
+        x_opt, y_opt, f_opt, iterations, converged = gradient_descent(1.0, 1.0, alpha)
+        error = f_opt - 0.18
+        
+        # Determinar éxito basado en el resultado final
+        successful = is_successful_convergence(f_opt, iterations)
+        
+        estado = get_evaluation_status(iterations, x_opt, y_opt, successful, converged)
+        
+        # Formatear salida
+        if not successful:
+            iterations_str = "-"
+            f_opt_str = "-"
+            error_formatted = "-"
+        else:
+            iterations_str = str(iterations)
+            f_opt_str = f"{f_opt:.6f}"
+            error_formatted = format_error(error)
+        
+        # Guardar resultados (el tipo de convergencia se guarda como código;
+        # las ejecuciones no exitosas cuentan como 'No convergió')
+        results.append(x0=1.0, y0=1.0, x_final=x_opt, y_final=y_opt, param=alpha,
+                       iterations=iterations, f_final=f_opt, error=error, distance=np.sqrt(2.0),
+                       successful=successful, converged=converged)
+        
+        # Imprimir fila ACTUALIZADA
+        print("| {:<14} | {:<12} | {:<16} | {:<16} | {:<25} |".format(
+            f"α={alpha}", iterations_str, f_opt_str, error_formatted, estado))
+    
+    print("\nCuadro 1: Resultados para diferentes tamaños de paso (punto inicial: (1,1))")
+    
+    # NUEVO: Análisis de tipos de convergencia
+    print("\n" + "="*90)
+    print("ANÁLISIS DE TIPOS DE CONVERGENCIA - PRUEBA 1")
+    print("="*90)
+    
+    counts = results.counts()
+    
+    print(f"Mínimo global: {counts[GLOBAL_MIN]}/{len(results)} casos")
+    if counts[GLOBAL_MIN]:
+        best_alpha = results[results.is_type(GLOBAL_MIN)].best()
+        print(f"  • Mejor α para global: {best_alpha['param']} ({best_alpha['iterations']} iteraciones)")
+    
+    print(f"Mínimo local: {counts[LOCAL_MIN]}/{len(results)} casos")
+    if counts[LOCAL_MIN]:
+        local_alphas = results[results.is_type(LOCAL_MIN)]['param'].tolist()
+        print(f"  • α que convergen a local: {local_alphas}")
+    
+    print(f"No convergió: {counts[NOT_CONVERGED]}/{len(results)} casos")
+    
+    return results
+
+def run_step_rules_experiment() -> ResultsTable:
+    #Comparación de reglas de tamaño de paso para los mismos α de la Prueba 1
+    print("\n" + "="*90)
+    print("COMPARACIÓN DE REGLAS DE TAMAÑO DE PASO")
+    print("Punto inicial: (1.0, 1.0)")
+    print("="*90)
+    
+    step_sizes = STEP_SIZES
+    step_rules = ['fixed', 'armijo', 'wolfe', 'bb']
+    results = ResultsTable(groups=step_rules)
+    
+    print("| {:<14} | {:<10} | {:<12} | {:<16} | {:<25} |".format(
+        "α inicial", "Regla", "Iteraciones", "f(x,y) final", "Tipo Convergencia"))
+    print("|" + "-"*16 + "|" + "-"*12 + "|" + "-"*14 + "|" + "-"*18 + "|" + "-"*27 + "|")
+    
+    for alpha in step_sizes:
+        for rule in step_rules:
+            x_opt, y_opt, f_opt, iterations, converged = gradient_descent(1.0, 1.0, alpha, step=rule)
+            results.append(group=rule, x0=1.0, y0=1.0, x_final=x_opt, y_final=y_opt, param=alpha,
+                           iterations=iterations, f_final=f_opt, error=f_opt - 0.18,
+                           converged=converged, successful=is_successful_convergence(f_opt, iterations))
+            
+            print("| {:<14} | {:<10} | {:<12} | {:<16} | {:<25} |".format(
+                f"α={alpha}", rule, iterations, f"{f_opt:.6f}", classify_convergence(x_opt, y_opt, converged)))
+    
+    print("\nCuadro 1B: Iteraciones por regla de tamaño de paso")
+    
+    print("\nPROMEDIOS POR REGLA:")
+    converged_runs = results[results['converged']]
+    counts = converged_runs.counts(by='group')
+    avg_iters = converged_runs.mean_by('iterations')
+    for code, rule in enumerate(step_rules):
+        if counts[code]:
+            print(f"• {rule}: {avg_iters[code]:.1f} iteraciones ({counts[code]}/{len(step_sizes)} convergen)")
+        else:
+            print(f"• {rule}: ninguna ejecución convergió")
+    
+    return results
@@ -0,0 +1,215 @@
+import numpy as np
+from typing import Dict
+from .gradientDescent import gradient_descent_cached, gradient_descent_batch, heavy_ball, nesterov, adam
+from results_table import ResultsTable, GLOBAL_MIN, LOCAL_MIN, NOT_CONVERGED
+from utils import NEAR_POINTS, FAR_POINTS, is_successful_convergence, get_point_evaluation, format_error, classify_convergence
+
+def run_initial_points_experiment() -> ResultsTable:
+    # Prueba 2: Ejecuta experimentos con diferentes puntos iniciales
+    print("\n" + "="*90)
+    print("PRUEBA 2: DIFERENTES PUNTOS INICIALES")
+    print("Tamaño de paso: α = 0.1")
+    print("="*90)
+    
+    # Sección 1: Puntos cercanos al óptimo teórico (0,0)
+    print("\n" + "="*70)
+    print("SECCIÓN 1: PUNTOS CERCANOS AL ÓPTIMO TEÓRICO (0,0)")
+    print("Rango: [-3, 3]²")
+    print("="*70)
+    
+    near_points = NEAR_POINTS
+    
+    # Una sola tabla para ambas secciones; la columna 'group' distingue cercanos y lejanos
+    results = ResultsTable(groups=('near', 'far'))
+    
+    # Encabezado de la tabla para puntos cercanos
+    print("| {:<18} | {:<12} | {:<12} | {:<16} | {:<15} |".format(
+        "Punto Inicial", "Distancia", "Iteraciones", "Error", "Evaluación"))
+    print("|" + "-"*20 + "|" + "-"*14 + "|" + "-"*14 + "|" + "-"*18 + "|" + "-"*17 + "|")
+    
+    for point in near_points:
+        x0, y0 = point
+        x_opt, y_opt, f_opt, iterations, converged = gradient_descent_cached(x0, y0, 0.1)
+        error = f_opt - 0.18
+        distance = np.sqrt(x0**2 + y0**2)
+        
+        # Determinar éxito basado en el resultado final
+        successful = is_successful_convergence(f_opt, iterations)
+        evaluation = get_point_evaluation(iterations, successful, x_opt, y_opt, converged)
+        
+        # Formatear salida
+        if not successful:
+            iterations_str = "-"
+            error_formatted = "-"
+        else:
+            iterations_str = str(iterations)
+            error_formatted = format_error(error)
+        
+        # Guardar resultados
+        results.append(group='near', x0=x0, y0=y0, x_final=x_opt, y_final=y_opt, iterations=iterations,
+                       f_final=f_opt, error=error, distance=distance, successful=successful,
+                       converged=converged)
+        
+        # Imprimir fila
+        point_str = f"({x0:.1f}, {y0:.1f})"
+        print("| {:<18} | {:<12.2f} | {:<12} | {:<16} | {:<15} |".format(
+            point_str, distance, iterations_str, error_formatted, evaluation))
+    
+    print("\nCuadro 2A: Resultados para puntos cercanos (α = 0,1)")
+
+    # Sección 2: Puntos lejanos en el rango [-100, 100]²
+    print("\n" + "="*70)
+    print("SECCIÓN 2: PUNTOS LEJANOS AL ÓPTIMO TEÓRICO (0,0)")
+    print("Rango: [-100, 100]²")
+    print("="*70)
+    
+    # 9 puntos lejanos distribuidos en diferentes cuadrantes
+    far_points = FAR_POINTS
+    
+    # Encabezado de la tabla para puntos lejanos
+    print("| {:<18} | {:<12} | {:<12} | {:<16} | {:<15} |".format(
+        "Punto Inicial", "Distancia", "Iteraciones", "Error", "Evaluación"))
+    print("|" + "-"*20 + "|" + "-"*14 + "|" + "-"*14 + "|" + "-"*18 + "|" + "-"*17 + "|")
+    
+    for point in far_points:
+        x0, y0 = point
+        x_opt, y_opt, f_opt, iterations, converged = gradient_descent_cached(x0, y0, 0.1)
+        error = f_opt - 0.18
+        distance = np.sqrt(x0**2 + y0**2)
+        
+        # Determinar éxito basado en el resultado final
+        successful = is_successful_convergence(f_opt, iterations)
+        evaluation = get_point_evaluation(iterations, successful, x_opt, y_opt, converged)
+        
+        # Formatear salida
+        if not successful:
+            iterations_str = "-"
+            error_formatted = "-"
+        else:
+            iterations_str = str(iterations)
+            error_formatted = format_error(error)
+        
+        # Guardar resultados
+        results.append(group='far', x0=x0, y0=y0, x_final=x_opt, y_final=y_opt, iterations=iterations,
+                       f_final=f_opt, error=error, distance=distance, successful=successful,
+                       converged=converged)
+        
+        # Imprimir fila
+        point_str = f"({x0:.1f}, {y0:.1f})"
+        print("| {:<18} | {:<12.2f} | {:<12} | {:<16} | {:<15} |".format(
+            point_str, distance, iterations_str, error_formatted, evaluation))
+    
+    print("\nCuadro 2B: Resultados para puntos lejanos (α = 0,1)")
+    
+    # Análisis comparativo entre secciones
+    print("\n" + "="*90)
+    print("ANÁLISIS COMPARATIVO ENTRE SECCIONES")
+    print("="*90)
+    
+    for section_name, section in [("PUNTOS CERCANOS", 'near'), ("PUNTOS LEJANOS", 'far')]:
+        section_results = results[results.is_group(section)]
+        counts = section_results.counts()
+        
+        print(f"\n{section_name}:")
+        print(f"  • Mínimo global: {counts[GLOBAL_MIN]}/{len(section_results)} casos")
+        print(f"  • Mínimo local: {counts[LOCAL_MIN]}/{len(section_results)} casos") 
+        print(f"  • No convergió: {counts[NOT_CONVERGED]}/{len(section_results)} casos")
+        
+        if counts[GLOBAL_MIN]:
+            avg_iterations = section_results.mean_by('iterations', by='convergence')[GLOBAL_MIN]
+            print(f"  • Iteraciones promedio (global): {avg_iterations:.1f}")
+        
+        if counts[LOCAL_MIN]:
+            local_points = section_results[section_results.is_type(LOCAL_MIN)].points()
+            print(f"  • Puntos que convergen a local: {local_points}")
+    
+    return results
+
+# Función adicional para análisis específico por tipo de punto
+def analyze_by_distance_category(results: ResultsTable):
+    """Analiza resultados por categoría de distancia"""
+    print("\n" + "="*90)
+    print("ANÁLISIS POR CATEGORÍA DE DISTANCIA")
+    print("="*90)
+    
+    for category_name, category in [("CERCANOS", 'near'), ("LEJANOS", 'far')]:
+        category_results = results[results.is_group(category)]
+        successful = category_results[category_results['successful']]
+        
+        if len(successful):
+            iterations = successful['iterations']
+            distances = successful['distance']
+            errors = np.abs(successful['error'])
+            
+            print(f"\n{category_name}:")
+            print(f"  • Tasa de éxito: {len(successful)}/{len(category_results)} ({len(successful)/len(category_results)*100:.1f}%)")
+            print(f"  • Iteraciones: {np.mean(iterations):.1f} ± {np.std(iterations):.1f}")
+            print(f"  • Distancia promedio: {np.mean(distances):.1f}")
+            print(f"  • Error promedio: {np.mean(errors):.2e}")
+        else:
+            print(f"\n{category_name}: No hubo convergencia exitosa")
+
+# Tamaño de paso de cada método en la comparación con momento. Adam escala el
+# paso de cada coordenada a ≈ α, así que desde puntos a ~100 unidades necesita
+# un α mucho mayor que los demás para llegar antes de max_iter
+ACCELERATED_STEP_SIZES = {
+    "Máximo descenso": 0.05,
+    "Bola pesada": 0.05,
+    "Nesterov": 0.05,
+    "Adam": 0.5
+}
+
+def run_accelerated_methods_experiment(step_sizes: Dict[str, float] = None) -> ResultsTable:
+    # Compara máximo descenso con sus variantes con momento en los puntos lejanos
+    # `step_sizes` asigna un α a cada método (por defecto ACCELERATED_STEP_SIZES)
+    step_sizes = {**ACCELERATED_STEP_SIZES, **(step_sizes or {})}
+    print("\n" + "="*90)
+    print("COMPARACIÓN DE VARIANTES CON MOMENTO - PUNTOS LEJANOS")
+    print("Tamaño de paso por método: " + ", ".join(f"{name} α = {alpha}" for name, alpha in step_sizes.items()))
+    print("="*90)
+    
+    far_points = FAR_POINTS
+    x0 = np.array([p[0] for p in far_points])
+    y0 = np.array([p[1] for p in far_points])
+    
+    methods = [
+        ("Máximo descenso", gradient_descent_batch),
+        ("Bola pesada", heavy_ball),
+        ("Nesterov", nesterov),
+        ("Adam", adam)
+    ]
+    method_names = tuple(name for name, _ in methods)
+    tables = []
+    
+    print("| {:<18} | {:<16} | {:<12} | {:<25} |".format(
+        "Punto Inicial", "Método", "Iteraciones", "Tipo Convergencia"))
+    print("|" + "-"*20 + "|" + "-"*18 + "|" + "-"*14 + "|" + "-"*27 + "|")
+    
+    for method_name, method in methods:
+        # Todos los puntos iniciales se resuelven en una sola llamada vectorizada
+        alpha = step_sizes[method_name]
+        x_opt, y_opt, f_opt, iterations, converged = method(x0, y0, alpha)
+        # ... y sus columnas pasan directamente a la tabla de resultados
+        table = ResultsTable.from_columns(
+            groups=method_names, x0=x0, y0=y0, x_final=x_opt, y_final=y_opt, param=alpha,
+            group=method_names.index(method_name), iterations=iterations, f_final=f_opt, error=f_opt - 0.18,
+            distance=np.sqrt(x0**2 + y0**2), converged=converged,
+            successful=is_successful_convergence(f_opt, iterations))
+        tables.append(table)
+        
+        for point, x_final, y_final, iter_count, conv in zip(far_points, x_opt, y_opt, iterations, converged):
+            print("| {:<18} | {:<16} | {:<12} | {:<25} |".format(
+                f"({point[0]:.1f}, {point[1]:.1f})", method_name, int(iter_count),
+                classify_convergence(x_final, y_final, conv)))
+    
+    results = ResultsTable.concat(*tables)
+    
+    print("\nPROMEDIOS POR MÉTODO:")
+    counts = results.counts(by='group')
+    global_counts = results[results.is_type(GLOBAL_MIN)].counts(by='group')
+    avg_iterations = results.mean_by('iterations')
+    for code, method_name in enumerate(method_names):
+        print(f"• {method_name} (α = {step_sizes[method_name]}): {avg_iterations[code]:.1f} iteraciones promedio, "
+              f"{global_counts[code]}/{counts[code]} al mínimo global")
+    
+    return results
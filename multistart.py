@@ -0,0 +1,140 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple, Dict
+
+from max_descent.gradientDescent import gradient_descent_batch, heavy_ball, nesterov, adam
+from trust_region.trustRegion import trust_region_batch
+from stationary_points import default_catalog, KINDS
+
+# Búsqueda global multiarranque sobre [-100, 100]²: genera los puntos iniciales,
+# los reparte en fragmentos entre procesos y cada proceso resuelve su fragmento
+# con los motores vectorizados. Después resume a dónde llegó cada arranque,
+# con las mismas etiquetas del catálogo de puntos estacionarios que basins.
+
+# Métodos disponibles (todos aceptan arreglos de puntos iniciales)
+METHODS = {
+    'gradient_descent': gradient_descent_batch,
+    'trust_region': trust_region_batch,
+    'heavy_ball': heavy_ball,
+    'nesterov': nesterov,
+    'adam': adam
+}
+
+DISTRIBUTIONS = ('grid', 'uniform', 'stratified')
+
+def generate_starts(n: int, distribution: str = 'uniform', bounds: Tuple[float, float] = (-100.0, 100.0),
+                    seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    #Genera los puntos iniciales en el cuadrado bounds²
+    #- 'grid': malla regular de ⌈√n⌉² puntos
+    #- 'uniform': n puntos uniformes
+    #- 'stratified': una muestra uniforme dentro de cada celda de una malla ⌈√n⌉²
+    low, high = bounds
+    rng = np.random.default_rng(seed)
+
+    if distribution == 'uniform':
+        return rng.uniform(low, high, n), rng.uniform(low, high, n)
+
+    side = int(np.ceil(np.sqrt(n)))
+    if distribution == 'grid':
+        axis = np.linspace(low, high, side)
+        X, Y = np.meshgrid(axis, axis)
+        return X.ravel(), Y.ravel()
+    if distribution == 'stratified':
+        cell = (high - low) / side
+        I, J = np.meshgrid(np.arange(side), np.arange(side))
+        X = low + (I.ravel() + rng.uniform(0, 1, side * side)) * cell
+        Y = low + (J.ravel() + rng.uniform(0, 1, side * side)) * cell
+        return X, Y
+
+    raise ValueError(f"Distribución de arranques desconocida: {distribution!r}")
+
+def _solve_shard(method: str, X0: np.ndarray, Y0: np.ndarray, params: Dict) -> tuple:
+    #Trabajo de cada proceso: resolver un fragmento de arranques en una sola llamada vectorizada
+    return METHODS[method](X0, Y0, **params)
+
+def run_multistart(method: str = 'gradient_descent', n: int = 100000, distribution: str = 'uniform',
+                   bounds: Tuple[float, float] = (-100.0, 100.0), seed: int = 0,
+                   params: Dict = None, workers: int = None, shards_per_worker: int = 4) -> Dict:
+    #Ejecuta `method` desde n arranques y devuelve los resultados por arranque
+    #Los arranques se parten en workers × shards_per_worker fragmentos contiguos
+    #para equilibrar la carga; con un solo proceso no se crea el pool
+    if method not in METHODS:
+        raise ValueError(f"Método desconocido: {method!r}")
+    params = params or {}
+    workers = workers or os.cpu_count() or 1
+
+    X0, Y0 = generate_starts(n, distribution, bounds, seed)
+
+    if workers == 1:
+        parts = [_solve_shard(method, X0, Y0, params)]
+    else:
+        shards = np.array_split(np.arange(X0.size), workers * shards_per_worker)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_solve_shard, method, X0[idx], Y0[idx], params)
+                       for idx in shards if idx.size]
+            parts = [future.result() for future in futures]
+
+    x, y, f_final, iterations, converged = (np.concatenate(column) for column in zip(*parts))
+    return {
+        'method': method,
+        'distribution': distribution,
+        'x0': X0, 'y0': Y0,
+        'x': x, 'y': y,
+        'f_final': f_final,
+        'iterations': iterations,
+        'converged': converged
+    }
+
+def basin_statistics(results: Dict, tol: float = 1e-3, bins: int = 20) -> Dict:
+    #Resume una ejecución multiarranque:
+    #- fracción de arranques que convergen al mínimo global (0,0)
+    #- puntos estacionarios distintos alcanzados, identificados con el catálogo
+    #  de stationary_points (un punto final a más de `tol` de todos no cuenta)
+    #- histograma de iteraciones
+    catalog = default_catalog()
+    labels = catalog.label(results['x'], results['y'], results['converged'], tol)
+    n = labels.size
+
+    counts = np.bincount(labels[labels >= 0], minlength=len(catalog))
+    reached = np.flatnonzero(counts)
+    reached = reached[np.argsort(-counts[reached], kind='stable')]
+
+    hist_counts, hist_edges = np.histogram(results['iterations'], bins=bins)
+
+    return {
+        'n_starts': n,
+        'converged_fraction': results['converged'].mean() if n else 0.0,
+        'global_fraction': (labels == catalog.global_index).mean() if n else 0.0,
+        'minima': catalog.points[reached],
+        'minima_kinds': catalog.kinds[reached],
+        'minima_counts': counts[reached],
+        'iteration_histogram': (hist_counts, hist_edges)
+    }
+
+def display_basin_statistics(stats: Dict, method: str, top: int = 10):
+    #Muestra el resumen de la búsqueda multiarranque
+    print("\n" + "="*90)
+    print(f"BÚSQUEDA MULTIARRANQUE - {method}")
+    print("="*90)
+    print(f"Arranques: {stats['n_starts']}")
+    print(f"Convergencia: {stats['converged_fraction']*100:.2f}%")
+    print(f"Mínimo global (0,0): {stats['global_fraction']*100:.2f}% de los arranques")
+    print(f"Puntos estacionarios distintos alcanzados: {len(stats['minima'])}")
+
+    print("\n| {:<28} | {:<8} | {:<12} |".format("Punto (x, y)", "Tipo", "Arranques"))
+    print("|" + "-"*30 + "|" + "-"*10 + "|" + "-"*14 + "|")
+    for (mx, my), kind, count in zip(stats['minima'][:top], stats['minima_kinds'][:top],
+                                     stats['minima_counts'][:top]):
+        print("| {:<28} | {:<8} | {:<12} |".format(f"({mx:.3f}, {my:.3f})", KINDS[kind], count))
+
+    counts, edges = stats['iteration_histogram']
+    print("\nHistograma de iteraciones:")
+    for count, low, high in zip(counts, edges[:-1], edges[1:]):
+        if count:
+            print(f"  [{low:7.1f}, {high:7.1f}): {count}")
+
+if __name__ == "__main__":
+    for method in ('gradient_descent', 'trust_region'):
+        results = run_multistart(method, n=100000, distribution='stratified')
+        display_basin_statistics(basin_statistics(results), method)
@@ -0,0 +1,193 @@
+import math
+import numpy as np
+from typing import Tuple
+
+# Función objetivo compartida por ambos métodos y por las gráficas:
+# f(x, y) = x² + y² - 0.12cos(3πx)cos(4πy) + 0.3
+# Mínimo global: f(0,0) = 0.18
+#
+# Todas las funciones aceptan escalares o arreglos de NumPy (se evalúan
+# elemento a elemento); el gradiente tiene forma (2, ...) y el Hessiano (2, 2, ...)
+
+A = 3 * np.pi
+B = 4 * np.pi
+
+# Coeficientes del gradiente y del Hessiano
+DX, DY = 0.36 * np.pi, 0.48 * np.pi
+DXX, DYY, DXY = 1.08 * np.pi**2, 1.92 * np.pi**2, 1.44 * np.pi**2
+
+def value_grad_hess(x, y, need: Tuple[str, ...] = ('f', 'grad', 'hess')) -> tuple:
+    #Núcleo fusionado: calcula cada término trigonométrico una sola vez y
+    #devuelve, en el orden pedido, sólo lo que indica `need` ('f', 'grad', 'hess')
+    #Con x, y escalares se usa math en lugar de ufuncs de NumPy
+    trig = math if isinstance(x, float) and isinstance(y, float) else np
+    need_grad = 'grad' in need or 'hess' in need
+    cx = trig.cos(A * x)
+    cy = trig.cos(B * y)
+    if need_grad:
+        sx = trig.sin(A * x)
+        sy = trig.sin(B * y)
+
+    out = []
+    for name in need:
+        if name == 'f':
+            out.append(x*x + y*y - 0.12 * cx * cy + 0.3)
+        elif name == 'grad':
+            out.append(np.array([2*x + DX * sx * cy, 2*y + DY * cx * sy]))
+        else:
+            cc = cx * cy
+            d2f_dxdy = -DXY * sx * sy
+            out.append(np.array([[2 + DXX * cc, d2f_dxdy], [d2f_dxdy, 2 + DYY * cc]]))
+    return tuple(out)
+
+def value_grad_scalar(x: float, y: float) -> Tuple[float, float, float]:
+    #Núcleo fusionado para un solo punto: (f, ∂f/∂x, ∂f/∂y) como floats de
+    #Python, sin arreglos; es el que usan los bucles escalares de los resolvedores
+    cx = math.cos(A * x)
+    cy = math.cos(B * y)
+    sx = math.sin(A * x)
+    sy = math.sin(B * y)
+    return x*x + y*y - 0.12 * cx * cy + 0.3, 2*x + DX * sx * cy, 2*y + DY * cx * sy
+
+def f(x, y):
+    #Valor de la función objetivo
+    return value_grad_hess(x, y, need=('f',))[0]
+
+def grad_f(x, y) -> np.ndarray:
+    #Gradiente de la función f(x,y)
+    return value_grad_hess(x, y, need=('grad',))[0]
+
+def hess_f(x, y) -> np.ndarray:
+    #Hessiano de la función f(x,y) (simétrico)
+    return value_grad_hess(x, y, need=('hess',))[0]
+
+# Interfaz de objetivo n-dimensional usada por los resolvedores *_nd:
+#   value(x) -> f(x)
+#   value_grad(x) -> (f(x), ∇f(x))       una sola evaluación fusionada
+#   hessvec(x, v) -> ∇²f(x) v             sin formar nunca la matriz n×n
+# x y v son vectores de longitud n; todo cuesta O(n) en tiempo y memoria
+# Un objetivo cuyo hessvec evalúa gradientes (FiniteDifferenceHessvec) los cuenta
+# en el atributo hessvec_grad_evals para que los resolvedores los sumen a sus
+# estadísticas
+
+class PlanarObjective:
+    #La función objetivo 2D de arriba expuesta con la interfaz n-dimensional
+    n = 2
+
+    def value(self, x: np.ndarray) -> float:
+        return f(x[0], x[1])
+
+    def value_grad(self, x: np.ndarray) -> Tuple[float, np.ndarray]:
+        return value_grad_hess(x[0], x[1], need=('f', 'grad'))
+
+    def hessvec(self, x: np.ndarray, v: np.ndarray) -> np.ndarray:
+        return hess_f(x[0], x[1]) @ v
+
+class OscillatingQuadratic:
+    #Generalización n-dimensional: f(x) = Σ x_i² - A·Π cos(k_i π x_i) + c
+    #Por defecto las frecuencias alternan 3, 4, 3, 4, ... y A = 0.12, c = 0.3,
+    #así que con n = 2 coincide con f(x, y). Mínimo global: f(0) = c - A
+    #Los productos Π_{j≠i} se calculan con productos prefijo/sufijo, sin dividir
+    #entre cosenos que pueden anularse
+    def __init__(self, n: int, amplitude: float = 0.12, offset: float = 0.3, freqs=None):
+        self.n = n
+        self.amplitude = amplitude
+        self.offset = offset
+        k = np.resize([3.0, 4.0], n) if freqs is None else np.asarray(freqs, dtype=float)
+        self.a = k * np.pi
+
+    def _exclusive_products(self, c: np.ndarray) -> np.ndarray:
+        #Π_{j≠i} c_j para cada i, en O(n)
+        prefix = np.empty_like(c)
+        prefix[0] = 1.0
+        np.cumprod(c[:-1], out=prefix[1:])
+        suffix = np.empty_like(c)
+        suffix[-1] = 1.0
+        np.cumprod(c[:0:-1], out=suffix[-2::-1])
+        return prefix * suffix
+
+    def value(self, x: np.ndarray) -> float:
+        return x @ x - self.amplitude * np.prod(np.cos(self.a * x)) + self.offset
+
+    def value_grad(self, x: np.ndarray) -> Tuple[float, np.ndarray]:
+        ax = self.a * x
+        c, s = np.cos(ax), np.sin(ax)
+        others = self._exclusive_products(c)
+        value = x @ x - self.amplitude * (c[0] * others[0]) + self.offset
+        grad = 2 * x + self.amplitude * self.a * s * others
+        return value, grad
+
+    def hessvec(self, x: np.ndarray, v: np.ndarray) -> np.ndarray:
+        #(Hv)_i = 2v_i + A a_i² P v_i - A a_i s_i Σ_{j≠i} a_j s_j v_j Π_{k≠i,j} c_k
+        #La suma cruzada es la parte ε del producto de números duales
+        #Π_{k≠i} (c_k + ε a_k s_k v_k), que se obtiene con prefijos/sufijos
+        ax = self.a * x
+        c, s = np.cos(ax), np.sin(ax)
+        w = self.a * s * v
+
+        pre_c, pre_e = np.ones_like(c), np.zeros_like(c)
+        suf_c, suf_e = np.ones_like(c), np.zeros_like(c)
+        inc_c, inc_e = _dual_cumprod(c, w)
+        pre_c[1:], pre_e[1:] = inc_c[:-1], inc_e[:-1]
+        inc_c, inc_e = _dual_cumprod(c[::-1], w[::-1])
+        suf_c[:-1], suf_e[:-1] = inc_c[-2::-1], inc_e[-2::-1]
+
+        product_all = pre_c[-1] * c[-1]
+        cross = pre_e * suf_c + pre_c * suf_e
+        return (2 * v + self.amplitude * self.a**2 * product_all * v
+                - self.amplitude * self.a * s * cross)
+
+def _dual_cumprod(c: np.ndarray, e: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    #Producto acumulado de los números duales c_k + ε e_k (ε² = 0), en O(n)
+    #Se parte el vector en ~√n bloques: el barrido dentro de cada bloque avanza
+    #todos los bloques a la vez y luego se propagan los acumulados entre bloques
+    n = c.size
+    B = max(1, int(np.sqrt(n)))
+    m = -(-n // B)
+    pad = m * B - n
+    C = np.concatenate([c, np.ones(pad)]).reshape(m, B).T.copy()
+    E = np.concatenate([e, np.zeros(pad)]).reshape(m, B).T.copy()
+    for j in range(1, B):
+        E[j] = E[j - 1] * C[j] + C[j - 1] * E[j]
+        C[j] *= C[j - 1]
+
+    carry_c, carry_e = np.ones(m), np.zeros(m)
+    for b in range(1, m):
+        carry_e[b] = carry_e[b - 1] * C[-1, b - 1] + carry_c[b - 1] * E[-1, b - 1]
+        carry_c[b] = carry_c[b - 1] * C[-1, b - 1]
+    E = carry_e * C + carry_c * E
+    C = carry_c * C
+    return C.T.ravel()[:n], E.T.ravel()[:n]
+
+class FiniteDifferenceHessvec:
+    #Envuelve un objetivo n-dimensional y reemplaza hessvec por una diferencia de
+    #gradientes: ∇²f(x)v ≈ (∇f(x + εv) - ∇f(x)) / ε
+    #El gradiente en x se guarda de la última llamada a value_grad, así que cada
+    #producto H·v cuesta una sola evaluación de gradiente; hessvec_grad_evals
+    #cuenta las evaluaciones hechas dentro de hessvec
+    def __init__(self, objective):
+        self.objective = objective
+        self.n = objective.n
+        self._x = None
+        self._g = None
+        self.hessvec_grad_evals = 0
+
+    def value(self, x: np.ndarray) -> float:
+        return self.objective.value(x)
+
+    def value_grad(self, x: np.ndarray) -> Tuple[float, np.ndarray]:
+        value, grad = self.objective.value_grad(x)
+        self._x, self._g = x.copy(), grad
+        return value, grad
+
+    def hessvec(self, x: np.ndarray, v: np.ndarray) -> np.ndarray:
+        if self._x is None or not np.array_equal(x, self._x):
+            self.value_grad(x)
+            self.hessvec_grad_evals += 1
+        v_norm = np.linalg.norm(v)
+        if v_norm == 0:
+            return np.zeros_like(v)
+        eps = np.sqrt(np.finfo(float).eps) * (1.0 + np.linalg.norm(x)) / v_norm
+        _, grad_shift = self.objective.value_grad(x + eps * v)
+        self.hessvec_grad_evals += 1
+        return (grad_shift - self._g) / eps
@@ -0,0 +1,124 @@
+# Punto único de acceso a matplotlib para las gráficas de análisis. Los módulos
+# de los resolvedores no dependen de matplotlib; quien grafica llama a pyplot()
+# dentro de la función que dibuja, así el costo de importarlo sólo se paga al
+# generar figuras. Se usa el backend Agg (sin pantalla): las figuras se guardan
+# en archivos, también en servidores sin display.
+#
+# También reúne lo necesario para figuras grandes: reducción de trayectorias
+# (Douglas–Peucker) y de nubes de puntos (por densidad) antes de dibujar, un
+# modo borrador de baja resolución y el dibujo de paneles en paralelo, cada uno
+# en su propio archivo.
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Tuple
+
+def pyplot():
+    #Devuelve matplotlib.pyplot con el backend Agg
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+# Resolución de las figuras: final para el informe y borrador para iterar rápido
+DPI = 300
+DRAFT_DPI = 72
+
+# Por encima de estos tamaños las nubes de puntos y las trayectorias se reducen
+# antes de dibujar, y las anotaciones por punto se omiten
+MAX_SCATTER = 5000
+MAX_TRAJECTORY = 1000
+MAX_SEGMENTS = 500
+MAX_ANNOTATIONS = 50
+
+def douglas_peucker(x: np.ndarray, y: np.ndarray, tolerance: float) -> np.ndarray:
+    #Índices de los vértices que conserva Douglas–Peucker: se quitan los puntos a
+    #menos de `tolerance` del segmento que une los extremos de su tramo
+    #Iterativo con una pila de tramos; cada tramo se procesa vectorizado
+    n = len(x)
+    if n < 3:
+        return np.arange(n)
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        dx, dy = x[end] - x[start], y[end] - y[start]
+        px, py = x[start + 1:end] - x[start], y[start + 1:end] - y[start]
+        length = np.hypot(dx, dy)
+        if length == 0:
+            distances = np.hypot(px, py)
+        else:
+            distances = np.abs(dx * py - dy * px) / length
+        k = int(np.argmax(distances))
+        if distances[k] > tolerance:
+            split = start + 1 + k
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return np.flatnonzero(keep)
+
+def decimate_trajectory(x, y, max_points: int = MAX_TRAJECTORY, log_y: bool = False,
+                        tolerance: float = 1e-3) -> np.ndarray:
+    #Índices de una versión reducida de la curva (x, y) para dibujarla
+    #Douglas–Peucker en coordenadas normalizadas al rango de cada eje (en log10
+    #si el eje es logarítmico), con `tolerance` como fracción del eje; si aún
+    #quedan más de max_points, se duplica la tolerancia hasta que quepan
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if len(x) <= max_points:
+        return np.arange(len(x))
+    if log_y:
+        y = np.log10(np.maximum(y, np.finfo(float).tiny))
+    u = (x - x.min()) / max(np.ptp(x), np.finfo(float).eps)
+    v = (y - y.min()) / max(np.ptp(y), np.finfo(float).eps)
+    indices = douglas_peucker(u, v, tolerance)
+    while len(indices) > max_points:
+        tolerance *= 2
+        indices = douglas_peucker(u, v, tolerance)
+    return indices
+
+def thin_scatter(x, y, max_points: int = MAX_SCATTER) -> Tuple[np.ndarray, np.ndarray]:
+    #Reduce una nube de puntos por densidad: divide el rango en bins × bins
+    #celdas (bins = ⌊√max_points⌋) y conserva un representante (el primero) de
+    #cada celda ocupada, así que nunca quedan más de max_points
+    #Devuelve (índices, puntos por celda); sin reducir si hay ≤ max_points
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if len(x) <= max_points:
+        return np.arange(len(x)), np.ones(len(x), dtype=int)
+    bins = int(np.sqrt(max_points))
+    i = np.minimum(((x - x.min()) / max(np.ptp(x), np.finfo(float).eps) * bins).astype(int), bins - 1)
+    j = np.minimum(((y - y.min()) / max(np.ptp(y), np.finfo(float).eps) * bins).astype(int), bins - 1)
+    _, first, counts = np.unique(i * bins + j, return_index=True, return_counts=True)
+    return first, counts
+
+def _render_panel(draw: Callable, args: tuple, path: str, dpi: int, figsize: Tuple[float, float]) -> str:
+    #Trabajo de cada proceso: dibuja un panel en su propia figura y la guarda
+    plt = pyplot()
+    fig, ax = plt.subplots(figsize=figsize)
+    draw(ax, *args)
+    fig.tight_layout()
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return path
+
+def render_panels(panels: List[Tuple[str, Callable, tuple]], directory: str, dpi: int = DPI,
+                  workers: int = None, figsize: Tuple[float, float] = (7.5, 6)) -> List[str]:
+    #Guarda cada panel (nombre, función de dibujo, argumentos) en <directory>/<nombre>.png
+    #Los paneles se dibujan en paralelo en un pool de procesos (backend Agg); la
+    #función de dibujo recibe el eje y los argumentos, y debe estar definida a
+    #nivel de módulo para poder enviarla a otro proceso
+    os.makedirs(directory, exist_ok=True)
+    paths = [os.path.join(directory, name + '.png') for name, _, _ in panels]
+    workers = min(workers or os.cpu_count() or 1, max(len(panels), 1))
+    if workers == 1:
+        return [_render_panel(draw, args, path, dpi, figsize)
+                for (_, draw, args), path in zip(panels, paths)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_render_panel, draw, args, path, dpi, figsize)
+                   for (_, draw, args), path in zip(panels, paths)]
+        return [future.result() for future in futures]
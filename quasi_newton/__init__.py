@@ -0,0 +1,3 @@
+# Métodos cuasi-Newton BFGS y L-BFGS. Los módulos compartidos (objective,
+# line_search) viven en la raíz del repositorio, que debe estar en sys.path.
+from .quasiNewton import bfgs, lbfgs, lbfgs_nd
@@ -0,0 +1,101 @@
+import numpy as np
+from collections import deque
+from typing import Tuple
+
+from objective import PlanarObjective
+from line_search import wolfe_line_search
+
+# Objetivo 2D con la interfaz n-dimensional (value_grad / hessvec)
+PLANAR = PlanarObjective()
+
+def _quasi_newton(objective, x0: np.ndarray, max_iter: int, tol: float,
+                  direction, update) -> Tuple[np.ndarray, float, int, bool]:
+    #Bucle común de BFGS y L-BFGS: dirección cuasi-Newton, búsqueda lineal de
+    #Wolfe (que garantiza s·y > 0) y actualización de la aproximación de curvatura
+    #Mismos criterios de convergencia y divergencia que gradient_descent
+    value_grad = objective.value_grad
+    z = np.array(x0, dtype=float)
+    converged = False
+    current_f, g = value_grad(z)
+    
+    for i in range(max_iter):
+        if np.linalg.norm(g) < tol:
+            converged = True
+            break
+        
+        p = direction(g)
+        if g @ p >= 0:
+            # La aproximación perdió la definición positiva: volver a -∇f
+            p = -g
+        
+        t, f_new, g_new, _ = wolfe_line_search(value_grad, z, current_f, g, p, t0=1.0)
+        z_new = z + t * p
+        s, y = z_new - z, g_new - g
+        change = np.linalg.norm(s)
+        
+        if s @ y > 1e-12 * np.linalg.norm(s) * np.linalg.norm(y):
+            update(s, y)
+        
+        z, current_f, g = z_new, f_new, g_new
+        
+        if change < tol:
+            converged = True
+            break
+        
+        if (np.max(np.abs(z)) > 1e10 or np.isnan(current_f) or current_f > 1e10):
+            break
+    
+    return z, current_f, i + 1, converged
+
+def bfgs(x0: float, y0: float, max_iter: int = 1000, tol: float = 1e-6) -> Tuple[float, float, float, int, bool]:
+    #Método BFGS con actualización densa 2x2 de la inversa del Hessiano
+    #No evalúa el Hessiano: la curvatura se aprende de los pares (s, y) de gradientes
+    state = {'H_inv': np.eye(2), 'first': True}
+    
+    def direction(g):
+        return -state['H_inv'] @ g
+    
+    def update(s, y):
+        if state['first']:
+            # Escalado inicial H0 = (s·y / y·y) I (Nocedal y Wright, ec. 6.20)
+            state['H_inv'] = (s @ y) / (y @ y) * np.eye(2)
+            state['first'] = False
+        rho = 1.0 / (s @ y)
+        V = np.eye(2) - rho * np.outer(s, y)
+        state['H_inv'] = V @ state['H_inv'] @ V.T + rho * np.outer(s, s)
+    
+    z, final_f, iterations, converged = _quasi_newton(PLANAR, [x0, y0], max_iter, tol,
+                                                      direction, update)
+    return z[0], z[1], final_f, iterations, converged
+
+def lbfgs_nd(objective, x0: np.ndarray, max_iter: int = 1000, tol: float = 1e-6,
+             memory: int = 5) -> Tuple[np.ndarray, float, int, bool]:
+    #Método L-BFGS en dimensión n: guarda sólo los últimos `memory` pares (s, y)
+    #y aplica la inversa del Hessiano con la recursión de dos ciclos (memoria O(mn))
+    pairs = deque(maxlen=memory)
+    
+    def direction(g):
+        q = g.copy()
+        alphas = []
+        for s, y, rho in reversed(pairs):
+            a = rho * (s @ q)
+            q -= a * y
+            alphas.append(a)
+        if pairs:
+            s, y, _ = pairs[-1]
+            q *= (s @ y) / (y @ y)
+        for (s, y, rho), a in zip(pairs, reversed(alphas)):
+            b = rho * (y @ q)
+            q += (a - b) * s
+        return -q
+    
+    def update(s, y):
+        pairs.append((s, y, 1.0 / (s @ y)))
+    
+    return _quasi_newton(objective, x0, max_iter, tol, direction, update)
+
+def lbfgs(x0: float, y0: float, max_iter: int = 1000, tol: float = 1e-6,
+          memory: int = 5) -> Tuple[float, float, float, int, bool]:
+    #Método L-BFGS para f(x, y); ver lbfgs_nd
+    z, final_f, iterations, converged = lbfgs_nd(PLANAR, [x0, y0], max_iter, tol, memory)
+    return z[0], z[1], final_f, iterations, converged
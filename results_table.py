@@ -0,0 +1,148 @@
+import numpy as np
+from typing import Tuple
+
+from stationary_points import default_catalog, MINIMUM
+
+# Tabla columnar de resultados de experimentos: un arreglo estructurado de NumPy
+# con una fila por ejecución en lugar de una lista de diccionarios. El tipo de
+# convergencia y la etiqueta de grupo (regla de paso, resolvedor, método,
+# sección...) se guardan como códigos enteros, así que filtrar y agregar son
+# operaciones vectorizadas sobre columnas.
+#
+# El tipo de convergencia se decide por el punto final (x_final, y_final): se
+# busca el punto estacionario más cercano en el catálogo de stationary_points y
+# se mira si es el mínimo global, otro mínimo, o una silla o un máximo.
+
+CONVERGENCE_TYPES = ('Mínimo global', 'Mínimo local', 'No convergió', 'Silla o máximo')
+GLOBAL_MIN, LOCAL_MIN, NOT_CONVERGED, SADDLE_OR_MAX = range(len(CONVERGENCE_TYPES))
+
+RESULT_DTYPE = np.dtype([
+    ('x0', 'f8'), ('y0', 'f8'),
+    ('x_final', 'f8'), ('y_final', 'f8'),
+    ('param', 'f8'),          # α o Δ de la ejecución
+    ('group', 'i2'),          # índice de la etiqueta en ResultsTable.groups
+    ('iterations', 'i4'),
+    ('f_final', 'f8'),
+    ('error', 'f8'),          # f_final - 0.18
+    ('distance', 'f8'),       # distancia del punto inicial a (0,0)
+    ('converged', '?'),
+    ('successful', '?'),
+    ('convergence', 'i1'),    # índice en CONVERGENCE_TYPES
+    ('f_evals', 'i4'),
+    ('grad_evals', 'i4')
+])
+
+def convergence_codes(x_final, y_final, converged, successful=None, tol: float = 1e-3) -> np.ndarray:
+    #Código de CONVERGENCE_TYPES de cada punto final, con una sola consulta al catálogo
+    #Un punto a más de `tol` de todo punto estacionario cuenta como 'No convergió',
+    #igual que las ejecuciones no exitosas si se pasa `successful`
+    catalog = default_catalog()
+    index = catalog.classify(x_final, y_final, tol)
+    kinds = catalog.kinds[index]
+    codes = np.where(index == catalog.global_index, GLOBAL_MIN,
+                     np.where(kinds == MINIMUM, LOCAL_MIN, SADDLE_OR_MAX))
+    failed = ~np.asarray(converged, dtype=bool) | (index < 0)
+    if successful is not None:
+        failed = failed | ~np.asarray(successful, dtype=bool)
+    return np.where(failed, NOT_CONVERGED, codes).astype(np.int8)
+
+class ResultsTable:
+    #Filas de RESULT_DTYPE más las etiquetas de grupo que codifica la columna 'group'
+    def __init__(self, groups: Tuple[str, ...] = (), rows: np.ndarray = None, capacity: int = 16):
+        self.groups = tuple(groups)
+        if rows is None:
+            self._rows = np.zeros(capacity, dtype=RESULT_DTYPE)
+            self.size = 0
+        else:
+            self._rows = rows
+            self.size = rows.size
+
+    @classmethod
+    def from_columns(cls, groups: Tuple[str, ...] = (), **columns) -> 'ResultsTable':
+        #Construye la tabla de una vez a partir de columnas (p. ej. la salida de
+        #un resolvedor vectorizado); 'convergence' se calcula si no se pasa
+        size = np.size(next(iter(columns.values())))
+        rows = np.zeros(size, dtype=RESULT_DTYPE)
+        for name, column in columns.items():
+            rows[name] = column
+        if 'convergence' not in columns:
+            rows['convergence'] = convergence_codes(rows['x_final'], rows['y_final'], rows['converged'],
+                                                    columns.get('successful'))
+        return cls(groups, rows)
+
+    @classmethod
+    def concat(cls, *tables: 'ResultsTable') -> 'ResultsTable':
+        #Une tablas con las mismas etiquetas de grupo
+        return cls(tables[0].groups, np.concatenate([t.rows for t in tables]))
+
+    def append(self, group: str = None, **fields):
+        #Añade una fila; `group` es la etiqueta (se guarda su código) y
+        #'convergence' se calcula a partir de x_final, y_final, converged y successful
+        if self.size == self._rows.size:
+            grown = np.zeros(2 * self._rows.size, dtype=RESULT_DTYPE)
+            grown[:self.size] = self._rows
+            self._rows = grown
+        if group is not None:
+            fields['group'] = self.groups.index(group)
+        if 'convergence' not in fields:
+            fields['convergence'] = convergence_codes(fields['x_final'], fields['y_final'],
+                                                      fields['converged'], fields.get('successful'))
+        for name, value in fields.items():
+            self._rows[name][self.size] = value
+        self.size += 1
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._rows[:self.size]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, key):
+        #table['columna'] devuelve la columna; table[máscara] una subtabla
+        if isinstance(key, str):
+            return self.rows[key]
+        return ResultsTable(self.groups, self.rows[key])
+
+    def is_group(self, label: str) -> np.ndarray:
+        return self.rows['group'] == self.groups.index(label)
+
+    def is_type(self, code: int) -> np.ndarray:
+        return self.rows['convergence'] == code
+
+    def counts(self, by: str = 'convergence') -> np.ndarray:
+        #Número de filas por código ('convergence' o 'group')
+        size = len(CONVERGENCE_TYPES) if by == 'convergence' else len(self.groups)
+        return np.bincount(self.rows[by], minlength=size)
+
+    def success_rate(self) -> float:
+        return self.rows['successful'].mean() if self.size else 0.0
+
+    def mean_by(self, column: str, by: str = 'group') -> np.ndarray:
+        #Media de `column` por código (NaN en los grupos vacíos)
+        size = len(CONVERGENCE_TYPES) if by == 'convergence' else len(self.groups)
+        counts = np.bincount(self.rows[by], minlength=size)
+        sums = np.bincount(self.rows[by], weights=self.rows[column], minlength=size)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return sums / counts
+
+    def best(self, key: str = 'iterations') -> np.void:
+        #Fila con el menor valor de `key` (la primera en caso de empate)
+        return self.rows[np.argmin(self.rows[key])]
+
+    def worst(self, key: str = 'iterations') -> np.void:
+        #Fila con el mayor valor de `key` (la primera en caso de empate)
+        return self.rows[np.argmax(self.rows[key])]
+
+    def save(self, path: str):
+        #Guarda filas y etiquetas de grupo en un archivo .npz
+        np.savez(path, rows=self.rows, groups=np.array(self.groups, dtype=str))
+
+    @classmethod
+    def load(cls, path: str) -> 'ResultsTable':
+        with np.load(path) as stored:
+            return cls(tuple(stored['groups'].tolist()), stored['rows'])
+
+    def points(self) -> list:
+        #Puntos iniciales como lista de tuplas (para mostrarlos)
+        return list(zip(self.rows['x0'].tolist(), self.rows['y0'].tolist()))
@@ -0,0 +1,132 @@
+import os
+import json
+import hashlib
+import inspect
+import numpy as np
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Iterable
+
+# Memoización de resultados de los resolvedores: la clave es
+# (método, x0, y0, parámetros, versión del código). Los resultados viven en una
+# caché LRU en memoria y, opcionalmente, en un directorio en disco (un archivo
+# JSON por clave) para que otras ejecuciones los reutilicen.
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Módulos compartidos de los que dependen todos los resolvedores
+SHARED_SOURCES = ('objective.py', 'line_search.py')
+
+def source_digest(paths: Iterable[str]) -> str:
+    #Hash corto del contenido de los archivos dados
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path, 'rb') as source:
+            digest.update(source.read())
+    return digest.hexdigest()[:16]
+
+def code_version(solver: Callable) -> str:
+    #Huella del código del resolvedor: hash del archivo donde está definido más
+    #los módulos compartidos; cualquier cambio en ellos invalida la caché
+    return source_digest([inspect.getsourcefile(solver)] +
+                         [os.path.join(ROOT, name) for name in SHARED_SOURCES])
+
+def to_builtin(value: tuple) -> tuple:
+    #Convierte los escalares de NumPy (np.float64, np.bool_...) a float, bool e
+    #int de Python: un resultado en caché tiene los mismos tipos venga de
+    #memoria o del JSON en disco
+    return tuple(v.item() if isinstance(v, np.generic) else v for v in value)
+
+class SolveCache:
+    #Caché LRU en memoria con almacenamiento opcional en disco
+    def __init__(self, maxsize: int = 4096, directory: str = None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: tuple) -> str:
+        name = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(self.directory, name + '.json')
+
+    def get(self, key: tuple):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        if self.directory is not None and os.path.exists(self._path(key)):
+            with open(self._path(key)) as stored:
+                value = tuple(json.load(stored))
+            self._remember(key, value)
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        return None
+
+    def put(self, key: tuple, value: tuple) -> tuple:
+        #Guarda el resultado con tipos de Python (ver to_builtin) y lo devuelve
+        value = to_builtin(value)
+        self._remember(key, value)
+        if self.directory is not None:
+            # Escritura atómica: otro proceso nunca ve un archivo a medias
+            path = self._path(key)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'w') as stored:
+                json.dump(list(value), stored)
+            os.replace(tmp, path)
+        return value
+
+    def _remember(self, key: tuple, value: tuple):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+# Caché en memoria compartida por defecto entre pruebas, análisis y gráficas
+DEFAULT_CACHE = SolveCache()
+
+def cached_solver(method: str, solver: Callable, cache: SolveCache = None) -> Callable:
+    #Envuelve un resolvedor escalar solver(x0, y0, ...) con memoización
+    #Los argumentos se normalizan con la firma del resolvedor (valores por
+    #defecto incluidos), así f(1, 1, 0.1) y f(1, 1, alpha=0.1) comparten entrada.
+    #Las llamadas con argumentos no escalares (p. ej. un diccionario `stats`
+    #que el resolvedor debe llenar) no se cachean, ni los resultados que no son
+    #tuplas de escalares (p. ej. la trayectoria de record=True o el SolveResult
+    #de instrument=True). Los resultados en caché se devuelven siempre con
+    #escalares de Python, también en la primera llamada
+    signature = inspect.signature(solver)
+    version = code_version(solver)
+
+    @wraps(solver)
+    def wrapper(*args, **kwargs):
+        store = cache if cache is not None else DEFAULT_CACHE
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+        if not all(v is None or isinstance(v, (bool, int, float, str, np.generic))
+                   for v in arguments.values()):
+            return solver(*args, **kwargs)
+
+        params = tuple(sorted((name, float(value) if isinstance(value, (int, float, np.generic))
+                               and not isinstance(value, bool) else value)
+                              for name, value in arguments.items()))
+        key = (method, params, version)
+
+        result = store.get(key)
+        if result is None:
+            result = solver(*args, **kwargs)
+            if isinstance(result, tuple) and all(np.isscalar(v) for v in result):
+                result = store.put(key, result)
+        return result
+
+    return wrapper
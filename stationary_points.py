@@ -0,0 +1,158 @@
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from objective import value_grad_hess
+
+# Catálogo de los puntos estacionarios de f(x, y) = x² + y² - 0.12cos(3πx)cos(4πy) + 0.3
+# Se siembra una malla fina de puntos, se refinan todos a la vez con Newton sobre
+# ∇f = 0 y se agrupan los que llegan al mismo punto. Cada punto se etiqueta por
+# los autovalores del Hessiano (mínimo, silla o máximo) y se guarda en un árbol
+# KD, así que clasificar millones de puntos finales es una sola consulta de
+# vecino más cercano en lugar de comparar |f - 0.18|.
+#
+# ∇f = 0 exige |2x| = |0.36π sin(3πx)cos(4πy)| ≤ 0.36π y |2y| ≤ 0.48π, así que
+# todos los puntos estacionarios están en STATIONARY_BOX y el catálogo es completo.
+
+STATIONARY_BOX = ((-0.18 * np.pi, 0.18 * np.pi), (-0.24 * np.pi, 0.24 * np.pi))
+
+KINDS = ('Mínimo', 'Silla', 'Máximo')
+MINIMUM, SADDLE, MAXIMUM = range(len(KINDS))
+
+class _BruteForceTree:
+    #Sustituto de cKDTree cuando SciPy no está instalado: el catálogo tiene pocas
+    #decenas de puntos, así que basta comparar contra todos por bloques
+    def __init__(self, data: np.ndarray, chunk: int = 65536):
+        self.data = np.asarray(data, dtype=float)
+        self.chunk = chunk
+
+    def query(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        distances = np.empty(len(points))
+        indices = np.empty(len(points), dtype=np.intp)
+        for start in range(0, len(points), self.chunk):
+            block = points[start:start + self.chunk]
+            d2 = ((block[:, None, :] - self.data[None, :, :]) ** 2).sum(axis=2)
+            nearest = np.argmin(d2, axis=1)
+            indices[start:start + self.chunk] = nearest
+            distances[start:start + self.chunk] = np.sqrt(d2[np.arange(len(block)), nearest])
+        return distances, indices
+
+def kd_tree(points: np.ndarray):
+    #Árbol KD de SciPy si está instalado (se importa aquí para no pagar la
+    #importación al cargar el módulo); si no, la búsqueda exhaustiva
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        return _BruteForceTree(points)
+    return cKDTree(points)
+
+def newton_stationary(x: np.ndarray, y: np.ndarray, max_iter: int = 50, tol: float = 1e-12,
+                      max_step: float = 0.05) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    #Newton vectorizado sobre ∇f = 0 desde cada semilla
+    #El paso se recorta a `max_step` para que cada semilla se quede cerca de su
+    #punto estacionario; devuelve (x, y, convergió)
+    x = np.array(x, dtype=float)
+    y = np.array(y, dtype=float)
+    converged = np.zeros(x.size, dtype=bool)
+    active = np.arange(x.size)
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        g, H = value_grad_hess(x[active], y[active], need=('grad', 'hess'))
+        done = np.hypot(g[0], g[1]) < tol
+        converged[active[done]] = True
+
+        keep = ~done
+        active, g, H = active[keep], g[:, keep], H[:, :, keep]
+        det = H[0, 0] * H[1, 1] - H[0, 1] * H[1, 0]
+        singular = np.abs(det) < 1e-14
+        safe_det = np.where(singular, 1.0, det)
+        dx = -(H[1, 1] * g[0] - H[0, 1] * g[1]) / safe_det
+        dy = -(H[0, 0] * g[1] - H[1, 0] * g[0]) / safe_det
+
+        step = np.hypot(dx, dy)
+        scale = np.minimum(1.0, max_step / np.maximum(step, 1e-300))
+        x[active] += np.where(singular, 0.0, scale * dx)
+        y[active] += np.where(singular, 0.0, scale * dy)
+        active = active[~singular]
+
+    return x, y, converged
+
+class StationaryCatalog:
+    #Puntos estacionarios (N, 2), su valor de f, los autovalores del Hessiano
+    #(menor, mayor) y su tipo (índice en KINDS), con un árbol KD para consultas
+    def __init__(self, points: np.ndarray, values: np.ndarray, eigenvalues: np.ndarray, kinds: np.ndarray):
+        self.points = points
+        self.values = values
+        self.eigenvalues = eigenvalues
+        self.kinds = kinds
+        self.tree = kd_tree(points)
+        minima = np.flatnonzero(kinds == MINIMUM)
+        self.global_index = minima[np.argmin(values[minima])]
+
+    @classmethod
+    def build(cls, box=STATIONARY_BOX, spacing: float = 1 / 48, decimals: int = 8) -> 'StationaryCatalog':
+        #Siembra una malla de separación `spacing` en box, refina con Newton y
+        #agrupa los puntos que coinciden al redondear a `decimals` decimales
+        (x_low, x_high), (y_low, y_high) = box
+        margin = 2 * spacing
+        X0, Y0 = np.meshgrid(np.arange(x_low - margin, x_high + margin, spacing),
+                             np.arange(y_low - margin, y_high + margin, spacing))
+        x, y, converged = newton_stationary(X0.ravel(), Y0.ravel())
+        inside = converged & (x >= x_low) & (x <= x_high) & (y >= y_low) & (y <= y_high)
+
+        # (+ 0.0 convierte -0.0 en 0.0 para que no cuenten como puntos distintos)
+        points = np.unique(np.round(np.column_stack([x[inside], y[inside]]), decimals) + 0.0, axis=0)
+        values, H = value_grad_hess(points[:, 0], points[:, 1], need=('f', 'hess'))
+        eigenvalues = np.linalg.eigvalsh(np.moveaxis(H, -1, 0))
+        kinds = np.where(eigenvalues[:, 0] > 0, MINIMUM,
+                         np.where(eigenvalues[:, 1] < 0, MAXIMUM, SADDLE))
+        return cls(points, values, eigenvalues, kinds)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def nearest(self, x, y) -> Tuple[np.ndarray, np.ndarray]:
+        #Índice del punto del catálogo más cercano a cada (x, y) y su distancia
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        distances, indices = self.tree.query(np.column_stack([x.ravel(), y.ravel()]))
+        return indices.reshape(x.shape), distances.reshape(x.shape)
+
+    def classify(self, x, y, tol: float = 1e-3) -> np.ndarray:
+        #Índice en el catálogo del punto estacionario en el que terminó cada
+        #(x, y), o -1 si ninguno está a menos de `tol`
+        indices, distances = self.nearest(x, y)
+        return np.where(distances < tol, indices, -1)
+
+    def label(self, x, y, converged, tol: float = 1e-3) -> np.ndarray:
+        #Etiqueta de cuenca de cada punto final: índice en el catálogo del punto
+        #estacionario al que llegó, o -1 si no convergió o no llegó a ninguno
+        return np.where(converged, self.classify(x, y, tol), -1).astype(np.int32)
+
+    def counts(self) -> Dict[str, int]:
+        return {kind: int((self.kinds == code).sum()) for code, kind in enumerate(KINDS)}
+
+@lru_cache(maxsize=None)
+def default_catalog() -> StationaryCatalog:
+    #Catálogo completo de la función objetivo (se construye una vez por proceso)
+    return StationaryCatalog.build()
+
+def display_catalog(catalog: StationaryCatalog):
+    #Muestra el catálogo ordenado por valor de f
+    print("\n" + "="*90)
+    print("CATÁLOGO DE PUNTOS ESTACIONARIOS")
+    print("="*90)
+    print(", ".join(f"{kind}: {count}" for kind, count in catalog.counts().items()))
+    print("\n| {:<6} | {:<22} | {:<12} | {:<8} | {:<24} |".format(
+        "Índice", "Punto (x, y)", "f(x,y)", "Tipo", "Autovalores ∇²f"))
+    print("|" + "-"*8 + "|" + "-"*24 + "|" + "-"*14 + "|" + "-"*10 + "|" + "-"*26 + "|")
+    for k in np.argsort(catalog.values, kind='stable'):
+        (px, py), (low, high) = catalog.points[k], catalog.eigenvalues[k]
+        print("| {:<6} | {:<22} | {:<12} | {:<8} | {:<24} |".format(
+            k, f"({px:.6f}, {py:.6f})", f"{catalog.values[k]:.6f}", KINDS[catalog.kinds[k]],
+            f"{low:.3f}, {high:.3f}"))
+
+if __name__ == "__main__":
+    display_catalog(default_catalog())
@@ -0,0 +1,26 @@
+import numpy as np
+
+from line_search import armijo_backtracking
+
+def quadratic(x):
+    return x @ x, 2 * x
+
+def test_armijo_accepts_first_sufficient_decrease():
+    x = np.array([1.0, 0.0])
+    f0, g0 = quadratic(x)
+    t, f_new, g_new, evals = armijo_backtracking(quadratic, x, f0, g0, -g0, t0=2.0)
+    # t = 2 lleva a (-3, 0), t = 1 a (-1, 0) (sin descenso) y t = 0.5 al mínimo
+    assert (t, evals) == (0.5, 3)
+    assert f_new == 0.0
+
+def test_armijo_returns_last_evaluated_step_when_trials_run_out():
+    # p es dirección de subida: ningún t > 0 cumple la condición de Armijo
+    x = np.array([1.0, 0.0])
+    f0, g0 = quadratic(x)
+    t, f_new, g_new, evals = armijo_backtracking(quadratic, x, f0, g0, g0, t0=1.0,
+                                                 shrink=0.5, max_trials=5)
+    assert evals == 5
+    assert t == 0.5 ** 4
+    f_t, g_t = quadratic(x + t * g0)
+    assert f_new == f_t
+    np.testing.assert_array_equal(g_new, g_t)
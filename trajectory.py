@@ -0,0 +1,31 @@
+import numpy as np
+from array import array
+from typing import Dict, Tuple
+
+# Registro de trayectorias de los resolvedores (opción record=True): cada
+# iteración añade una fila a un búfer plano de doubles (array('d'), que reserva
+# memoria por duplicación como una lista pero guarda los valores sin objetos de
+# Python); al terminar se ve como matriz de NumPy sin copiar y se parte en
+# columnas. Así el costo por iteración es copiar unos pocos floats.
+
+class TrajectoryRecorder:
+    #Búfer de filas (una por iteración) con una columna por campo
+    def __init__(self, fields: Tuple[str, ...]):
+        self.fields = tuple(fields)
+        self._buffer = array('d')
+
+    @property
+    def size(self) -> int:
+        return len(self._buffer) // len(self.fields)
+
+    def append(self, *values):
+        #Añade una fila con los valores en el orden de `fields`
+        self._buffer.extend(values)
+
+    def history(self) -> Dict[str, np.ndarray]:
+        #Trayectoria recortada: un arreglo contiguo por campo más 'iteration'
+        rows = np.frombuffer(self._buffer, dtype=float).reshape(-1, len(self.fields))
+        history = {'iteration': np.arange(1, rows.shape[0] + 1)}
+        for j, name in enumerate(self.fields):
+            history[name] = rows[:, j].copy()
+        return history
@@ -0,0 +1,4 @@
+# Método de Región de Confianza (2D y n-dimensional). Los módulos compartidos
+# (objective, utils, ...) viven en la raíz del repositorio, que debe estar en sys.path.
+from .trustRegion import (trust_region, trust_region_cached, trust_region_batch, trust_region_nd,
+                          iter_trust_region, SUBPROBLEM_SOLVERS, ND_SUBPROBLEM_SOLVERS)
@@ -0,0 +1,219 @@
+import os
+import numpy as np
+from typing import Dict
+from .trustRegion import trust_region
+from results_table import ResultsTable
+from plotting import (pyplot, render_panels, decimate_trajectory, thin_scatter, DPI, DRAFT_DPI,
+                      MAX_ANNOTATIONS, MAX_SEGMENTS)
+from landscape import landscape_grid
+
+def run_convergence_analysis() -> Dict[str, np.ndarray]:
+    print("\n" + "="*90)
+    print("PRUEBA 3: ANÁLISIS DETALLADO DE CONVERGENCIA")
+    print("Punto inicial: (2.0, 2.0), Δ = 1.0")
+    print("="*90)
+    
+    # Trayectoria registrada por el propio resolvedor (arreglos por campo)
+    *_, history = trust_region(2.0, 2.0, 1.0, max_iter=50, tol=1e-6, record=True)
+    
+    print("| {:<8} | {:<12} | {:<12} | {:<12} | {:<12} | {:<12} |".format(
+        "Iter", "x", "y", "f(x,y)", "||∇f||", "Δ"))
+    print("|" + "-"*10 + "|" + "-"*14 + "|" + "-"*14 + "|" + "-"*14 + "|" + "-"*14 + "|" + "-"*14 + "|")
+    
+    for row in zip(history['iteration'], history['x'], history['y'], history['f'],
+                   history['grad_norm'], history['delta']):
+        print("| {:<8} | {:<12.6f} | {:<12.6f} | {:<12.6f} | {:<12.6f} | {:<12.6f} |".format(*row))
+    
+    return history
+
+def display_analysis(step_results: ResultsTable, point_results: ResultsTable, convergence_history: Dict[str, np.ndarray]):
+    print("\n" + "="*90)
+    print("ANÁLISIS - MÉTODO DE REGIÓN DE CONFIANZA")
+    print("="*90)
+    
+    successful_step = step_results[step_results['successful']]
+    successful_points = point_results[point_results['successful']]
+    
+    print("\nANÁLISIS PRUEBA 1 (Tamaños de Región):")
+    print(f"• Convergencia exitosa: {len(successful_step)}/{len(step_results)} casos")
+    
+    if len(successful_step):
+        best_delta = successful_step.best()
+        worst_delta = successful_step.worst()
+        
+        print(f"• Mejor Δ: {best_delta['param']} ({best_delta['iterations']} iteraciones)")
+        print(f"• Peor Δ: {worst_delta['param']} ({worst_delta['iterations']} iteraciones)")
+        
+        fast_deltas = successful_step['param'][successful_step['iterations'] <= 15]
+        if fast_deltas.size:
+            print(f"• Rango óptimo: Δ ∈ [{fast_deltas.min()}, {fast_deltas.max()}]")
+    
+    print("\nANÁLISIS PRUEBA 2 (Puntos Iniciales):")
+    print(f"• Robustez: {len(successful_points)}/{len(point_results)} puntos convergen")
+    
+    if len(successful_points):
+        iterations_list = successful_points['iterations']
+        
+        print(f"• Iteraciones promedio: {np.mean(iterations_list):.1f}")
+        print(f"• Rango de iteraciones: {iterations_list.min()} a {iterations_list.max()}")
+        print(f"• Eficiencia consistente: {np.std(iterations_list):.1f} desviación estándar")
+
+def calculate_statistics(step_results: ResultsTable, point_results: ResultsTable):
+    print("\n" + "="*90)
+    print("ESTADÍSTICAS")
+    print("="*90)
+    
+    all_results = ResultsTable.concat(step_results, point_results)
+    all_successful = all_results[all_results['successful']]
+    
+    if len(all_successful):
+        all_iterations = all_successful['iterations']
+        all_errors = np.abs(all_successful['error'])
+        
+        total_tests = len(all_results)
+        successful_tests = len(all_successful)
+        
+        print(f"Total de pruebas ejecutadas: {total_tests}")
+        print(f"Pruebas exitosas: {successful_tests}")
+        print(f"Tasa de éxito global: {successful_tests/total_tests*100:.1f}%")
+        print(f"Iteraciones promedio: {np.mean(all_iterations):.1f} ± {np.std(all_iterations):.1f}")
+        print(f"Rango de iteraciones: {np.min(all_iterations)} - {np.max(all_iterations)}")
+        print(f"Error promedio: {np.mean(all_errors):.2e}")
+        print(f"Precisión alcanzada: {100*(1-np.mean(all_errors)/0.18):.1f}%")
+        
+        efficient_cases = np.count_nonzero(all_iterations <= 15)
+        print(f"Casos altamente eficientes (≤15 iteraciones): {efficient_cases}/{successful_tests}")
+
+def _plot_iterations_vs_size(ax, step_results: ResultsTable):
+    # Gráfica 1: Iteraciones vs Tamaño de Región
+    # (en barridos grandes, un representante por celda de densidad, ordenados por Δ)
+    successful_step = step_results[step_results['successful']]
+    shown, _ = thin_scatter(successful_step['param'], successful_step['iterations'])
+    if len(shown) < len(successful_step):
+        shown = shown[np.argsort(successful_step['param'][shown], kind='stable')]
+    successful_step = successful_step[shown]
+    
+    if len(successful_step):
+        deltas = successful_step['param']
+        iterations = successful_step['iterations']
+        
+        ax.plot(deltas, iterations, 'bo-', markersize=8, linewidth=2)
+        ax.set_xlabel('Tamaño de Región (Δ)')
+        ax.set_ylabel('Iteraciones')
+        ax.set_title('Eficiencia vs Tamaño de Región')
+        ax.grid(True, alpha=0.3)
+        
+        if len(successful_step) <= MAX_ANNOTATIONS:
+            for delta, iter_count in zip(deltas, iterations):
+                ax.annotate(f'{iter_count}', (delta, iter_count), 
+                            xytext=(5, 5), textcoords='offset points', fontsize=9)
+
+def _plot_history(ax, convergence_history: Dict[str, np.ndarray], field: str, style: str,
+                  ylabel: str, title: str, log_y: bool):
+    # Gráficas 2, 3 y 6: evolución de un campo de la trayectoria registrada,
+    # reducida con Douglas–Peucker si tiene muchas iteraciones
+    if convergence_history['iteration'].size:
+        shown = decimate_trajectory(convergence_history['iteration'], convergence_history[field],
+                                    log_y=log_y)
+        iterations = convergence_history['iteration'][shown]
+        values = convergence_history[field][shown]
+        
+        if log_y:
+            ax.semilogy(iterations, values, style, linewidth=2)
+        else:
+            ax.plot(iterations, values, style, linewidth=2)
+        ax.set_xlabel('Iteración')
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        ax.grid(True, alpha=0.3)
+
+def _plot_convergence_map(ax, point_results: ResultsTable, draft: bool = False):
+    # Gráfica 4: Mapa de convergencia
+    from matplotlib.collections import LineCollection
+    successful_points = point_results[point_results['successful']]
+    
+    if len(successful_points):
+        x, y, Z = landscape_grid((-3.0, 3.0), 64 if draft else 100)
+        
+        contour = ax.contour(x, y, Z, levels=20, alpha=0.6)
+        ax.clabel(contour, inline=True, fontsize=8)
+        
+        # Las tablas guardan el punto final de cada ejecución; en barridos
+        # grandes se dibuja un representante por celda de densidad
+        shown, _ = thin_scatter(successful_points['x0'], successful_points['y0'])
+        initial_x, initial_y = successful_points['x0'][shown], successful_points['y0'][shown]
+        final_x, final_y = successful_points['x_final'][shown], successful_points['y_final'][shown]
+        
+        ax.scatter(initial_x, initial_y, c='blue', s=80, alpha=0.7, label='Inicio')
+        ax.scatter(final_x, final_y, c='red', s=80, alpha=0.7, label='Final')
+        ax.scatter(0, 0, c='green', s=150, marker='*', label='Óptimo Global')
+        
+        stride = max(1, len(initial_x) // MAX_SEGMENTS)
+        segments = np.stack([np.column_stack([initial_x[::stride], initial_y[::stride]]),
+                             np.column_stack([final_x[::stride], final_y[::stride]])], axis=1)
+        ax.add_collection(LineCollection(segments, colors='k', linestyles='--', alpha=0.4, linewidths=1))
+        
+        ax.set_xlabel('Coordenada X')
+        ax.set_ylabel('Coordenada Y')
+        ax.set_title('Mapa de Convergencia - Trayectorias')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+def _plot_iterations_vs_distance(ax, point_results: ResultsTable):
+    # Gráfica 5: Eficiencia por distancia inicial
+    successful_points = point_results[point_results['successful']]
+    if len(successful_points):
+        shown, _ = thin_scatter(successful_points['distance'], successful_points['iterations'])
+        distances = successful_points['distance'][shown]
+        iterations = successful_points['iterations'][shown]
+        
+        colors = np.select([iterations <= 15, iterations <= 25], ['green', 'orange'], 'red')
+        
+        ax.scatter(distances, iterations, c=colors, s=100, alpha=0.7)
+        ax.set_xlabel('Distancia Inicial al Óptimo')
+        ax.set_ylabel('Iteraciones')
+        ax.set_title('Eficiencia vs Distancia Inicial')
+        ax.grid(True, alpha=0.3)
+
+def plot_results(step_results: ResultsTable, point_results: ResultsTable, convergence_history: Dict[str, np.ndarray],
+                 draft: bool = False, panels_dir: str = None, workers: int = None):
+    # draft=True: baja resolución (DRAFT_DPI) y malla de contornos más gruesa
+    # panels_dir: cada panel en su propio archivo, dibujados en paralelo
+    # matplotlib se importa aquí, sólo cuando se generan figuras
+    dpi = DRAFT_DPI if draft else DPI
+    panels = [
+        ('iteraciones_vs_region', _plot_iterations_vs_size, (step_results,)),
+        ('convergencia_funcion', _plot_history,
+         (convergence_history, 'f', 'r-', 'f(x,y) (escala log)', 'Convergencia de Función Objetivo', True)),
+        ('norma_gradiente', _plot_history,
+         (convergence_history, 'grad_norm', 'g-', '||∇f|| (escala log)',
+          'Evolución de la Norma del Gradiente', True)),
+        ('mapa_convergencia', _plot_convergence_map, (point_results, draft)),
+        ('iteraciones_vs_distancia', _plot_iterations_vs_distance, (point_results,)),
+        ('tamano_region', _plot_history,
+         (convergence_history, 'delta', 'm-', 'Tamaño de Región (Δ)', 'Evolución del Tamaño de Región', False))
+    ]
+    
+    print("\n" + "="*90)
+    print("GENERANDO GRÁFICAS")
+    print("="*90)
+    
+    if panels_dir is not None:
+        paths = render_panels(panels, panels_dir, dpi, workers)
+        print(f"Paneles guardados en '{panels_dir}' ({len(paths)} archivos)")
+        return
+    
+    plt = pyplot()
+    
+    fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+    fig.suptitle('Análisis - Método de Región de Confianza', fontsize=16, fontweight='bold')
+    for ax, (_, draw, args) in zip(axes.flat, panels):
+        draw(ax, *args)
+    
+    plt.tight_layout()
+    # La figura se guarda junto a este módulo, sin depender del directorio de trabajo
+    plt.savefig(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'analisis_region_confianza.png'),
+                dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    
+    print("Gráficas guardadas como 'analisis_region_confianza.png'")
@@ -0,0 +1,51 @@
+# Uso (desde la raíz del repositorio): python -m trust_region.main [--headless] [--draft] [--panels DIR]
+import argparse
+from .test1 import run_trust_region_sizes_experiment, run_subproblem_solvers_experiment
+from .test2 import run_initial_points_experiment
+from .analysis import run_convergence_analysis, display_analysis, calculate_statistics, plot_results
+
+def main(headless: bool = False, draft: bool = False, panels_dir: str = None):
+    # Con headless=True no se generan gráficas
+    #draft y panels_dir se pasan a plot_results (borrador de baja resolución,
+    #paneles en archivos separados dibujados en paralelo)
+    print("MÉTODO DE REGIÓN DE CONFIANZA - ANÁLISIS")
+    print("="*60)
+    print("Función: f(x,y) = x² + y² - 0.12cos(3πx)cos(4πy) + 0.3")
+    print("Mínimo global teórico: f(0,0) = 0.18")
+    print("="*60)
+    
+    print("\nEJECUTANDO PRUEBAS...")
+    
+    # Prueba 1: Diferentes tamaños de región
+    step_results = run_trust_region_sizes_experiment()
+    
+    # Comparación de resolvedores del subproblema con los mismos Δ
+    run_subproblem_solvers_experiment()
+    
+    # Prueba 2: Diferentes puntos iniciales
+    point_results = run_initial_points_experiment()
+
+    # Análisis detallado de convergencia
+    convergence_history = run_convergence_analysis()
+    
+    # Mostrar análisis
+    display_analysis(step_results, point_results, convergence_history)
+    
+    # Calcular estadísticas
+    calculate_statistics(step_results, point_results)
+    
+    # Generar gráficas
+    if not headless:
+        plot_results(step_results, point_results, convergence_history, draft=draft, panels_dir=panels_dir)
+    
+    print("\n" + "="*90)
+    print("ANÁLISIS COMPLETADO EXITOSAMENTE")
+    print("="*90)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Método de Región de Confianza - análisis")
+    parser.add_argument('--headless', action='store_true', help="no generar gráficas")
+    parser.add_argument('--draft', action='store_true', help="gráficas de borrador (baja resolución)")
+    parser.add_argument('--panels', metavar='DIR', help="guardar cada panel en DIR, en paralelo")
+    args = parser.parse_args()
+    main(args.headless, args.draft, args.panels)
\ No newline at end of file
@@ -0,0 +1,163 @@
+import numpy as np
+from .trustRegion import trust_region
+from results_table import ResultsTable, GLOBAL_MIN, LOCAL_MIN, NOT_CONVERGED
+from utils import REGION_SIZES, is_successful_convergence, get_evaluation_status, format_error, classify_convergence
+
+def run_trust_region_sizes_experiment() -> ResultsTable:
+    # Prueba 1: Diferentes tamaños de región de confianza inicial
+    print("\n" + "="*90)
+    print("PRUEBA 1: DIFERENTES TAMAÑOS DE REGIÓN DE CONFIANZA INICIAL")
+    print("Punto inicial: (1.0, 1.0)")
+    print("="*90)
+    
+    region_sizes = REGION_SIZES
+    results = ResultsTable()
+    
+    print("| {:<20} | {:<12} | {:<16} | {:<16} | {:<30} |".format(
+        "Tamaño Región (Δ)", "Iteraciones", "f(x,y) final", "Error", "Estado (Tipo Convergencia)"))
+    print("|" + "-"*22 + "|" + "-"*14 + "|" + "-"*18 + "|" + "-"*18 + "|" + "-"*32 + "|")
+    
+    for delta in region_sizes:
+        x_opt, y_opt, f_opt, iterations, converged = trust_region(1.0, 1.0, delta)
+        error = f_opt - 0.18
+        
+        successful = is_successful_convergence(f_opt, iterations)
+        estado = get_evaluation_status(iterations, x_opt, y_opt, successful, converged)
+        
+        if not successful:
+            iterations_str = "-"
+            f_opt_str = "-"
+            error_formatted = "-"
+        else:
+            iterations_str = str(iterations)
+            f_opt_str = f"{f_opt:.6f}"
+            error_formatted = format_error(error)
+        
+        # El tipo de convergencia se guarda como código; las ejecuciones no
+        # exitosas cuentan como 'No convergió'
+        results.append(x0=1.0, y0=1.0, x_final=x_opt, y_final=y_opt, param=delta,
+                       iterations=iterations, f_final=f_opt, error=error, distance=np.sqrt(2.0),
+                       successful=successful, converged=converged)
+        
+        print("| {:<20} | {:<12} | {:<16} | {:<16} | {:<30} |".format(
+            f"Δ={delta}", iterations_str, f_opt_str, error_formatted, estado))
+    
+    print("\nCuadro 1: Resultados para diferentes tamaños de región de confianza")
+    
+    # NUEVO: Análisis de tipos de convergencia
+    print("\n" + "="*90)
+    print("ANÁLISIS DE TIPOS DE CONVERGENCIA - PRUEBA 1")
+    print("="*90)
+    
+    counts = results.counts()
+    
+    print(f"Mínimo global: {counts[GLOBAL_MIN]}/{len(results)} casos")
+    if counts[GLOBAL_MIN]:
+        global_convergence = results[results.is_type(GLOBAL_MIN)]
+        best_delta = global_convergence.best()
+        worst_delta = global_convergence.worst()
+        print(f"  • Mejor Δ para global: {best_delta['param']} ({best_delta['iterations']} iteraciones)")
+        print(f"  • Peor Δ para global: {worst_delta['param']} ({worst_delta['iterations']} iteraciones)")
+    
+    print(f"Mínimo local: {counts[LOCAL_MIN]}/{len(results)} casos")
+    if counts[LOCAL_MIN]:
+        local_deltas = results[results.is_type(LOCAL_MIN)]['param'].tolist()
+        print(f"  • Δ que convergen a local: {local_deltas}")
+    
+    print(f"No convergió: {counts[NOT_CONVERGED]}/{len(results)} casos")
+    
+    # Análisis de rango óptimo
+    print("\n" + "="*90)
+    print("ANÁLISIS DE RANGO ÓPTIMO")
+    print("="*90)
+    
+    fast_cases = results[results['successful'] & (results['iterations'] <= 15)]
+    if len(fast_cases):
+        print(f"Rango óptimo de Δ: [{fast_cases['param'].min()}, {fast_cases['param'].max()}]")
+        
+        # Mostrar qué Δ en este rango convergen al mínimo global
+        global_deltas = fast_cases['param'][fast_cases.is_type(GLOBAL_MIN)].tolist()
+        if global_deltas:
+            print(f"Δ que encuentran mínimo global en rango óptimo: {global_deltas}")
+    
+    return results
+
+def run_subproblem_solvers_experiment() -> ResultsTable:
+    # Comparación de resolvedores del subproblema para los mismos Δ de la Prueba 1
+    print("\n" + "="*90)
+    print("COMPARACIÓN DE RESOLVEDORES DEL SUBPROBLEMA")
+    print("Punto inicial: (1.0, 1.0)")
+    print("="*90)
+    
+    region_sizes = REGION_SIZES
+    solvers = ['cauchy', 'dogleg', 'subspace', 'exact']
+    results = ResultsTable(groups=solvers)
+    
+    print("| {:<10} | {:<10} | {:<12} | {:<10} | {:<12} | {:<25} |".format(
+        "Δ", "Método", "Iteraciones", "Eval. f", "Eval. ∇f/∇²f", "Tipo Convergencia"))
+    print("|" + "-"*12 + "|" + "-"*12 + "|" + "-"*14 + "|" + "-"*12 + "|" + "-"*14 + "|" + "-"*27 + "|")
+    
+    for delta in region_sizes:
+        for solver in solvers:
+            stats = {}
+            x_opt, y_opt, f_opt, iterations, converged = trust_region(
+                1.0, 1.0, delta, stats=stats, subproblem=solver)
+            results.append(group=solver, x0=1.0, y0=1.0, x_final=x_opt, y_final=y_opt, param=delta,
+                           iterations=iterations, f_final=f_opt, error=f_opt - 0.18, converged=converged,
+                           successful=is_successful_convergence(f_opt, iterations),
+                           f_evals=stats['f_evals'], grad_evals=stats['grad_evals'])
+            
+            print("| {:<10} | {:<10} | {:<12} | {:<10} | {:<12} | {:<25} |".format(
+                f"Δ={delta}", solver, iterations, stats['f_evals'], stats['grad_evals'],
+                classify_convergence(x_opt, y_opt, converged)))
+    
+    print("\nCuadro 1B: Iteraciones y evaluaciones por resolvedor del subproblema")
+    
+    print("\nPROMEDIOS POR RESOLVEDOR:")
+    converged_runs = results[results['converged']]
+    counts = converged_runs.counts(by='group')
+    avg_iters = converged_runs.mean_by('iterations')
+    avg_f_evals = converged_runs.mean_by('f_evals')
+    for code, solver in enumerate(solvers):
+        if counts[code]:
+            print(f"• {solver}: {avg_iters[code]:.1f} iteraciones, {avg_f_evals[code]:.1f} evaluaciones de f "
+                  f"({counts[code]}/{len(region_sizes)} convergen)")
+    
+    return results
+
+# Función adicional para análisis comparativo entre métodos
+def compare_trust_region_performance(results: ResultsTable):
+    """Analiza el rendimiento del método de región de confianza"""
+    print("\n" + "="*90)
+    print("ANÁLISIS DE RENDIMIENTO - MÉTODO REGIÓN DE CONFIANZA")
+    print("="*90)
+    
+    successful_cases = results[results['successful']]
+    counts = results.counts()
+    
+    if len(successful_cases):
+        iterations = successful_cases['iterations']
+        errors = np.abs(successful_cases['error'])
+        
+        print(f"ESTADÍSTICAS GENERALES:")
+        print(f"• Tasa de éxito: {len(successful_cases)}/{len(results)} ({len(successful_cases)/len(results)*100:.1f}%)")
+        print(f"• Mínimo global: {counts[GLOBAL_MIN]} casos")
+        print(f"• Mínimo local: {counts[LOCAL_MIN]} casos")
+        print(f"• Iteraciones promedio: {np.mean(iterations):.1f} ± {np.std(iterations):.1f}")
+        print(f"• Error promedio: {np.mean(errors):.2e}")
+        
+        # Análisis por tamaño de región
+        print(f"\nANÁLISIS POR TAMAÑO DE REGIÓN:")
+        # Códigos por Δ distinto: las agregaciones por grupo son un solo bincount
+        deltas, delta_codes = np.unique(results['param'], return_inverse=True)
+        size = deltas.size
+        total = np.bincount(delta_codes, minlength=size)
+        success = np.bincount(delta_codes, weights=results['successful'], minlength=size)
+        global_count = np.bincount(delta_codes, weights=results.is_type(GLOBAL_MIN), minlength=size)
+        iter_sum = np.bincount(delta_codes, weights=results['iterations'] * results['successful'],
+                               minlength=size)
+        for k, delta in enumerate(deltas.tolist()):
+            if success[k]:
+                print(f"• Δ={delta}: {int(success[k])}/{total[k]} éxito, {iter_sum[k] / success[k]:.1f} iteraciones promedio, {int(global_count[k])} global")
+            else:
+                print(f"• Δ={delta}: 0/{total[k]} éxito")
\ No newline at end of file
@@ -0,0 +1,160 @@
+import numpy as np
+from .trustRegion import trust_region_cached
+from results_table import ResultsTable, GLOBAL_MIN, LOCAL_MIN, NOT_CONVERGED
+from utils import NEAR_POINTS, FAR_POINTS, is_successful_convergence, get_point_evaluation, format_error
+
+def run_initial_points_experiment() -> ResultsTable:
+    # Prueba 2: Diferentes puntos iniciales
+    print("\n" + "="*90)
+    print("PRUEBA 2: DIFERENTES PUNTOS INICIALES")
+    print("Tamaño de región: Δ = 1.0")
+    print("="*90)
+    
+    # Sección 1: Puntos cercanos al óptimo teórico (0,0)
+    print("\n" + "="*70)
+    print("SECCIÓN 1: PUNTOS CERCANOS AL ÓPTIMO TEÓRICO (0,0)")
+    print("Rango: [-3, 3]²")
+    print("="*70)
+    
+    near_points = NEAR_POINTS
+    
+    # Una sola tabla para ambas secciones; la columna 'group' distingue cercanos y lejanos
+    results = ResultsTable(groups=('near', 'far'))
+    
+    print("| {:<18} | {:<12} | {:<12} | {:<16} | {:<25} |".format(
+        "Punto Inicial", "Distancia", "Iteraciones", "Error", "Evaluación"))
+    print("|" + "-"*20 + "|" + "-"*14 + "|" + "-"*14 + "|" + "-"*18 + "|" + "-"*27 + "|")
+    
+    for point in near_points:
+        x0, y0 = point
+        x_opt, y_opt, f_opt, iterations, converged = trust_region_cached(x0, y0, 1.0)
+        error = f_opt - 0.18
+        distance = np.sqrt(x0**2 + y0**2)
+        
+        successful = is_successful_convergence(f_opt, iterations)
+        evaluation = get_point_evaluation(iterations, successful, x_opt, y_opt, converged)
+        
+        if not successful:
+            iterations_str = "-"
+            error_formatted = "-"
+        else:
+            iterations_str = str(iterations)
+            error_formatted = format_error(error)
+        
+        results.append(group='near', x0=x0, y0=y0, x_final=x_opt, y_final=y_opt, iterations=iterations,
+                       f_final=f_opt, error=error, distance=distance, successful=successful,
+                       converged=converged)
+        
+        point_str = f"({x0:.1f}, {y0:.1f})"
+        print("| {:<18} | {:<12.2f} | {:<12} | {:<16} | {:<25} |".format(
+            point_str, distance, iterations_str, error_formatted, evaluation))
+    
+    print("\nCuadro 2A: Resultados para puntos cercanos (Δ = 1.0)")
+
+    # Sección 2: Puntos lejanos en el rango [-100, 100]²
+    print("\n" + "="*70)
+    print("SECCIÓN 2: PUNTOS LEJANOS AL ÓPTIMO TEÓRICO (0,0)")
+    print("Rango: [-100, 100]²")
+    print("="*70)
+    
+    # 9 puntos lejanos distribuidos en diferentes cuadrantes
+    far_points = FAR_POINTS
+    
+    print("| {:<18} | {:<12} | {:<12} | {:<16} | {:<25} |".format(
+        "Punto Inicial", "Distancia", "Iteraciones", "Error", "Evaluación"))
+    print("|" + "-"*20 + "|" + "-"*14 + "|" + "-"*14 + "|" + "-"*18 + "|" + "-"*27 + "|")
+    
+    for point in far_points:
+        x0, y0 = point
+        x_opt, y_opt, f_opt, iterations, converged = trust_region_cached(x0, y0, 1.0)
+        error = f_opt - 0.18
+        distance = np.sqrt(x0**2 + y0**2)
+        
+        successful = is_successful_convergence(f_opt, iterations)
+        evaluation = get_point_evaluation(iterations, successful, x_opt, y_opt, converged)
+        
+        if not successful:
+            iterations_str = "-"
+            error_formatted = "-"
+        else:
+            iterations_str = str(iterations)
+            error_formatted = format_error(error)
+        
+        results.append(group='far', x0=x0, y0=y0, x_final=x_opt, y_final=y_opt, iterations=iterations,
+                       f_final=f_opt, error=error, distance=distance, successful=successful,
+                       converged=converged)
+        
+        point_str = f"({x0:.1f}, {y0:.1f})"
+        print("| {:<18} | {:<12.2f} | {:<12} | {:<16} | {:<25} |".format(
+            point_str, distance, iterations_str, error_formatted, evaluation))
+    
+    print("\nCuadro 2B: Resultados para puntos lejanos (Δ = 1.0)")
+    
+    # Análisis comparativo entre secciones
+    print("\n" + "="*90)
+    print("ANÁLISIS COMPARATIVO ENTRE SECCIONES - MÉTODO REGIÓN DE CONFIANZA")
+    print("="*90)
+    
+    results_near = results[results.is_group('near')]
+    results_far = results[results.is_group('far')]
+    
+    # Estadísticas puntos cercanos
+    near_iterations = results_near['iterations'][results_near['successful']]
+    near_counts = results_near.counts()
+    
+    # Estadísticas puntos lejanos
+    far_iterations = results_far['iterations'][results_far['successful']]
+    far_counts = results_far.counts()
+    
+    print(f"SECCIÓN 1 - Puntos cercanos:")
+    print(f"  • Convergencia: {near_iterations.size}/{len(results_near)} casos")
+    print(f"  • Mínimo global: {near_counts[GLOBAL_MIN]} casos")
+    print(f"  • Mínimo local: {near_counts[LOCAL_MIN]} casos")
+    if near_iterations.size:
+        print(f"  • Iteraciones promedio: {np.mean(near_iterations):.1f}")
+        print(f"  • Rango de iteraciones: {near_iterations.min()} - {near_iterations.max()}")
+    
+    print(f"\nSECCIÓN 2 - Puntos lejanos:")
+    print(f"  • Convergencia: {far_iterations.size}/{len(results_far)} casos")
+    print(f"  • Mínimo global: {far_counts[GLOBAL_MIN]} casos")
+    print(f"  • Mínimo local: {far_counts[LOCAL_MIN]} casos")
+    if far_iterations.size:
+        print(f"  • Iteraciones promedio: {np.mean(far_iterations):.1f}")
+        print(f"  • Rango de iteraciones: {far_iterations.min()} - {far_iterations.max()}")
+    
+    # Comparación de eficiencia
+    if near_iterations.size and far_iterations.size:
+        efficiency_ratio = np.mean(far_iterations) / np.mean(near_iterations)
+        print(f"\nCOMPARACIÓN:")
+        print(f"  • Los puntos lejanos requieren {efficiency_ratio:.1f}x más iteraciones en promedio")
+        print(f"  • Diferencia absoluta: {np.mean(far_iterations) - np.mean(near_iterations):.1f} iteraciones")
+    
+    # El análisis posterior de la Prueba 2 usa los puntos cercanos
+    return results_near
+
+# Función adicional para análisis específico por tipo de punto
+def analyze_by_distance_category(results: ResultsTable):
+    """Analiza resultados por categoría de distancia para Región de Confianza"""
+    print("\n" + "="*90)
+    print("ANÁLISIS POR CATEGORÍA DE DISTANCIA - REGIÓN DE CONFIANZA")
+    print("="*90)
+    
+    for category_name, category in [("CERCANOS", 'near'), ("LEJANOS", 'far')]:
+        category_results = results[results.is_group(category)]
+        successful = category_results[category_results['successful']]
+        counts = category_results.counts()
+        
+        print(f"\n{category_name}:")
+        print(f"  • Tasa de éxito: {len(successful)}/{len(category_results)} ({len(successful)/len(category_results)*100:.1f}%)")
+        print(f"  • Mínimo global: {counts[GLOBAL_MIN]} casos")
+        print(f"  • Mínimo local: {counts[LOCAL_MIN]} casos")
+        print(f"  • No convergió: {counts[NOT_CONVERGED]} casos")
+        
+        if len(successful):
+            iterations = successful['iterations']
+            distances = successful['distance']
+            errors = np.abs(successful['error'])
+            
+            print(f"  • Iteraciones: {np.mean(iterations):.1f} ± {np.std(iterations):.1f}")
+            print(f"  • Distancia promedio: {np.mean(distances):.1f}")
+            print(f"  • Error promedio: {np.mean(errors):.2e}")
\ No newline at end of file
@@ -0,0 +1,548 @@
+import time
+import numpy as np
+from typing import List, Tuple, Dict, Iterator
+
+from objective import f, value_grad_hess
+from solve_cache import cached_solver
+from trajectory import TrajectoryRecorder
+from instrumentation import SolveResult, SolveStats, timed
+
+def quadratic_model(x: float, y: float, h: np.ndarray, grad: np.ndarray, hess: np.ndarray) -> float:
+    return f(x, y) + grad @ h + 0.5 * h @ hess @ h
+
+def solve_trust_region_subproblem(grad: np.ndarray, hess: np.ndarray, delta: float) -> np.ndarray:
+    g_norm = np.linalg.norm(grad)
+    if g_norm < 1e-12:
+        return np.zeros(2)
+    
+    d = -grad / g_norm
+    gd = grad @ d
+    dHd = d @ hess @ d
+    
+    if dHd <= 0:
+        alpha = delta
+    else:
+        alpha_unconstrained = -gd / dHd
+        alpha = min(alpha_unconstrained, delta)
+    
+    return alpha * d
+
+def eigen_2x2(hess: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    #Descomposición espectral en forma cerrada de un Hessiano simétrico 2x2
+    #Devuelve los autovalores (λ1 <= λ2) y los autovectores como columnas
+    a, b, c = hess[0, 0], 0.5 * (hess[0, 1] + hess[1, 0]), hess[1, 1]
+    mean = 0.5 * (a + c)
+    radius = np.hypot(0.5 * (a - c), b)
+    lam = np.array([mean - radius, mean + radius])
+    
+    if abs(b) < 1e-14 * max(1.0, abs(a), abs(c)):
+        Q = np.eye(2) if a <= c else np.array([[0.0, 1.0], [1.0, 0.0]])
+        return lam, Q
+    
+    # Autovector de λ1 eligiendo la fórmula mejor condicionada
+    if abs(lam[0] - a) >= abs(lam[0] - c):
+        v = np.array([b, lam[0] - a])
+    else:
+        v = np.array([lam[0] - c, b])
+    v /= np.linalg.norm(v)
+    Q = np.array([[v[0], -v[1]], [v[1], v[0]]])
+    return lam, Q
+
+def solve_exact_subproblem(grad: np.ndarray, hess: np.ndarray, delta: float) -> np.ndarray:
+    #Solución exacta (Moré–Sorensen) del subproblema: min g·h + ½h·Hh con ||h|| <= Δ
+    #Con la descomposición espectral 2x2 la ecuación secular ||p(λ)|| = Δ se resuelve
+    #con Newton sin factorizar matrices; se trata también el "caso difícil"
+    lam, Q = eigen_2x2(hess)
+    a = Q.T @ grad
+    
+    # Paso de Newton interior si H es definida positiva y cabe en la región
+    if lam[0] > 0:
+        p = -a / lam
+        if np.linalg.norm(p) <= delta:
+            return Q @ p
+    
+    lam_min = max(0.0, -lam[0])
+    
+    # Caso difícil: g (casi) ortogonal al autovector de λ1
+    if abs(a[0]) <= 1e-12 * max(1.0, np.linalg.norm(grad)):
+        p = np.zeros(2)
+        if lam[1] + lam_min > 0:
+            p[1] = -a[1] / (lam[1] + lam_min)
+        if np.linalg.norm(p) <= delta:
+            p[0] = np.sqrt(max(delta**2 - p[1]**2, 0.0))
+            return Q @ p
+    
+    # Newton sobre 1/Δ - 1/||p(λ)|| empezando a la izquierda de la raíz
+    shift = lam_min + 1e-12 * max(1.0, abs(lam[1]))
+    for _ in range(100):
+        denom = lam + shift
+        p = -a / denom
+        p_norm = np.linalg.norm(p)
+        if abs(p_norm - delta) <= 1e-12 * delta:
+            break
+        q_norm2 = np.sum(a**2 / denom**3)
+        shift += (p_norm**2 / q_norm2) * (p_norm - delta) / delta
+        shift = max(shift, lam_min + 1e-15)
+    
+    return Q @ p
+
+def solve_dogleg_subproblem(grad: np.ndarray, hess: np.ndarray, delta: float) -> np.ndarray:
+    #Método dogleg: combina el paso de Cauchy y el paso de Newton completo
+    #Sólo es válido con H definida positiva; si no, se usa el paso de Cauchy
+    lam, _ = eigen_2x2(hess)
+    if lam[0] <= 0:
+        return solve_trust_region_subproblem(grad, hess, delta)
+    
+    p_newton = -np.linalg.solve(hess, grad)
+    if np.linalg.norm(p_newton) <= delta:
+        return p_newton
+    
+    p_cauchy = -(grad @ grad) / (grad @ hess @ grad) * grad
+    pc_norm = np.linalg.norm(p_cauchy)
+    if pc_norm >= delta:
+        return delta * p_cauchy / pc_norm
+    
+    # τ tal que ||p_c + τ(p_n - p_c)|| = Δ
+    d = p_newton - p_cauchy
+    a_, b_, c_ = d @ d, 2 * (p_cauchy @ d), pc_norm**2 - delta**2
+    tau = (-b_ + np.sqrt(b_**2 - 4 * a_ * c_)) / (2 * a_)
+    return p_cauchy + tau * d
+
+def solve_subspace_subproblem(grad: np.ndarray, hess: np.ndarray, delta: float) -> np.ndarray:
+    #Minimización en el subespacio bidimensional span{g, (H + αI)⁻¹g}
+    #α desplaza H para que sea definida positiva; en 2D el subespacio suele ser
+    #todo el espacio y el resultado coincide con el paso exacto
+    if np.linalg.norm(grad) < 1e-12:
+        return np.zeros(2)
+    
+    lam, _ = eigen_2x2(hess)
+    alpha = 0.0 if lam[0] > 0 else -1.5 * lam[0] + 1e-8
+    v1 = grad / np.linalg.norm(grad)
+    v2 = np.linalg.solve(hess + alpha * np.eye(2), grad)
+    v2 = v2 - (v2 @ v1) * v1
+    
+    if np.linalg.norm(v2) <= 1e-10 * np.linalg.norm(grad):
+        # Subespacio de dimensión 1: minimizar a lo largo de -g
+        return solve_trust_region_subproblem(grad, hess, delta)
+    
+    V = np.column_stack([v1, v2 / np.linalg.norm(v2)])
+    p = solve_exact_subproblem(V.T @ grad, V.T @ hess @ V, delta)
+    return V @ p
+
+# Resolvedores del subproblema disponibles en trust_region(..., subproblem=...)
+SUBPROBLEM_SOLVERS = {
+    'cauchy': solve_trust_region_subproblem,
+    'dogleg': solve_dogleg_subproblem,
+    'subspace': solve_subspace_subproblem,
+    'exact': solve_exact_subproblem
+}
+
+class IterateCache:
+    #Caché del estado del iterado actual: valor, gradiente y Hessiano en (x, y)
+    #más el valor en el último punto de prueba. Un paso rechazado no vuelve a
+    #evaluar nada y un paso aceptado reutiliza f(x+h) como nuevo valor actual
+    #`evaluate` es el núcleo fusionado (se puede envolver para cronometrarlo)
+    def __init__(self, x: float, y: float, evaluate=value_grad_hess):
+        self.evaluate = evaluate
+        self.x, self.y = x, y
+        self.f, self.g, self.H = evaluate(x, y)
+        self.f_trial = None
+        self.counts = {'f': 1, 'grad': 1, 'hess': 1}
+    
+    def trial_value(self, h: np.ndarray) -> float:
+        #Evalúa (una sola vez) f en el punto de prueba x + h
+        self.f_trial = self.evaluate(self.x + h[0], self.y + h[1], need=('f',))[0]
+        self.counts['f'] += 1
+        return self.f_trial
+    
+    def accept(self, h: np.ndarray):
+        #Mueve el iterado a x + h; sólo hacen falta gradiente y Hessiano nuevos
+        self.x += h[0]
+        self.y += h[1]
+        self.f = self.f_trial
+        self.g, self.H = self.evaluate(self.x, self.y, need=('grad', 'hess'))
+        self.counts['grad'] += 1
+        self.counts['hess'] += 1
+
+class TrustRegionState:
+    #Estado ligero que se entrega en cada iteración de iter_trust_region
+    #x, y, f son los del iterado tras decidir el paso; grad_norm es ||∇f|| en el
+    #punto desde el que se resolvió el subproblema; delta es el radio ya
+    #actualizado, rho el cociente de reducción y step_norm la norma del paso
+    __slots__ = ('iteration', 'x', 'y', 'f', 'grad_norm', 'delta', 'rho',
+                 'step_norm', 'accepted', 'converged', 'diverged')
+    
+    def __init__(self, iteration, x, y, f, grad_norm, delta, rho, step_norm,
+                 accepted, converged, diverged):
+        self.iteration = iteration
+        self.x = x
+        self.y = y
+        self.f = f
+        self.grad_norm = grad_norm
+        self.delta = delta
+        self.rho = rho
+        self.step_norm = step_norm
+        self.accepted = accepted
+        self.converged = converged
+        self.diverged = diverged
+
+def iter_trust_region(x0: float, y0: float, delta0: float = 1.0,
+                      eta: float = 0.1, max_iter: int = 1000, tol: float = 1e-6,
+                      stats: Dict = None, subproblem: str = 'cauchy',
+                      timings: Dict = None) -> Iterator[TrustRegionState]:
+    #Método de Región de Confianza como generador: entrega un TrustRegionState
+    #por iteración y termina al converger, al divergir o tras max_iter
+    #iteraciones. `subproblem` elige el resolvedor del subproblema ('cauchy',
+    #'dogleg', 'subspace' o 'exact'). Si se pasa un diccionario `stats`, al
+    #terminar (o al cerrarse el generador) se llena con los contadores de
+    #evaluaciones (f, grad, hess) y de pasos aceptados/rechazados. Si se pasa un
+    #diccionario `timings`, se acumula en timings['objective'] y
+    #timings['subproblem'] el tiempo de cada fase
+    if subproblem not in SUBPROBLEM_SOLVERS:
+        raise ValueError(f"Resolvedor de subproblema desconocido: {subproblem!r}")
+    solve_subproblem = SUBPROBLEM_SOLVERS[subproblem]
+    evaluate = value_grad_hess
+    if timings is not None:
+        solve_subproblem = timed(solve_subproblem, timings, 'subproblem')
+        evaluate = timed(evaluate, timings, 'objective')
+    
+    delta = delta0
+    state = IterateCache(x0, y0, evaluate)
+    accepted = 0
+    iterations = 0
+    
+    eta1 = 0.25
+    eta2 = 0.75
+    
+    try:
+        for i in range(max_iter):
+            g, H = state.g, state.H
+            h = solve_subproblem(g, H, delta)
+            
+            actual_reduction = state.f - state.trial_value(h)
+            predicted_reduction = - (g @ h + 0.5 * h @ H @ h)
+            
+            if predicted_reduction == 0:
+                rho = 0
+            else:
+                rho = actual_reduction / predicted_reduction
+            
+            h_norm = np.linalg.norm(h)
+            if rho < eta1:
+                delta = 0.5 * delta
+            elif rho > eta2 and abs(h_norm - delta) < 1e-10:
+                delta = 2.0 * delta
+            
+            # Paso rechazado: el estado en caché sigue siendo válido
+            step_accepted = rho > eta
+            if step_accepted:
+                state.accept(h)
+                accepted += 1
+            iterations = i + 1
+            
+            g_norm = np.linalg.norm(g)
+            converged = g_norm < tol or h_norm < tol
+            diverged = not converged and (abs(state.x) > 1e10 or abs(state.y) > 1e10
+                                          or np.isnan(state.f) or state.f > 1e10)
+            
+            yield TrustRegionState(iterations, state.x, state.y, state.f, g_norm, delta, rho,
+                                   h_norm, step_accepted, converged, diverged)
+            if converged or diverged:
+                return
+    finally:
+        if stats is not None:
+            stats.update({
+                'f_evals': state.counts['f'],
+                'grad_evals': state.counts['grad'],
+                'hess_evals': state.counts['hess'],
+                'accepted': accepted,
+                'rejected': iterations - accepted
+            })
+
+def trust_region(x0: float, y0: float, delta0: float = 1.0, 
+                eta: float = 0.1, max_iter: int = 1000, tol: float = 1e-6,
+                stats: Dict = None, subproblem: str = 'cauchy', record: bool = False,
+                instrument: bool = False) -> tuple:
+    #Método de Región de Confianza: consume iter_trust_region hasta el final y
+    #devuelve el último estado (ver allí `subproblem` y `stats`). Con record=True
+    #devuelve un sexto elemento con la trayectoria por iteración: x, y, f,
+    #||∇f||, Δ, ρ y norma del paso. Con instrument=True devuelve un SolveResult
+    #(ver instrumentation) con evaluaciones, pasos aceptados/rechazados y el
+    #tiempo en el objetivo, en el subproblema y en total
+    if record:
+        recorder = TrajectoryRecorder(('x', 'y', 'f', 'grad_norm', 'delta', 'rho', 'step_norm'))
+    timings = None
+    if instrument:
+        stats = {} if stats is None else stats
+        timings = {}
+        start = time.perf_counter()
+    
+    for state in iter_trust_region(x0, y0, delta0, eta, max_iter, tol, stats, subproblem, timings):
+        if record:
+            recorder.append(state.x, state.y, state.f, state.grad_norm, state.delta, state.rho,
+                            state.step_norm)
+    
+    result = (state.x, state.y, state.f, state.iteration, state.converged)
+    if record:
+        result += (recorder.history(),)
+    if instrument:
+        solve_stats = SolveStats(solves=1, converged=int(state.converged), iterations=state.iteration,
+                                 f_evals=stats['f_evals'], grad_evals=stats['grad_evals'],
+                                 hess_evals=stats['hess_evals'], accepted=stats['accepted'],
+                                 rejected=stats['rejected'], objective_time=timings['objective'],
+                                 subproblem_time=timings['subproblem'],
+                                 total_time=time.perf_counter() - start)
+        return SolveResult(result, solve_stats)
+    return result
+
+# trust_region con memoización de resultados (ver solve_cache)
+trust_region_cached = cached_solver('trust_region', trust_region)
+
+def solve_cauchy_subproblem_nd(objective, x: np.ndarray, grad: np.ndarray,
+                               delta: float) -> Tuple[np.ndarray, np.ndarray, int]:
+    #Paso de Cauchy en dimensión n usando un único producto Hessiano-vector
+    #Devuelve el paso h, H·h (para el modelo cuadrático sin volver a multiplicar)
+    #y el número de productos H·v realizados
+    g_norm = np.linalg.norm(grad)
+    if g_norm < 1e-12:
+        return np.zeros_like(grad), np.zeros_like(grad), 0
+    
+    d = -grad / g_norm
+    Hd = objective.hessvec(x, d)
+    dHd = d @ Hd
+    
+    if dHd <= 0:
+        alpha = delta
+    else:
+        alpha = min(g_norm / dHd, delta)
+    
+    return alpha * d, alpha * Hd, 1
+
+def _to_boundary(h: np.ndarray, p: np.ndarray, delta: float) -> float:
+    #τ >= 0 tal que ||h + τp|| = Δ
+    pp, hp, hh = p @ p, h @ p, h @ h
+    return (-hp + np.sqrt(hp**2 + pp * (delta**2 - hh))) / pp
+
+def solve_steihaug_cg_subproblem_nd(objective, x: np.ndarray, grad: np.ndarray, delta: float,
+                                    max_cg_iter: int = None) -> Tuple[np.ndarray, np.ndarray, int]:
+    #Gradiente conjugado truncado de Steihaug: aplica CG al sistema Hh = -g y se
+    #detiene al salir de la región (paso recortado a la frontera), al encontrar
+    #curvatura negativa (se sigue esa dirección hasta la frontera) o cuando el
+    #residuo cae por debajo de min(0.5, √||g||)·||g|| (convergencia superlineal)
+    #Sólo necesita productos H·v; H·h se acumula a la vez que h
+    g_norm = np.linalg.norm(grad)
+    h = np.zeros_like(grad)
+    Hh = np.zeros_like(grad)
+    if g_norm < 1e-12:
+        return h, Hh, 0
+    
+    if max_cg_iter is None:
+        max_cg_iter = grad.size
+    eps = min(0.5, np.sqrt(g_norm)) * g_norm
+    r = grad.copy()
+    p = -r
+    rr = r @ r
+    products = 0
+    
+    for _ in range(max_cg_iter):
+        Hp = objective.hessvec(x, p)
+        products += 1
+        pHp = p @ Hp
+        
+        if pHp <= 0:
+            tau = _to_boundary(h, p, delta)
+            return h + tau * p, Hh + tau * Hp, products
+        
+        alpha = rr / pHp
+        h_next = h + alpha * p
+        if np.linalg.norm(h_next) >= delta:
+            tau = _to_boundary(h, p, delta)
+            return h + tau * p, Hh + tau * Hp, products
+        
+        h = h_next
+        Hh = Hh + alpha * Hp
+        r = r + alpha * Hp
+        rr_next = r @ r
+        if np.sqrt(rr_next) < eps:
+            break
+        
+        p = -r + (rr_next / rr) * p
+        rr = rr_next
+    
+    return h, Hh, products
+
+# Resolvedores del subproblema para trust_region_nd: sólo usan productos H·v
+ND_SUBPROBLEM_SOLVERS = {
+    'cauchy': solve_cauchy_subproblem_nd,
+    'cg': solve_steihaug_cg_subproblem_nd
+}
+
+def trust_region_nd(objective, x0: np.ndarray, delta0: float = 1.0, eta: float = 0.1,
+                    max_iter: int = 1000, tol: float = 1e-6, stats: Dict = None,
+                    subproblem: str = 'cauchy') -> Tuple[np.ndarray, float, int, bool]:
+    #Método de Región de Confianza sobre un vector de estado de dimensión n
+    #`objective` debe ofrecer value(x), value_grad(x) y hessvec(x, v); nunca se
+    #forma el Hessiano n×n, así que la memoria por iteración es O(n)
+    #`subproblem` es 'cauchy' (un producto H·v) o 'cg' (Newton-CG de Steihaug);
+    #para H·v por diferencias de gradientes, envolver el objetivo con
+    #FiniteDifferenceHessvec
+    #Como trust_region, un paso rechazado no reevalúa nada y uno aceptado
+    #reutiliza f(x+h) y sólo calcula el gradiente nuevo
+    if subproblem not in ND_SUBPROBLEM_SOLVERS:
+        raise ValueError(f"Resolvedor de subproblema desconocido: {subproblem!r}")
+    solve_subproblem = ND_SUBPROBLEM_SOLVERS[subproblem]
+    
+    x = np.array(x0, dtype=float)
+    delta = delta0
+    converged = False
+    f_x, g = objective.value_grad(x)
+    counts = {'f': 1, 'grad': 1, 'hessvec': 0}
+    # Gradientes que evalúa el propio hessvec (p. ej. con FiniteDifferenceHessvec)
+    hessvec_grads = getattr(objective, 'hessvec_grad_evals', 0)
+    accepted = 0
+    
+    eta1 = 0.25
+    eta2 = 0.75
+    
+    for i in range(max_iter):
+        h, Hh, products = solve_subproblem(objective, x, g, delta)
+        counts['hessvec'] += products
+        h_norm = np.linalg.norm(h)
+        
+        f_trial = objective.value(x + h)
+        counts['f'] += 1
+        actual_reduction = f_x - f_trial
+        predicted_reduction = - (g @ h + 0.5 * h @ Hh)
+        
+        if predicted_reduction == 0:
+            rho = 0
+        else:
+            rho = actual_reduction / predicted_reduction
+        
+        if rho < eta1:
+            delta = 0.5 * delta
+        elif rho > eta2 and abs(h_norm - delta) < 1e-10:
+            delta = 2.0 * delta
+        
+        g_norm = np.linalg.norm(g)
+        if rho > eta:
+            x = x + h
+            f_x = f_trial
+            _, g = objective.value_grad(x)
+            counts['grad'] += 1
+            accepted += 1
+        
+        if g_norm < tol or h_norm < tol:
+            converged = True
+            break
+        
+        if (np.max(np.abs(x)) > 1e10 or np.isnan(f_x) or f_x > 1e10):
+            break
+    
+    counts['grad'] += getattr(objective, 'hessvec_grad_evals', 0) - hessvec_grads
+    if stats is not None:
+        stats.update({
+            'f_evals': counts['f'],
+            'grad_evals': counts['grad'],
+            'hessvec_evals': counts['hessvec'],
+            'accepted': accepted,
+            'rejected': i + 1 - accepted
+        })
+    
+    return x, f_x, i + 1, converged
+
+def solve_trust_region_subproblem_batch(gx: np.ndarray, gy: np.ndarray, H: np.ndarray,
+                                        delta: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    #Versión vectorizada de solve_trust_region_subproblem: resuelve en forma cerrada
+    #el subproblema 2x2 de cada punto (paso de Cauchy a lo largo de -grad)
+    g_norm = np.sqrt(gx * gx + gy * gy)
+    safe_norm = np.where(g_norm < 1e-12, 1.0, g_norm)
+    dx = -gx / safe_norm
+    dy = -gy / safe_norm
+    
+    gd = gx * dx + gy * dy
+    dHd = (dx * H[0, 0] + dy * H[1, 0]) * dx + (dx * H[0, 1] + dy * H[1, 1]) * dy
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        alpha = np.where(dHd <= 0, delta, np.minimum(-gd / dHd, delta))
+    alpha = np.where(g_norm < 1e-12, 0.0, alpha)
+    
+    return alpha * dx, alpha * dy
+
+def trust_region_batch(X0: np.ndarray, Y0: np.ndarray, delta0: float = 1.0,
+                       eta: float = 0.1, max_iter: int = 1000, tol: float = 1e-6
+                       ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    #Versión vectorizada de trust_region sobre muchos puntos iniciales
+    #Cada punto lleva su propio iterado, radio Δ y decisión de aceptar/rechazar;
+    #los puntos se congelan en cuanto convergen o divergen
+    #Con puntos iniciales escalares el resultado también es escalar
+    X0, Y0 = np.broadcast_arrays(np.asarray(X0, dtype=float), np.asarray(Y0, dtype=float))
+    shape = X0.shape
+    x = X0.ravel().copy()
+    y = Y0.ravel().copy()
+    delta = np.full(x.size, float(delta0))
+    
+    iterations = np.full(x.size, max_iter, dtype=int)
+    converged = np.zeros(x.size, dtype=bool)
+    active = np.arange(x.size)
+    
+    # Caché por punto del estado del iterado (valor, gradiente y Hessiano de los
+    # puntos activos); sólo se reevalúa en los puntos cuyo paso fue aceptado
+    f_val, (gx, gy), H = value_grad_hess(x, y)
+    f_x = f_val.copy()
+    
+    eta1 = 0.25
+    eta2 = 0.75
+    
+    for i in range(max_iter):
+        if active.size == 0:
+            break
+        
+        xa, ya, da = x[active], y[active], delta[active]
+        hx, hy = solve_trust_region_subproblem_batch(gx, gy, H, da)
+        
+        f_trial = f(xa + hx, ya + hy)
+        actual_reduction = f_x - f_trial
+        hHh = (hx * H[0, 0] + hy * H[1, 0]) * hx + (hx * H[0, 1] + hy * H[1, 1]) * hy
+        predicted_reduction = -(gx * hx + gy * hy + 0.5 * hHh)
+        
+        rho = np.divide(actual_reduction, predicted_reduction,
+                        out=np.zeros_like(actual_reduction), where=predicted_reduction != 0)
+        
+        h_norm = np.sqrt(hx * hx + hy * hy)
+        shrink = rho < eta1
+        expand = ~shrink & (rho > eta2) & (np.abs(h_norm - da) < 1e-10)
+        da = np.where(shrink, 0.5 * da, np.where(expand, 2.0 * da, da))
+        
+        accept = rho > eta
+        xa = np.where(accept, xa + hx, xa)
+        ya = np.where(accept, ya + hy, ya)
+        f_x = np.where(accept, f_trial, f_x)
+        x[active], y[active], delta[active], f_val[active] = xa, ya, da, f_x
+        
+        # Máscaras por punto: convergencia y verdadera divergencia
+        done = (np.sqrt(gx * gx + gy * gy) < tol) | (h_norm < tol)
+        diverged = ~done & ((np.abs(xa) > 1e10) | (np.abs(ya) > 1e10) |
+                            np.isnan(f_x) | (f_x > 1e10))
+        stop = done | diverged
+        
+        converged[active[done]] = True
+        iterations[active[stop]] = i + 1
+        active = active[~stop]
+        
+        # Actualizar la caché: descartar puntos detenidos y reevaluar gradiente y
+        # Hessiano sólo donde el iterado se movió
+        keep = ~stop
+        moved = accept[keep]
+        xa, ya, f_x = xa[keep], ya[keep], f_x[keep]
+        gx, gy, H = gx[keep], gy[keep], H[:, :, keep]
+        if moved.any():
+            g_new, H_new = value_grad_hess(xa[moved], ya[moved], need=('grad', 'hess'))
+            gx[moved], gy[moved] = g_new[0], g_new[1]
+            H[:, :, moved] = H_new
+    
+    result = (x.reshape(shape), y.reshape(shape), f_val.reshape(shape),
+              iterations.reshape(shape), converged.reshape(shape))
+    if shape == ():
+        return tuple(r[()] for r in result)
+    return result
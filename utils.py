@@ -0,0 +1,93 @@
+import numpy as np
+from typing import List, Dict
+
+from results_table import CONVERGENCE_TYPES, convergence_codes
+
+# Parámetros y puntos iniciales de las Pruebas 1 y 2 de ambos métodos
+STEP_SIZES = [0.01, 0.05, 0.1, 0.15, 0.2, 0.3, 0.5]
+REGION_SIZES = [0.1, 0.3, 0.5, 1.0, 1.5, 2.0, 3.0]
+
+# Puntos cercanos al óptimo teórico (0,0), en [-3, 3]²
+NEAR_POINTS = [
+    (1.0, 1.0), (2.0, 2.0), (-1.0, 1.0), 
+    (0.5, -0.5), (3.0, -2.0), (-2.0, -2.0),
+    (1.5, -1.5), (-1.5, 2.0), (2.5, 0.5)
+]
+
+# 9 puntos lejanos distribuidos en diferentes cuadrantes de [-100, 100]²
+FAR_POINTS = [
+    (50.0, 50.0),      # Cuadrante I
+    (-50.0, 50.0),     # Cuadrante II
+    (-50.0, -50.0),    # Cuadrante III
+    (50.0, -50.0),     # Cuadrante IV
+    (80.0, 20.0),      # Punto extremo en X
+    (-20.0, 80.0),     # Punto extremo en Y
+    (100.0, 0.0),      # Sobre eje X positivo
+    (0.0, -100.0),     # Sobre eje Y negativo
+    (-75.0, -75.0)     # Cuadrante III extremo
+]
+
+def format_error(error: float) -> str:
+    #Formatea el error en notación científica como en el documento
+    if abs(error) < 1e-10:
+        return "0,0×10^{0}"
+    else:
+        exp = int(np.floor(np.log10(abs(error))))
+        coeff = error / (10 ** exp)
+        coeff_str = f"{abs(coeff):.1f}".replace('.', ',')
+        sign = "" if error >= 0 else "-"
+        return f"{sign}{coeff_str}×10^{{{exp}}}"
+
+def is_successful_convergence(f_final: float, iterations: int, max_iter: int = 1000) -> bool:
+    #Determina si la convergencia fue exitosa basada en el resultado final
+    #Acepta también arreglos (p. ej. las columnas de un resolvedor vectorizado)
+    return np.logical_or(np.abs(f_final - 0.18) < 0.01, np.less(iterations, max_iter))
+
+def classify_convergence(x_final: float, y_final: float, converged: bool, tol: float = 1e-3) -> str:
+    #Clasifica el tipo de convergencia según el punto estacionario del catálogo
+    #más cercano al punto final (ver stationary_points):
+    #- Mínimo global: terminó en (0,0)
+    #- Mínimo local: terminó en otro mínimo
+    #- Silla o máximo: terminó en un punto estacionario que no es mínimo
+    #- No convergió: no alcanzó criterio de convergencia o no está en ningún punto estacionario
+    return CONVERGENCE_TYPES[int(convergence_codes(x_final, y_final, converged, tol=tol))]
+
+def get_evaluation_status(iterations: int, x_final: float, y_final: float, successful: bool,
+                          converged: bool) -> str:
+    #Determina el estado de evaluación basado en resultados reales
+    if not successful:
+        return "Divergencia"
+    
+    convergence_type = classify_convergence(x_final, y_final, converged)
+    
+    if iterations <= 10:
+        return f"Muy rápido ({convergence_type})"
+    elif iterations <= 20:
+        return f"Excelente ({convergence_type})"
+    elif iterations <= 30:
+        return f"Óptimo ({convergence_type})"
+    elif iterations <= 50:
+        return f"Bueno ({convergence_type})"
+    elif iterations <= 100:
+        return f"Convergencia lenta ({convergence_type})"
+    else:
+        return f"Lento, inestable ({convergence_type})"
+
+def get_point_evaluation(iterations: int, successful: bool, x_final: float, y_final: float,
+                         converged: bool) -> str:
+    #Determina la evaluación para puntos iniciales
+    if not successful:
+        return "Divergencia"
+    
+    convergence_type = classify_convergence(x_final, y_final, converged)
+    
+    if iterations <= 12:
+        return f"Muy rápido ({convergence_type})"
+    elif iterations <= 18:
+        return f"Excelente ({convergence_type})"
+    elif iterations <= 25:
+        return f"Óptimo ({convergence_type})"
+    elif iterations <= 35:
+        return f"Bueno ({convergence_type})"
+    else:
+        return f"Aceptable ({convergence_type})"
\ No newline at end of file